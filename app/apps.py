@@ -1,6 +1,30 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def ensure_search_index(sender, using, **kwargs):
+    """Recrée si besoin l'index plein texte des films (et ses triggers SQLite) après les migrations."""
+
+    from django.db import connections
+
+    from .search import install_search_index, is_supported
+
+    connection = connections[using]
+    if is_supported(connection) and "app_movie" in connection.introspection.table_names():
+        install_search_index(connection)
 
 
 class AppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app'
+
+    def ready(self):
+        post_migrate.connect(ensure_search_index, sender=self)
+
+        from django.conf import settings
+
+        if settings.IMDB_WARM_UP:
+            from .container import resolve
+            from .services import IMDbService
+
+            resolve(IMDbService).warm_up()
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from rest_framework import status
+
+from .container import resolve
+from .resilience import CircuitOpenError, UpstreamTimeout
+from .serializers import MovieSearchRequestSerializer
+from .services import IMDbService, call_with_db_cleanup
+from .views import add_imdb_movie, upstream_error
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_imdb_executor() -> ThreadPoolExecutor:
+    """
+    Retourne le pool de threads borné dédié aux appels bloquants vers IMDb.
+
+    Sa taille (`IMDB_ASYNC_WORKERS`) borne le nombre de requêtes IMDb simultanées d'un worker
+    ASGI, indépendamment du nombre de requêtes HTTP en attente sur la boucle d'événements.
+
+    Returns:
+        ThreadPoolExecutor: Pool partagé par le processus.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.IMDB_ASYNC_WORKERS, thread_name_prefix="imdb"
+                )
+    return _executor
+
+
+async def run_in_imdb_executor(func, *args, **kwargs):
+    """Exécute un appel bloquant vers IMDb dans le pool dédié sans bloquer la boucle d'événements.
+
+    L'appel s'exécute dans une copie du contexte courant : les mesures de la requête en cours
+    (voir `app.instrumentation`) lui restent accessibles.
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_imdb_executor(),
+        partial(copy_context().run, call_with_db_cleanup, False, func, *args, **kwargs),
+    )
+
+
+def call_in_imdb_executor(func, *args, **kwargs):
+    """
+    Exécute un appel bloquant vers IMDb dans le pool dédié, depuis un thread synchrone.
+
+    Le thread appelant attend le résultat, mais le nombre d'appels IMDb simultanés reste borné
+    par le pool (voir `run_in_imdb_executor`).
+    """
+
+    future = get_imdb_executor().submit(
+        copy_context().run, call_with_db_cleanup, False, func, *args, **kwargs
+    )
+    return future.result()
+
+
+def _json_response(data, status_code, headers=None):
+    return JsonResponse(
+        data,
+        status=status_code,
+        headers=headers,
+        safe=False,
+        json_dumps_params={"ensure_ascii": False},
+    )
+
+
+def _upstream_error_response(error):
+    """Disjoncteur ouvert (503, avec `Retry-After`) ou délai dépassé (504)."""
+
+    status_code, data, headers = upstream_error(error)
+    return _json_response(data, status_code, headers)
+
+
+@require_GET
+async def search_movies(request):
+    """Recherche asynchrone de films sur IMDb en fonction d'un titre."""
+
+    serializer = MovieSearchRequestSerializer(data=request.GET)
+    if not serializer.is_valid():
+        logging.warning("Les paramètres de recherche ne sont pas valides.")
+        return _json_response(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+    title = serializer.validated_data["title"]
+    logging.info(f"Recherche du film {title}")
+    try:
+        imdb_service = resolve(IMDbService)
+        results = await run_in_imdb_executor(imdb_service.search_movie, title)
+        return _json_response(results, status.HTTP_200_OK)
+    except (CircuitOpenError, UpstreamTimeout) as e:
+        return _upstream_error_response(e)
+    except Exception as e:
+        logging.exception(
+            f"Une erreur est survenue lors de la recherche du film {title}: {e}"
+        )
+        return _json_response(
+            {"detail": "Une erreur est survenue"},
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@csrf_exempt
+@require_POST
+async def add_movie(request):
+    """
+    Ajout asynchrone d'un film au catalogue via un identifiant IMDb.
+
+    Le flux est celui de la vue synchrone (`add_imdb_movie`), exécuté hors de la boucle
+    d'événements ; la récupération des détails passe par le pool borné des appels IMDb.
+    """
+
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return _json_response(
+                {"detail": "Le corps de la requête n'est pas un JSON valide."},
+                status.HTTP_400_BAD_REQUEST,
+            )
+    else:
+        data = request.POST
+
+    imdb_service = resolve(IMDbService)
+    fetch_details = partial(call_in_imdb_executor, imdb_service.get_movie_details)
+    status_code, data, headers = await sync_to_async(add_imdb_movie)(
+        data, request, fetch_details
+    )
+    return _json_response(data, status_code, headers)
@@ -0,0 +1,364 @@
+import copy
+import itertools
+import json
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from django.db import connection, connections
+from django.test import override_settings
+
+from .imdb_datasets import write_rows
+from .models import Category, Credit, Movie, Person
+
+SYLLABLES = [
+    "ka", "lo", "mi", "ne", "ru", "sa", "to", "vi", "be", "da",
+    "fi", "go", "ha", "je", "ku", "li", "mo", "nu", "pe", "ri",
+]  # fmt: skip
+
+
+def build_vocabulary(size: int = 5000, seed: int = 0) -> List[str]:
+    """
+    Construit un vocabulaire synthétique de mots distincts.
+
+    Args:
+        size (int): Nombre de mots.
+        seed (int): Graine du générateur aléatoire.
+
+    Returns:
+        List[str]: Mots du vocabulaire.
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+class CatalogueGenerator:
+    """Générateur de films synthétiques au vocabulaire réaliste (fréquences de mots de Zipf)."""
+
+    def __init__(self, seed: int = 0, vocabulary_size: int = 5000):
+        self.rng = random.Random(seed)
+        self.vocabulary = build_vocabulary(vocabulary_size, seed)
+        # Poids de Zipf : quelques mots très fréquents, une longue traîne de mots rares
+        self.weights = [1 / (rank + 1) for rank in range(len(self.vocabulary))]
+
+    def words(self, count: int) -> List[str]:
+        return self.rng.choices(self.vocabulary, weights=self.weights, k=count)
+
+    def movie(self, index: int) -> Movie:
+        return Movie(
+            imdb_id=f"tt{index:08d}",
+            title=" ".join(self.words(self.rng.randint(1, 4))).title(),
+            summary=" ".join(self.words(self.rng.randint(20, 60))).capitalize() + ".",
+            duration_minutes=self.rng.randint(70, 200),
+            poster_url=f"http://example.com/posters/{index}.jpg",
+        )
+
+
+def seed_catalogue(
+    movies: int,
+    categories: int = 20,
+    categories_per_movie: int = 3,
+    cast_per_movie: int = 0,
+    people: int = 0,
+    batch_size: int = 5000,
+    seed: int = 0,
+    start: int = 0,
+) -> CatalogueGenerator:
+    """
+    Remplit la base avec un catalogue synthétique, par insertions en lot.
+
+    Avec `cast_per_movie`, chaque film reçoit aussi un casting (1 à 2 réalisateurs, 1 à 3
+    producteurs et 1 à `cast_per_movie` acteurs) tiré d'un vivier de personnes selon une loi de
+    Zipf : quelques personnes apparaissent dans beaucoup de films, la plupart dans très peu.
+
+    Args:
+        movies (int): Nombre de films à créer.
+        categories (int): Nombre de catégories distinctes.
+        categories_per_movie (int): Nombre maximum de catégories par film.
+        cast_per_movie (int): Nombre maximum d'acteurs par film (0 : aucun casting).
+        people (int): Taille du vivier d'acteurs (par défaut, un cinquième du nombre de films).
+        batch_size (int): Taille des lots d'insertion.
+        seed (int): Graine du générateur aléatoire.
+        start (int): Indice du premier film créé, pour agrandir un catalogue existant.
+
+    Returns:
+        CatalogueGenerator: Générateur utilisé (pour en réutiliser le vocabulaire).
+    """
+    generator = CatalogueGenerator(seed)
+    if start:
+        # Même vocabulaire, mais une suite de tirages propre à cette extension du catalogue
+        generator.rng.seed(f"{seed}:{start}")
+    Category.objects.bulk_create(
+        [Category(name=f"Catégorie {i}") for i in range(categories)],
+        ignore_conflicts=True,
+    )
+    category_ids = list(
+        Category.objects.filter(
+            name__in=[f"Catégorie {i}" for i in range(categories)]
+        ).values_list("id", flat=True)
+    )
+    pools = (
+        seed_people(people or max(100, (start + movies) // 5), cast_per_movie)
+        if cast_per_movie
+        else {}
+    )
+
+    for batch_start in range(start, start + movies, batch_size):
+        created = Movie.objects.bulk_create(
+            [
+                generator.movie(index)
+                for index in range(
+                    batch_start, min(batch_start + batch_size, start + movies)
+                )
+            ]
+        )
+        if categories_per_movie and category_ids:
+            write_rows(
+                Movie.categories.through,
+                ["movie", "category"],
+                [
+                    (movie.id, category_id)
+                    for movie in created
+                    for category_id in generator.rng.sample(
+                        category_ids,
+                        generator.rng.randint(
+                            1, min(categories_per_movie, len(category_ids))
+                        ),
+                    )
+                ],
+            )
+        for role, (pool, max_count) in pools.items():
+            write_rows(
+                Credit,
+                ["movie", "person", "role", "billing_order"],
+                [
+                    (movie.id, person_id, role, billing_order)
+                    for movie in created
+                    for billing_order, person_id in enumerate(
+                        pool.sample(generator.rng, generator.rng.randint(1, max_count))
+                    )
+                ],
+            )
+    return generator
+
+
+class _ZipfPool:
+    """Vivier d'identifiants tirés selon une loi de Zipf, sans doublon au sein d'un tirage."""
+
+    def __init__(self, ids: List[int]):
+        self.ids = ids
+        self.cum_weights = list(
+            itertools.accumulate(1 / (rank + 1) for rank in range(len(ids)))
+        )
+
+    def sample(self, rng: random.Random, count: int) -> set:
+        return set(rng.choices(self.ids, cum_weights=self.cum_weights, k=count))
+
+
+def seed_people(actors: int, cast_per_movie: int) -> Dict[str, tuple]:
+    """
+    Crée le vivier de personnes du catalogue synthétique (s'il n'existe pas déjà).
+
+    Les viviers de réalisateurs et de producteurs sont pris dans celui des acteurs : comme dans un
+    vrai catalogue, certaines personnes sont créditées pour plusieurs rôles.
+
+    Args:
+        actors (int): Nombre de personnes ; les viviers de réalisateurs et de producteurs en
+            représentent respectivement un dixième et un cinquième.
+        cast_per_movie (int): Nombre maximum d'acteurs par film.
+
+    Returns:
+        Dict[str, tuple]: Pour chaque rôle de `Credit`, le vivier et le nombre maximum de
+        personnes par film.
+    """
+    write_rows(
+        Person,
+        ["imdb_id", "name"],
+        [(f"nm{i:08d}", f"Personne {i}") for i in range(actors)],
+    )
+    ids = list(
+        Person.objects.filter(imdb_id__startswith="nm0")
+        .order_by("imdb_id")
+        .values_list("id", flat=True)[:actors]
+    )
+    return {
+        Credit.DIRECTOR: (_ZipfPool(ids[::10]), 2),
+        Credit.PRODUCER: (_ZipfPool(ids[1::5]), 3),
+        Credit.ACTOR: (_ZipfPool(ids), cast_per_movie),
+    }
+
+
+def imdb_dataset(count: int, seed: int = 0, cast_size: int = 10) -> List[Dict]:
+    """
+    Construit un jeu de données IMDb synthétique pour `LocalProvider` : films absents du
+    catalogue (identifiants `tt8...`), dont les détails reprennent des personnes du catalogue
+    et en ajoutent une nouvelle, comme le ferait un vrai film.
+
+    Args:
+        count (int): Nombre de films.
+        seed (int): Graine du générateur aléatoire.
+        cast_size (int): Nombre maximum d'acteurs par film.
+
+    Returns:
+        List[Dict]: Détails des films, au format de `IMDbService.get_movie_details`.
+    """
+    generator = CatalogueGenerator(seed)
+    rng = generator.rng
+
+    def people(prefix: str, role: int, count: int, n: int) -> List[Dict]:
+        existing = {rng.randrange(100) for _ in range(count)}
+        return [
+            {"name": f"Personne {i}", "imdb_id": f"nm{i:08d}"} for i in existing
+        ] + [{"name": f"{prefix} nouveau {n}", "imdb_id": f"nm9{role}{n:07d}"}]
+
+    dataset = []
+    for n in range(count):
+        movie = generator.movie(n)
+        dataset.append(
+            {
+                "imdb_id": f"tt8{n:07d}",
+                "title": movie.title,
+                "duration": movie.duration_minutes,
+                "summary": movie.summary,
+                "poster_url": movie.poster_url,
+                "directors": people("Director", 1, 1, n),
+                "producers": people("Producer", 2, 2, n),
+                "actors": people("Actor", 3, cast_size, n),
+                "categories": [{"name": f"Catégorie {rng.randrange(20)}"}],
+            }
+        )
+    return dataset
+
+
+@contextmanager
+def throwaway_database(keepdb: bool = False):
+    """
+    Crée une base de test dédiée au benchmark, détruite à la sortie (sauf `keepdb`).
+
+    La base de développement n'est jamais modifiée.
+    """
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False, keepdb=keepdb
+    )
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+
+
+@contextmanager
+def database_profile(profile: Dict, alias: str = "default"):
+    """
+    Applique un profil de `DATABASE_PROFILES` aux connexions ouvertes ensuite sur `alias`, puis
+    restaure la configuration d'origine.
+
+    Args:
+        profile (Dict): Réglages de connexion (`CONN_MAX_AGE`, `CONN_HEALTH_CHECKS`, `OPTIONS`).
+        alias (str): Alias de la base.
+    """
+    settings_dict = connections.settings[alias]
+    keys = ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS", "OPTIONS")
+    saved = {key: copy.deepcopy(settings_dict[key]) for key in keys}
+    connections[alias].close()
+    settings_dict.update(
+        {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False, "OPTIONS": {}}
+    )
+    settings_dict.update(copy.deepcopy(profile))
+    try:
+        yield
+    finally:
+        connections[alias].close()
+        settings_dict.update(saved)
+
+
+def add_output_argument(parser) -> None:
+    """Ajoute l'option `--output` (fichier du rapport JSON) à une commande de benchmark."""
+
+    parser.add_argument(
+        "--output", help="Fichier où écrire le résultat (sortie standard sinon)."
+    )
+
+
+def bench_settings():
+    """Réglages des mesures : requêtes servies pour `localhost`, hors mode DEBUG."""
+
+    # Le mode DEBUG conserve chaque requête SQL en mémoire et fausserait les mesures
+    return override_settings(DEBUG=False, ALLOWED_HOSTS=["localhost"])
+
+
+def write_report(data: Dict, output: Optional[str], stdout) -> None:
+    """
+    Écrit le rapport JSON d'un benchmark.
+
+    Args:
+        data (Dict): Rapport.
+        output (Optional[str]): Fichier de destination (sortie standard si absent).
+        stdout: Sortie standard de la commande.
+    """
+    report = json.dumps(data, indent=2)
+    if output:
+        with open(output, "w") as file:
+            file.write(report + "\n")
+    else:
+        stdout.write(report)
+
+
+def latency_summary(durations: List[float]) -> Dict:
+    """Résume des latences (en millisecondes) : nombre, percentiles et moyenne."""
+
+    return {
+        "count": len(durations),
+        "p50_ms": round(percentile(durations, 50), 3),
+        "p95_ms": round(percentile(durations, 95), 3),
+        "p99_ms": round(percentile(durations, 99), 3),
+        "mean_ms": round(statistics.fmean(durations), 3) if durations else None,
+    }
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Retourne le percentile `p` (entre 0 et 100) d'une liste de valeurs, par interpolation."""
+
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(func: Callable[[], object], iterations: int, warmup: int = 1) -> Dict:
+    """
+    Mesure la latence d'une fonction sur plusieurs itérations.
+
+    Args:
+        func (Callable): Fonction à mesurer.
+        iterations (int): Nombre d'exécutions mesurées.
+        warmup (int): Nombre d'exécutions préalables non mesurées.
+
+    Returns:
+        Dict: Latences p50, p95 et moyenne (en millisecondes) et débit (opérations/s).
+    """
+    for _ in range(warmup):
+        func()
+
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    total = sum(durations)
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(durations, 50), 3),
+        "p95_ms": round(percentile(durations, 95), 3),
+        "mean_ms": round(statistics.fmean(durations), 3),
+        "throughput_per_s": round(iterations / (total / 1000), 2) if total else None,
+    }
@@ -0,0 +1,266 @@
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from .models import MovieDetailsCache
+
+
+class MemorySearchCache:
+    """Cache en mémoire du processus, borné en taille (éviction LRU) et en durée de vie (TTL)."""
+
+    def __init__(
+        self, ttl: float, max_size: int, clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialise le cache en mémoire.
+
+        Args:
+            ttl (float): Durée de vie d'une entrée, en secondes.
+            max_size (int): Nombre maximum d'entrées conservées.
+            clock (Callable[[], float]): Horloge utilisée pour l'expiration des entrées.
+        """
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Retourne la valeur associée à la clé, ou None si elle est absente ou expirée."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(value)
+
+    def set(self, key: str, value: List[Dict]) -> None:
+        """Enregistre une valeur, en évinçant l'entrée la moins récemment utilisée si besoin."""
+
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DjangoSearchCache:
+    """Cache s'appuyant sur le framework de cache de Django, partagé entre les workers
+    lorsque le backend configuré l'est (Redis, Memcached, base de données...)."""
+
+    key_prefix = "imdb:search:"
+
+    def __init__(self, ttl: float, alias: str = "default"):
+        """
+        Initialise le cache partagé.
+
+        Args:
+            ttl (float): Durée de vie d'une entrée, en secondes.
+            alias (str): Alias du cache Django à utiliser (voir `CACHES`).
+        """
+
+        self.ttl = ttl
+        self.cache = caches[alias]
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Retourne la valeur associée à la clé, ou None si elle est absente ou expirée."""
+
+        return self.cache.get(self.key_prefix + key)
+
+    def set(self, key: str, value: List[Dict]) -> None:
+        """Enregistre une valeur ; l'éviction par taille est assurée par le backend Django."""
+
+        self.cache.set(self.key_prefix + key, value, timeout=self.ttl)
+
+    def clear(self) -> None:
+        """Vide le cache (l'ensemble du cache Django configuré)."""
+
+        self.cache.clear()
+
+
+class SearchResultCache:
+    """Cache des résultats de recherche IMDb, indexé par titre normalisé et limite."""
+
+    def __init__(self, backend):
+        """
+        Initialise le cache de recherche.
+
+        Args:
+            backend: Backend de stockage (`MemorySearchCache` ou `DjangoSearchCache`).
+        """
+
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(title: str, limit: int) -> str:
+        """
+        Construit la clé de cache d'une recherche.
+
+        Le titre est normalisé (casse et espaces) pour que des saisies équivalentes partagent
+        la même entrée.
+
+        Args:
+            title (str): Titre recherché.
+            limit (int): Nombre maximum de résultats demandés.
+
+        Returns:
+            str: Clé de cache.
+        """
+        normalized = " ".join(title.casefold().split())
+        return f"{limit}:{normalized}"
+
+    def get(self, title: str, limit: int) -> Optional[List[Dict]]:
+        """Retourne les résultats en cache pour cette recherche, ou None, en comptant hits et misses."""
+
+        try:
+            value = self.backend.get(self.make_key(title, limit))
+        except Exception:
+            logging.warning(
+                "Lecture impossible dans le cache de recherche IMDb", exc_info=True
+            )
+            value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, title: str, limit: int, results: List[Dict]) -> None:
+        """Enregistre les résultats d'une recherche."""
+
+        try:
+            self.backend.set(self.make_key(title, limit), results)
+        except Exception:
+            logging.warning(
+                "Écriture impossible dans le cache de recherche IMDb", exc_info=True
+            )
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro."""
+
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les compteurs de hits et de misses du processus courant."""
+
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def build_search_cache() -> SearchResultCache:
+    """
+    Construit le cache de recherche IMDb selon le paramètre `IMDB_SEARCH_CACHE`.
+
+    Returns:
+        SearchResultCache: Cache configuré avec le backend "memory" ou "django".
+
+    Raises:
+        ValueError: Si le backend configuré est inconnu.
+    """
+    config = settings.IMDB_SEARCH_CACHE
+    backend_name = config.get("BACKEND", "memory")
+    ttl = config.get("TTL", 300)
+
+    if backend_name == "memory":
+        backend = MemorySearchCache(ttl=ttl, max_size=config.get("MAX_SIZE", 1024))
+    elif backend_name == "django":
+        backend = DjangoSearchCache(ttl=ttl, alias=config.get("ALIAS", "default"))
+    else:
+        raise ValueError(f"Backend de cache de recherche inconnu : {backend_name}")
+
+    return SearchResultCache(backend)
+
+
+class MovieDetailsStore:
+    """Cache persistant (en base) des détails de films IMDb, avec une politique de fraîcheur."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Initialise le cache des détails.
+
+        Args:
+            ttl (Optional[float]): Durée de fraîcheur d'une entrée, en secondes. Par défaut,
+                `IMDB_DETAILS_CACHE_TTL` ; une valeur nulle ou négative désactive le cache.
+        """
+
+        self.ttl = settings.IMDB_DETAILS_CACHE_TTL if ttl is None else ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, imdb_id: str) -> Optional[Dict]:
+        """
+        Retourne les détails en cache d'un film s'ils sont encore frais.
+
+        Args:
+            imdb_id (str): L'identifiant IMDb du film.
+
+        Returns:
+            Optional[Dict]: Détails du film, ou None s'ils sont absents ou périmés.
+        """
+        if not self.enabled:
+            return None
+
+        fresh_since = timezone.now() - timedelta(seconds=self.ttl)
+        entry = (
+            MovieDetailsCache.objects.filter(
+                imdb_id=imdb_id, fetched_at__gte=fresh_since
+            )
+            .only("payload")
+            .first()
+        )
+        return entry.payload if entry else None
+
+    def set(self, imdb_id: str, payload: Dict) -> None:
+        """
+        Enregistre (ou remplace) les détails d'un film.
+
+        Args:
+            imdb_id (str): L'identifiant IMDb du film.
+            payload (Dict): Détails du film.
+        """
+        if not self.enabled:
+            return
+
+        try:
+            MovieDetailsCache.objects.update_or_create(
+                imdb_id=imdb_id,
+                defaults={"payload": payload, "fetched_at": timezone.now()},
+            )
+        except Exception:
+            logging.warning(
+                f"Écriture impossible dans le cache des détails (IMDb Id: {imdb_id})",
+                exc_info=True,
+            )
@@ -1,5 +1,78 @@
-from injector import Injector
+import threading
+from typing import Dict, Type, TypeVar
+
+from django.conf import settings
+from injector import Injector, Module, noscope, provider, singleton
+
+from .providers import IMDbProvider, build_provider
+
+T = TypeVar("T")
+
+
+class IMDbModule(Module):
+    """Source des données IMDb, choisie par `IMDB_PROVIDER`."""
+
+    @singleton
+    @provider
+    def provide_imdb_provider(self) -> IMDbProvider:
+        return build_provider(settings.IMDB_PROVIDER)
 
 
 # Pour l'injection de dépendances
-injector = Injector()
+injector = Injector([IMDbModule()])
+
+_resolved: Dict[type, object] = {}
+_resolved_lock = threading.Lock()
+
+
+def resolve(interface: Type[T]) -> T:
+    """
+    Résout une dépendance dans le conteneur une seule fois par processus.
+
+    Une liaison faite ensuite (`injector.binder.bind`) serait ignorée : utiliser `override`.
+    """
+    try:
+        return _resolved[interface]
+    except KeyError:
+        with _resolved_lock:
+            if interface not in _resolved:
+                _resolved[interface] = injector.get(interface)
+            return _resolved[interface]
+
+
+def override(interface: Type[T], to: T) -> T:
+    """
+    Remplace l'implémentation d'une dépendance, y compris si elle a déjà été résolue.
+
+    Les instances résolues avant l'appel (par exemple un service qui dépend de `interface`)
+    conservent l'ancienne implémentation.
+
+    Args:
+        interface (Type[T]): Dépendance à remplacer.
+        to (T): Nouvelle implémentation.
+
+    Returns:
+        T: Nouvelle implémentation.
+    """
+    with _resolved_lock:
+        # Sans portée : la portée singleton de la classe conserverait l'instance déjà créée
+        injector.binder.bind(interface, to=to, scope=noscope)
+        _resolved.pop(interface, None)
+    return to
+
+
+class Injected:
+    """
+    Attribut résolu dans le conteneur au premier accès depuis une instance (voir `resolve`).
+
+    Lu sur la classe elle-même (par exemple par l'introspection du routeur DRF au chargement des
+    URL), il retourne le descripteur sans rien résoudre.
+    """
+
+    def __init__(self, interface: type):
+        self.interface = interface
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return resolve(self.interface)
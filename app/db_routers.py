@@ -0,0 +1,168 @@
+import random
+from contextvars import ContextVar
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+
+PRIMARY = "default"
+
+# Modèles toujours lus sur la base principale : leur état change hors des requêtes du client
+# (file d'attente des imports, mise à jour par le worker)
+PRIMARY_ONLY_MODELS = {"app.importjob"}
+
+
+class RoutingState:
+    """Choix de base d'une requête HTTP : réplica à lire (None : base principale) et écritures."""
+
+    def __init__(self, replica: Optional[str] = None):
+        self.replica = replica
+        self.wrote = False
+
+
+_state: ContextVar[Optional[RoutingState]] = ContextVar("db_routing", default=None)
+
+
+class ReplicaRouter:
+    """
+    Envoie les lectures sûres vers un réplica (`DATABASE_REPLICAS`) et tout le reste vers la base
+    principale.
+
+    Seules les requêtes marquées par `ReplicaRoutingMiddleware` lisent sur un réplica : requêtes
+    GET/HEAD/OPTIONS d'un client qui n'a pas écrit récemment. Les commandes, le worker d'import et
+    les requêtes qui écrivent lisent sur la base principale.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if (
+            state is None
+            or state.replica is None
+            or model._meta.label_lower in PRIMARY_ONLY_MODELS
+        ):
+            return PRIMARY
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {PRIMARY, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Les réplicas reçoivent le schéma par la réplication de la base principale
+        return db not in settings.DATABASE_REPLICAS
+
+
+def _iterate_with_state(
+    content: Iterable[bytes], state: RoutingState
+) -> Iterator[bytes]:
+    """Parcourt un contenu diffusé en flux en conservant le choix de base de la requête."""
+
+    iterator = iter(content)
+    while True:
+        token = _state.set(state)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _state.reset(token)
+        yield chunk
+
+
+async def _aiterate_with_state(
+    content: AsyncIterable[bytes], state: RoutingState
+) -> AsyncIterator[bytes]:
+    """Variante de `_iterate_with_state` pour un contenu diffusé de façon asynchrone."""
+
+    iterator = aiter(content)
+    while True:
+        token = _state.set(state)
+        try:
+            chunk = await anext(iterator)
+        except StopAsyncIteration:
+            return
+        finally:
+            _state.reset(token)
+        yield chunk
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Choisit la base lue par chaque requête et assure la lecture de ses propres écritures.
+
+    Une requête sûre lit sur un réplica tiré au hasard (le même pour toute la requête). Après une
+    écriture, un cookie renvoie le client vers la base principale pendant
+    `DATABASE_REPLICA_STICKY_SECONDS` secondes, le temps que la réplication le rattrape.
+
+    Le middleware est synchrone et asynchrone : sous ASGI, il ne force pas l'exécution de la
+    chaîne de traitement (et des vues asynchrones) dans un thread.
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cookie_name = settings.DATABASE_REPLICA_STICKY_COOKIE
+        self.sticky_seconds = settings.DATABASE_REPLICA_STICKY_SECONDS
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        state = self._state_for(request)
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self._finish(response, state)
+
+    async def __acall__(self, request):
+        state = self._state_for(request)
+        # Le contexte est copié dans les appels `sync_to_async` de la vue : ses lectures et
+        # écritures voient ce choix de base.
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self._finish(response, state)
+
+    def _state_for(self, request) -> RoutingState:
+        """Choisit la base lue par la requête : un réplica pour une lecture sûre, sinon aucun."""
+
+        replicas = settings.DATABASE_REPLICAS
+        use_replica = (
+            replicas
+            and request.method in self.SAFE_METHODS
+            and self.cookie_name not in request.COOKIES
+        )
+        return RoutingState(random.choice(replicas) if use_replica else None)
+
+    def _finish(self, response, state: RoutingState):
+        if response.streaming:
+            iterate = _aiterate_with_state if response.is_async else _iterate_with_state
+            response.streaming_content = iterate(response.streaming_content, state)
+        if state.wrote and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=self.sticky_seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,134 @@
+import csv
+import json
+from typing import Dict, Iterable, Iterator
+
+from django.db.models import Prefetch
+
+from .models import Category, Credit
+
+NDJSON = "ndjson"
+CSV = "csv"
+FORMATS = {
+    NDJSON: "application/x-ndjson; charset=utf-8",
+    CSV: "text/csv; charset=utf-8",
+}
+
+CSV_COLUMNS = [
+    "id",
+    "imdb_id",
+    "title",
+    "duration_minutes",
+    "summary",
+    "poster_url",
+    "directors",
+    "producers",
+    "actors",
+    "categories",
+]
+# Séparateur des noms dans les colonnes multivaluées du CSV
+CSV_LIST_SEPARATOR = "|"
+
+
+def export_queryset(queryset):
+    """
+    Prépare un QuerySet de films pour l'export : colonnes utiles uniquement et relations
+    préchargées avec leurs seuls champs exportés.
+
+    Args:
+        queryset: QuerySet de films (éventuellement filtré).
+
+    Returns:
+        QuerySet: QuerySet prêt à être parcouru par `iter_movies`.
+    """
+    credits = Credit.objects.select_related("person").only(
+        "movie", "role", "billing_order", "person__name", "person__imdb_id"
+    )
+    return queryset.only(
+        "id", "imdb_id", "title", "duration_minutes", "summary", "poster_url"
+    ).prefetch_related(
+        Prefetch("credits", queryset=credits),
+        Prefetch("categories", queryset=Category.objects.only("id", "name")),
+    )
+
+
+def iter_movies(queryset, chunk_size: int) -> Iterator[Dict]:
+    """
+    Parcourt les films par lots et les convertit en dictionnaires.
+
+    Avec `iterator(chunk_size=...)`, les relations sont préchargées lot par lot : la mémoire
+    utilisée dépend de la taille d'un lot et non de celle du catalogue.
+
+    Args:
+        queryset: QuerySet préparé par `export_queryset`.
+        chunk_size (int): Nombre de films lus par lot.
+
+    Yields:
+        Dict: Données d'un film et de ses relations.
+    """
+    for movie in queryset.iterator(chunk_size=chunk_size):
+        yield {
+            "id": movie.id,
+            "imdb_id": movie.imdb_id,
+            "title": movie.title,
+            "duration_minutes": movie.duration_minutes,
+            "summary": movie.summary,
+            "poster_url": movie.poster_url,
+            "directors": _people(movie.directors),
+            "producers": _people(movie.producers),
+            "actors": _people(movie.actors),
+            "categories": [category.name for category in movie.categories.all()],
+        }
+
+
+def _people(people) -> list:
+    return [{"name": person.name, "imdb_id": person.imdb_id} for person in people]
+
+
+def to_ndjson(movies: Iterable[Dict]) -> Iterator[str]:
+    """Sérialise les films au format NDJSON (un objet JSON par ligne)."""
+
+    for movie in movies:
+        yield json.dumps(movie, ensure_ascii=False) + "\n"
+
+
+class _Echo:
+    """Pseudo-fichier renvoyant chaque ligne écrite par `csv.writer`, sans la conserver."""
+
+    def write(self, value):
+        return value
+
+
+def to_csv(movies: Iterable[Dict]) -> Iterator[str]:
+    """Sérialise les films au format CSV, les relations étant réduites à la liste des noms."""
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for movie in movies:
+        for column in ("directors", "producers", "actors"):
+            movie[column] = [person["name"] for person in movie[column]]
+        yield writer.writerow(
+            [
+                (
+                    CSV_LIST_SEPARATOR.join(movie[column])
+                    if isinstance(movie[column], list)
+                    else movie[column]
+                )
+                for column in CSV_COLUMNS
+            ]
+        )
+
+
+def stream_catalogue(queryset, output: str, chunk_size: int) -> Iterator[str]:
+    """
+    Produit l'export d'un QuerySet de films au format demandé, ligne par ligne.
+
+    Args:
+        queryset: QuerySet de films à exporter.
+        output (str): Format de sortie (`ndjson` ou `csv`).
+        chunk_size (int): Nombre de films lus par lot.
+
+    Returns:
+        Iterator[str]: Lignes de l'export.
+    """
+    movies = iter_movies(export_queryset(queryset), chunk_size)
+    return to_csv(movies) if output == CSV else to_ndjson(movies)
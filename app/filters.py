@@ -1,12 +1,93 @@
 import django_filters
+from django.db.models import Count
+from rest_framework.filters import BaseFilterBackend
+
 from .models import Movie
+from .search import search_movies
+
+
+class StableOrderingFilter(django_filters.OrderingFilter):
+    """Tri complété par l'identifiant, pour un ordre déterministe entre les pages."""
+
+    def filter(self, qs, value):
+        qs = super().filter(qs, value)
+        if value:
+            qs = qs.order_by(*qs.query.order_by, "id")
+        return qs
 
 
 class MovieFilter(django_filters.FilterSet):
-    categories = django_filters.CharFilter(
-        field_name="categories__name", lookup_expr="icontains"
+    """Filtres de la liste des films.
+
+    `categories` accepte plusieurs noms exacts séparés par des virgules ; `categories_match`
+    précise si un film doit appartenir à toutes les catégories (`all`) ou à l'une d'elles (`any`).
+    `min_duration` et `max_duration` bornent la durée (en minutes) et `ordering` trie par titre
+    ou par durée (`-duration` pour un tri décroissant).
+    """
+
+    MATCH_ANY = "any"
+    MATCH_ALL = "all"
+
+    categories = django_filters.CharFilter(method="filter_categories")
+    categories_match = django_filters.ChoiceFilter(
+        choices=((MATCH_ANY, MATCH_ANY), (MATCH_ALL, MATCH_ALL)),
+        method="filter_nothing",
+        empty_label=None,
+    )
+    min_duration = django_filters.NumberFilter(
+        field_name="duration_minutes", lookup_expr="gte"
+    )
+    max_duration = django_filters.NumberFilter(
+        field_name="duration_minutes", lookup_expr="lte"
+    )
+    ordering = StableOrderingFilter(
+        fields=(("title", "title"), ("duration_minutes", "duration"))
     )
 
     class Meta:
         model = Movie
         fields = ["categories"]
+
+    def filter_categories(self, queryset, name, value):
+        """
+        Filtre les films par catégories via la table de liaison.
+
+        Le filtre s'appuie sur une sous-requête sur la table de liaison (indexée sur la catégorie)
+        plutôt que sur une jointure : aucun film n'est dupliqué et aucun `DISTINCT` n'est requis.
+        """
+        names = {category.strip() for category in value.split(",") if category.strip()}
+        if not names:
+            return queryset
+
+        movie_ids = Movie.categories.through.objects.filter(
+            category__name__in=names
+        ).values("movie_id")
+        if self.form.cleaned_data.get("categories_match") == self.MATCH_ALL:
+            movie_ids = (
+                movie_ids.annotate(matches=Count("category_id"))
+                .filter(matches=len(names))
+                .values("movie_id")
+            )
+        return queryset.filter(id__in=movie_ids)
+
+    def filter_nothing(self, queryset, name, value):
+        """Paramètre lu par un autre filtre, sans effet propre sur le QuerySet."""
+
+        return queryset
+
+
+class MovieSearchFilter(BaseFilterBackend):
+    """
+    Recherche plein texte indexée (titre et résumé) dans le catalogue local.
+
+    Les résultats sont triés par pertinence, sauf si `ordering` est fourni : la pertinence ne
+    départage alors que les films ex aequo.
+    """
+
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, "").strip()
+        if not text:
+            return queryset
+        return search_movies(queryset, text)
@@ -0,0 +1,403 @@
+import gzip
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models.constants import OnConflict
+
+from .models import Category, Credit, Movie, Person
+
+# Valeur nulle des fichiers TSV d'IMDb
+NULL = "\\N"
+
+# Rôles du fichier title.principals conservés, et rôle du crédit correspondant
+ROLES = {
+    "director": Credit.DIRECTOR,
+    "producer": Credit.PRODUCER,
+    "actor": Credit.ACTOR,
+    "actress": Credit.ACTOR,
+}
+
+
+def read_tsv(path: str) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Lit un fichier TSV d'IMDb (compressé en gzip ou non) ligne par ligne.
+
+    Args:
+        path (str): Chemin du fichier.
+
+    Yields:
+        Dict[str, Optional[str]]: Valeurs d'une ligne par nom de colonne (`\\N` devient None).
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", newline="\n") as file:
+        columns = file.readline().rstrip("\n").split("\t")
+        for line in file:
+            values = line.rstrip("\n").split("\t")
+            yield {
+                column: (None if value == NULL else value)
+                for column, value in zip(columns, values)
+            }
+
+
+def batched(iterable: Iterable, size: int) -> Iterator[List]:
+    """Regroupe les éléments d'un itérable en listes de `size` éléments au plus."""
+
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def parse_titles(
+    rows: Iterable[Dict], title_types: Iterable[str], include_adult: bool = False
+) -> Iterator[Dict]:
+    """
+    Extrait les films des lignes du fichier title.basics.
+
+    Args:
+        rows (Iterable[Dict]): Lignes lues par `read_tsv`.
+        title_types (Iterable[str]): Types de titres conservés (`movie`, `tvMovie`...).
+        include_adult (bool): Conserve les titres pour adultes.
+
+    Yields:
+        Dict: Identifiant, titre, durée (en minutes) et genres d'un film.
+    """
+    title_types = set(title_types)
+    for row in rows:
+        if row["titleType"] not in title_types:
+            continue
+        if row["isAdult"] == "1" and not include_adult:
+            continue
+        runtime = row["runtimeMinutes"]
+        yield {
+            "imdb_id": row["tconst"],
+            "title": (row["primaryTitle"] or row["originalTitle"] or "")[:255],
+            "duration_minutes": int(runtime) if runtime and runtime.isdigit() else None,
+            "genres": [
+                genre[:50] for genre in (row["genres"] or "").split(",") if genre
+            ],
+        }
+
+
+def parse_principals(rows: Iterable[Dict]) -> Iterator[Tuple[str, str, str, int]]:
+    """
+    Extrait les réalisateurs, producteurs et acteurs des lignes du fichier title.principals.
+
+    Args:
+        rows (Iterable[Dict]): Lignes lues par `read_tsv`.
+
+    Yields:
+        Tuple[str, str, str, int]: Identifiant du film, identifiant de la personne, rôle du
+        crédit et rang au générique.
+    """
+    for row in rows:
+        if row["category"] in ROLES:
+            ordering = row["ordering"]
+            yield (
+                row["tconst"],
+                row["nconst"],
+                ROLES[row["category"]],
+                int(ordering) if ordering and ordering.isdigit() else 0,
+            )
+
+
+def parse_names(rows: Iterable[Dict]) -> Iterator[Tuple[str, str]]:
+    """Extrait l'identifiant et le nom de chaque personne du fichier name.basics."""
+
+    for row in rows:
+        if row["primaryName"]:
+            yield row["nconst"], row["primaryName"][:200]
+
+
+def _executemany(sql: str, rows: List[Tuple]) -> None:
+    """Exécute une requête préparée pour chaque ligne, dans une seule transaction."""
+
+    # Hors transaction, SQLite validerait (et synchroniserait sur disque) chaque ligne
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+def write_rows(
+    model,
+    fields: List[str],
+    rows: List[Tuple],
+    on_conflict=OnConflict.IGNORE,
+    unique_fields: Optional[List[str]] = None,
+    update_fields: Optional[List[str]] = None,
+) -> None:
+    """
+    Insère des lignes en une seule requête préparée et une seule transaction, sans instancier
+    de modèles.
+
+    Pour des centaines de milliers de lignes, la construction des objets par `bulk_create`
+    coûte bien plus que l'écriture elle-même. Les lignes déjà présentes (selon les contraintes
+    d'unicité) sont ignorées ou, avec `OnConflict.UPDATE`, mises à jour.
+
+    Args:
+        model: Modèle (ou table de liaison) cible.
+        fields (List[str]): Champs renseignés, dans l'ordre des valeurs de chaque ligne.
+        rows (List[Tuple]): Valeurs à insérer.
+        on_conflict (OnConflict): Traitement des lignes déjà présentes.
+        unique_fields (Optional[List[str]]): Champs identifiant une ligne (`OnConflict.UPDATE`).
+        update_fields (Optional[List[str]]): Champs mis à jour (`OnConflict.UPDATE`).
+    """
+    if not rows:
+        return
+    ops = connection.ops
+    meta = model._meta
+    columns = {
+        name: meta.get_field(name).column
+        for name in [*fields, *(unique_fields or []), *(update_fields or [])]
+    }
+    suffix = ops.on_conflict_suffix_sql(
+        [meta.get_field(name) for name in fields],
+        on_conflict,
+        [columns[name] for name in update_fields or []],
+        [columns[name] for name in unique_fields or []],
+    )
+    sql = (
+        f"{ops.insert_statement(on_conflict=on_conflict)} {ops.quote_name(meta.db_table)} "
+        f"({', '.join(ops.quote_name(columns[name]) for name in fields)}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))}) {suffix}"
+    )
+    _executemany(sql, rows)
+
+
+def update_rows(model, field: str, key: str, rows: List[Tuple]) -> None:
+    """
+    Met à jour un champ ligne par ligne en une seule requête préparée et une seule transaction.
+
+    Args:
+        model: Modèle cible.
+        field (str): Champ mis à jour.
+        key (str): Champ (unique) identifiant chaque ligne.
+        rows (List[Tuple]): Couples (nouvelle valeur, valeur de la clé).
+    """
+    ops = connection.ops
+    meta = model._meta
+    sql = (
+        f"UPDATE {ops.quote_name(meta.db_table)} "
+        f"SET {ops.quote_name(meta.get_field(field).column)} = %s "
+        f"WHERE {ops.quote_name(meta.get_field(key).column)} = %s"
+    )
+    _executemany(sql, rows)
+
+
+class Progress:
+    """Suivi de l'avancement d'un chargement : lignes lues, enregistrées et débit."""
+
+    def __init__(self, label: str, write: Callable[[str], None], interval: float = 5.0):
+        """
+        Initialise le suivi.
+
+        Args:
+            label (str): Nom de l'étape affiché.
+            write (Callable[[str], None]): Fonction d'affichage.
+            interval (float): Délai minimum, en secondes, entre deux affichages.
+        """
+
+        self.label = label
+        self.write = write
+        self.interval = interval
+        self.read = 0
+        self.saved = 0
+        self.started = self.last_report = time.monotonic()
+
+    def counting(self, rows: Iterable) -> Iterator:
+        """Compte les lignes lues au passage, sans les conserver."""
+
+        for row in rows:
+            self.read += 1
+            yield row
+
+    def update(self, saved: int) -> None:
+        self.saved += saved
+        now = time.monotonic()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report()
+
+    def report(self, done: bool = False) -> None:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        status = "terminé" if done else "en cours"
+        self.write(
+            f"{self.label} ({status}) : {self.read} lignes lues, "
+            f"{self.saved} enregistrées en {elapsed:.1f} s "
+            f"({self.read / elapsed:.0f} lignes/s)"
+        )
+
+
+class DatasetLoader:
+    """
+    Chargement des fichiers publics d'IMDb (title.basics, title.principals, name.basics) dans le
+    catalogue, sans accès réseau.
+
+    Les fichiers sont lus en flux et enregistrés par lots : la mémoire utilisée dépend de la taille
+    d'un lot et non de celle des fichiers. Chaque lot est un upsert (les films et personnes déjà
+    présents sont mis à jour ou réutilisés), ce qui permet de relancer un chargement interrompu.
+    Les personnes sont créées à la lecture de title.principals avec leur identifiant pour nom,
+    puis nommées à la lecture de name.basics : les fichiers doivent être chargés dans cet ordre.
+    """
+
+    def __init__(self, batch_size: int = 5000, write: Callable[[str], None] = print):
+        """
+        Initialise le chargeur.
+
+        Args:
+            batch_size (int): Nombre de lignes enregistrées par lot.
+            write (Callable[[str], None]): Fonction d'affichage de l'avancement.
+        """
+
+        self.batch_size = batch_size
+        self.write = write
+        self.category_ids: Dict[str, int] = {}
+
+    def load_titles(
+        self, path: str, title_types: Iterable[str] = ("movie",), include_adult=False
+    ) -> int:
+        """
+        Charge les films et leurs catégories depuis title.basics.
+
+        Returns:
+            int: Nombre de films enregistrés.
+        """
+        progress = Progress("title.basics", self.write)
+        titles = parse_titles(
+            progress.counting(read_tsv(path)), title_types, include_adult
+        )
+        for batch in batched(titles, self.batch_size):
+            with transaction.atomic():
+                self._save_titles(batch)
+            progress.update(len(batch))
+        progress.report(done=True)
+        return progress.saved
+
+    def load_principals(self, path: str) -> int:
+        """
+        Charge les réalisateurs, producteurs et acteurs des films déjà chargés depuis
+        title.principals. Les lignes concernant d'autres titres sont ignorées.
+
+        Returns:
+            int: Nombre de liens film-personne lus pour des films du catalogue.
+        """
+        progress = Progress("title.principals", self.write)
+        principals = parse_principals(progress.counting(read_tsv(path)))
+        for batch in batched(principals, self.batch_size):
+            with transaction.atomic():
+                saved = self._save_principals(batch)
+            progress.update(saved)
+        progress.report(done=True)
+        return progress.saved
+
+    def load_names(self, path: str) -> int:
+        """
+        Renseigne le nom des personnes du catalogue depuis name.basics.
+
+        Returns:
+            int: Nombre de personnes renommées.
+        """
+        progress = Progress("name.basics", self.write)
+        names = parse_names(progress.counting(read_tsv(path)))
+        for batch in batched(names, self.batch_size):
+            with transaction.atomic():
+                saved = self._save_names(dict(batch))
+            progress.update(saved)
+        progress.report(done=True)
+        return progress.saved
+
+    def _save_titles(self, titles: List[Dict]) -> None:
+        write_rows(
+            Movie,
+            ["imdb_id", "title", "duration_minutes", "summary", "poster_url"],
+            [
+                (
+                    title["imdb_id"],
+                    title["title"],
+                    title["duration_minutes"],
+                    Movie._meta.get_field("summary").get_default(),
+                    "",
+                )
+                for title in titles
+            ],
+            on_conflict=OnConflict.UPDATE,
+            unique_fields=["imdb_id"],
+            update_fields=["title", "duration_minutes"],
+        )
+        movie_ids = self._movie_ids(title["imdb_id"] for title in titles)
+
+        self._ensure_categories(
+            {genre for title in titles for genre in title["genres"]}
+        )
+        write_rows(
+            Movie.categories.through,
+            ["movie", "category"],
+            [
+                (movie_ids[title["imdb_id"]], self.category_ids[genre])
+                for title in titles
+                for genre in title["genres"]
+            ],
+        )
+
+    def _save_principals(self, principals: List[Tuple[str, str, str, int]]) -> int:
+        movie_ids = self._movie_ids(row[0] for row in principals)
+        principals = [row for row in principals if row[0] in movie_ids]
+        if not principals:
+            return 0
+
+        nconsts = {nconst for _, nconst, _, _ in principals}
+        person_ids = self._person_ids(nconsts)
+        missing = nconsts - person_ids.keys()
+        if missing:
+            # Le nom définitif est renseigné par `load_names`
+            write_rows(
+                Person, ["imdb_id", "name"], [(nconst, nconst) for nconst in missing]
+            )
+            person_ids.update(self._person_ids(missing))
+
+        write_rows(
+            Credit,
+            ["movie", "person", "role", "billing_order"],
+            [
+                (movie_ids[tconst], person_ids[nconst], role, ordering)
+                for tconst, nconst, role, ordering in principals
+            ],
+            on_conflict=OnConflict.UPDATE,
+            unique_fields=["movie", "person", "role"],
+            update_fields=["billing_order"],
+        )
+        return len(principals)
+
+    def _save_names(self, names: Dict[str, str]) -> int:
+        # Seules les personnes du catalogue dont le nom diffère sont mises à jour
+        people = [
+            (names[imdb_id], imdb_id)
+            for imdb_id, name in Person.objects.filter(
+                imdb_id__in=names.keys()
+            ).values_list("imdb_id", "name")
+            if name != names[imdb_id]
+        ]
+        if people:
+            update_rows(Person, "name", "imdb_id", people)
+        return len(people)
+
+    def _person_ids(self, imdb_ids: Iterable[str]) -> Dict[str, int]:
+        return dict(
+            Person.objects.filter(imdb_id__in=imdb_ids).values_list("imdb_id", "id")
+        )
+
+    def _movie_ids(self, imdb_ids: Iterable[str]) -> Dict[str, int]:
+        return dict(
+            Movie.objects.filter(imdb_id__in=set(imdb_ids)).values_list("imdb_id", "id")
+        )
+
+    def _ensure_categories(self, names: set) -> None:
+        missing = names - self.category_ids.keys()
+        if not missing:
+            return
+        Category.objects.bulk_create(
+            [Category(name=name) for name in missing], ignore_conflicts=True
+        )
+        self.category_ids.update(
+            Category.objects.filter(name__in=missing).values_list("name", "id")
+        )
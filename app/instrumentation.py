@@ -0,0 +1,224 @@
+import json
+import logging
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+
+class RequestMetrics:
+    """Mesures d'une requête HTTP : requêtes SQL, temps passé en base et durées par étape."""
+
+    def __init__(self, max_recorded_queries: int = 1000):
+        """
+        Initialise les mesures.
+
+        Args:
+            max_recorded_queries (int): Nombre maximum de requêtes SQL dont le texte est conservé
+                pour le journal des requêtes lentes (toutes restent comptées).
+        """
+
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.timings: Dict[str, float] = {}
+        self.queries: List[Tuple[float, str]] = []
+        self.max_recorded_queries = max_recorded_queries
+        self._lock = threading.Lock()
+
+    def record_query(self, execute, sql, params, many, context):
+        """Enveloppe d'exécution SQL (`connection.execute_wrapper`) mesurant chaque requête."""
+
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            with self._lock:
+                self.db_queries += 1
+                self.db_time += duration
+                if len(self.queries) < self.max_recorded_queries:
+                    self.queries.append((duration, sql))
+
+    def add_timing(self, name: str, duration: float) -> None:
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + duration
+
+    def slowest_queries(self, count: int = 10) -> List[Tuple[float, str]]:
+        return sorted(self.queries, key=lambda query: query[0], reverse=True)[:count]
+
+    def server_timing(self, total: float) -> str:
+        """
+        Construit la valeur de l'en-tête `Server-Timing` (durées en millisecondes).
+
+        Args:
+            total (float): Durée totale de la requête, en secondes.
+
+        Returns:
+            str: Valeur de l'en-tête.
+        """
+        entries = [f'db;dur={self.db_time * 1000:.2f};desc="{self.db_queries} queries"']
+        entries += [
+            f"{name};dur={duration * 1000:.2f}"
+            for name, duration in self.timings.items()
+        ]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def current_metrics() -> Optional[RequestMetrics]:
+    """Retourne les mesures de la requête HTTP en cours, ou None hors requête."""
+
+    return _current.get()
+
+
+@contextmanager
+def timed(name: str):
+    """
+    Ajoute la durée du bloc (ou de la fonction décorée) à l'étape `name` de la requête en cours.
+
+    Hors requête instrumentée, le bloc est exécuté sans mesure. Les durées d'une même étape
+    s'additionnent ; exécutées en parallèle, elles peuvent dépasser la durée de la requête.
+
+    Args:
+        name (str): Nom de l'étape (`imdb`, `serialize`...).
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add_timing(name, time.perf_counter() - started)
+
+
+@contextmanager
+def measured_queries():
+    """
+    Compte les requêtes SQL du thread courant dans les mesures de la requête en cours.
+
+    Le middleware ne mesure que les connexions du thread de la requête : un thread de pool
+    (appels IMDb, imports en lot) exécuté dans une copie de son contexte entoure ses appels de ce
+    bloc pour que ses requêtes soient aussi comptées. Hors requête instrumentée, rien n'est mesuré.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+
+    with RequestInstrumentationMiddleware._wrap_connections(metrics):
+        yield
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Mesure chaque requête HTTP : nombre et durée des requêtes SQL, étapes mesurées par `timed`
+    (appels IMDb, sérialisation) et durée totale.
+
+    Les mesures sont renvoyées dans l'en-tête `Server-Timing` et journalisées sur une ligne JSON.
+    Au-delà de `REQUEST_SLOW_THRESHOLD_MS`, les requêtes SQL les plus lentes sont journalisées.
+    Les requêtes SQL des threads de pool sont comptées s'ils passent par `measured_queries`.
+    Pour une réponse diffusée en flux, seules les requêtes exécutées avant le premier octet sont
+    comptées.
+
+    Le middleware est synchrone et asynchrone : sous ASGI, il ne force pas l'exécution de la
+    chaîne de traitement (et des vues asynchrones) dans un thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = settings.REQUEST_INSTRUMENTATION
+        self.slow_threshold = settings.REQUEST_SLOW_THRESHOLD_MS / 1000
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            with self._wrap_connections(metrics):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            # Les requêtes SQL d'une vue asynchrone passent par `sync_to_async`, dans le thread des
+            # appels synchrones de la requête : les mesures sont posées sur ses connexions.
+            stack = await sync_to_async(self._wrap_connections)(metrics)
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics, started)
+
+    @staticmethod
+    def _wrap_connections(metrics: RequestMetrics) -> ExitStack:
+        """Mesure les requêtes SQL des connexions du thread courant, jusqu'à la fermeture de la
+        pile retournée."""
+
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics.record_query))
+        return stack
+
+    def _finish(self, request, response, metrics: RequestMetrics, started: float):
+        total = time.perf_counter() - started
+        response["Server-Timing"] = metrics.server_timing(total)
+        self._log(request, response, metrics, total)
+        return response
+
+    def _log(self, request, response, metrics: RequestMetrics, total: float) -> None:
+        data = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(total * 1000, 2),
+            "db_queries": metrics.db_queries,
+            "db_ms": round(metrics.db_time * 1000, 2),
+            **{
+                f"{name}_ms": round(duration * 1000, 2)
+                for name, duration in metrics.timings.items()
+            },
+        }
+        logging.info(f"request_metrics {json.dumps(data)}", extra={"metrics": data})
+
+        if total >= self.slow_threshold:
+            slowest = "\n".join(
+                f"  {duration * 1000:.2f} ms : {sql}"
+                for duration, sql in metrics.slowest_queries()
+            )
+            logging.warning(
+                f"Requête lente ({total * 1000:.0f} ms) {request.method} {request.path}, "
+                f"{metrics.db_queries} requête(s) SQL, les plus lentes :\n{slowest}"
+            )
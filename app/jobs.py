@@ -0,0 +1,230 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ImportJob
+from .services import MovieImportService
+
+
+def enqueue_import(imdb_id: str, refresh: bool = False) -> ImportJob:
+    """
+    Ajoute l'import d'un film à la file d'attente.
+
+    Args:
+        imdb_id (str): Identifiant IMDb du film.
+        refresh (bool): Force la récupération des détails depuis IMDb.
+
+    Returns:
+        ImportJob: Tâche créée, en attente d'un worker.
+    """
+    job = ImportJob.objects.create(imdb_id=imdb_id, refresh=refresh)
+    logging.info(f"Import du film {imdb_id} mis en file d'attente (tâche {job.id})")
+    return job
+
+
+def claim_next_job() -> Optional[ImportJob]:
+    """
+    Réserve la plus ancienne tâche en attente.
+
+    La réservation est une mise à jour conditionnelle (`status = pending`) : si plusieurs workers
+    visent la même tâche, un seul l'obtient. Aucun verrou de ligne n'est nécessaire, ce qui
+    convient aussi à SQLite.
+
+    Returns:
+        Optional[ImportJob]: Tâche réservée, ou None si la file est vide.
+    """
+    while True:
+        candidates = list(
+            ImportJob.objects.filter(status=ImportJob.STATUS_PENDING)
+            .order_by("created_at", "id")
+            .values_list("id", flat=True)[:10]
+        )
+        if not candidates:
+            return None
+
+        for job_id in candidates:
+            claimed = ImportJob.objects.filter(
+                id=job_id, status=ImportJob.STATUS_PENDING
+            ).update(
+                status=ImportJob.STATUS_FETCHING,
+                started_at=timezone.now(),
+                attempts=F("attempts") + 1,
+            )
+            if claimed:
+                return ImportJob.objects.get(id=job_id)
+
+
+def run_job(job: ImportJob, import_service: MovieImportService) -> ImportJob:
+    """
+    Exécute une tâche d'import réservée et enregistre son résultat.
+
+    Args:
+        job (ImportJob): Tâche réservée par `claim_next_job`.
+        import_service (MovieImportService): Service d'import utilisé.
+
+    Returns:
+        ImportJob: Tâche terminée.
+    """
+
+    def on_step(step):
+        ImportJob.objects.filter(id=job.id).update(status=step)
+
+    try:
+        result = import_service.import_movie(
+            job.imdb_id, refresh=job.refresh, on_step=on_step
+        )
+    except Exception as e:
+        logging.exception(f"Erreur lors de l'exécution de la tâche {job.id}")
+        result = {"status": MovieImportService.STATUS_FAILED, "detail": str(e)}
+
+    job.result = result["status"]
+    job.movie_id = result.get("id")
+    if result["status"] == MovieImportService.STATUS_FAILED:
+        job.status = ImportJob.STATUS_FAILED
+        job.error = str(result.get("detail", ""))
+    else:
+        job.status = ImportJob.STATUS_SUCCEEDED
+        job.error = ""
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "result", "movie", "error", "finished_at"])
+
+    logging.info(f"Tâche {job.id} ({job.imdb_id}) terminée : {job.result}")
+    return job
+
+
+def requeue_stale_jobs(older_than: float, max_attempts: int) -> int:
+    """
+    Remet en attente les tâches restées en cours trop longtemps (worker arrêté en pleine tâche).
+
+    Une tâche abandonnée après `max_attempts` tentatives n'est plus remise en attente mais
+    marquée en échec : un film dont l'import fait systématiquement tomber le worker ne bloque
+    pas la file indéfiniment.
+
+    Args:
+        older_than (float): Durée, en secondes, au-delà de laquelle une tâche en cours est
+            considérée comme abandonnée.
+        max_attempts (int): Nombre maximum de tentatives d'une tâche.
+
+    Returns:
+        int: Nombre de tâches remises en attente.
+    """
+    stale = ImportJob.objects.filter(
+        status__in=ImportJob.RUNNING_STATUSES,
+        started_at__lt=timezone.now() - timedelta(seconds=older_than),
+    )
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status=ImportJob.STATUS_FAILED,
+        result=MovieImportService.STATUS_FAILED,
+        error=f"Tâche abandonnée après {max_attempts} tentative(s)",
+        finished_at=timezone.now(),
+    )
+    if failed:
+        logging.error(
+            f"{failed} tâche(s) d'import abandonnée(s) {max_attempts} fois marquée(s) en échec"
+        )
+
+    count = stale.update(status=ImportJob.STATUS_PENDING)
+    if count:
+        logging.warning(f"{count} tâche(s) d'import abandonnée(s) remise(s) en attente")
+    return count
+
+
+class ImportWorker:
+    """Worker vidant la file des tâches d'import avec une concurrence configurable."""
+
+    def __init__(
+        self,
+        import_service: MovieImportService,
+        concurrency: int = 1,
+        poll_interval: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialise le worker.
+
+        Args:
+            import_service (MovieImportService): Service d'import utilisé.
+            concurrency (int): Nombre de tâches exécutées simultanément.
+            poll_interval (float): Attente, en secondes, lorsque la file est vide.
+            clock (Callable[[], float]): Horloge (remplaçable dans les tests).
+        """
+
+        self.import_service = import_service
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self.last_requeue: Optional[float] = None
+        self.stopping = threading.Event()
+
+    def drain(self) -> int:
+        """
+        Exécute les tâches en attente jusqu'à ce que la file soit vide.
+
+        Avec une concurrence de 1, les tâches sont exécutées dans le thread appelant.
+
+        Returns:
+            int: Nombre de tâches exécutées.
+        """
+        if self.concurrency <= 1:
+            return self._drain_loop()
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="import-job"
+        ) as executor:
+            futures = [
+                executor.submit(self._drain_in_thread) for _ in range(self.concurrency)
+            ]
+            return sum(future.result() for future in futures)
+
+    def run_forever(self) -> None:
+        """
+        Vide la file puis attend de nouvelles tâches, jusqu'à l'appel de `stop`.
+
+        Lorsque la file est vide, les tâches abandonnées par un autre worker arrêté en cours de
+        route sont remises en attente (au plus une fois par `IMPORT_JOB_STALE_AFTER` secondes).
+        """
+        self._requeue_stale_jobs()
+        while not self.stopping.is_set():
+            if not self.drain() and not self._requeue_stale_jobs():
+                self.stopping.wait(self.poll_interval)
+
+    def stop(self) -> None:
+        self.stopping.set()
+
+    def _requeue_stale_jobs(self) -> int:
+        now = self.clock()
+        if (
+            self.last_requeue is not None
+            and now - self.last_requeue < settings.IMPORT_JOB_STALE_AFTER
+        ):
+            return 0
+        self.last_requeue = now
+        return requeue_stale_jobs(
+            settings.IMPORT_JOB_STALE_AFTER, settings.IMPORT_JOB_MAX_ATTEMPTS
+        )
+
+    def _drain_loop(self) -> int:
+        done = 0
+        while not self.stopping.is_set():
+            job = claim_next_job()
+            if job is None:
+                break
+            run_job(job, self.import_service)
+            done += 1
+        return done
+
+    def _drain_in_thread(self) -> int:
+        close_old_connections()
+        try:
+            return self._drain_loop()
+        finally:
+            # Les connexions d'un thread du pool ne seraient jamais réutilisées
+            connections.close_all()
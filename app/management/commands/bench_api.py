@@ -0,0 +1,164 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from app.benchmarking import (
+    add_output_argument,
+    bench_settings,
+    imdb_dataset,
+    measure,
+    seed_catalogue,
+    throwaway_database,
+    write_report,
+)
+from app.container import override
+from app.models import Movie
+from app.providers import LocalProvider
+from app.services import IMDbService
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure les endpoints des films (liste, détail, filtres, recherche, ajout) sur des "
+        "catalogues synthétiques de tailles croissantes, dans une base jetable. IMDb est remplacé "
+        "par un jeu de données local (latence simulable) : caches, regroupement des appels et "
+        "protection des appels sont mesurés avec le reste. Le résultat (latences p50/p95, débit, nombre de requêtes SQL) est écrit en "
+        "JSON pour être comparé d'une exécution à l'autre."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--movies",
+            type=int,
+            nargs="+",
+            default=[1_000, 100_000],
+            help="Tailles de catalogue mesurées (par exemple 1000 100000 1000000).",
+        )
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--cast-per-movie",
+            type=int,
+            default=10,
+            help="Nombre maximum d'acteurs par film du catalogue synthétique.",
+        )
+        parser.add_argument(
+            "--imdb-latency",
+            type=float,
+            default=0.0,
+            help="Latence simulée de chaque appel à IMDb, en millisecondes.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        add_output_argument(parser)
+
+    def handle(self, *args, **options):
+        runs = []
+        with bench_settings(), throwaway_database():
+            # Un film du jeu de données IMDb par ajout mesuré
+            additions = len(set(options["movies"])) * (
+                options["iterations"] + options["warmup"] + 1
+            )
+            dataset = imdb_dataset(additions, seed=options["seed"])
+            provider = LocalProvider(
+                dataset, latency=options["imdb_latency"] / 1000, seed=options["seed"]
+            )
+            override(IMDbService, IMDbService(provider))
+            client = Client(HTTP_HOST="localhost")
+            rng = random.Random(options["seed"])
+            new_ids = iter([movie["imdb_id"] for movie in dataset])
+
+            seeded = 0
+            for size in sorted(set(options["movies"])):
+                self.stderr.write(f"Catalogue de {size} films...")
+                started = time.perf_counter()
+                generator = seed_catalogue(
+                    size - seeded,
+                    cast_per_movie=options["cast_per_movie"],
+                    seed=options["seed"],
+                    start=seeded,
+                )
+                seeded = size
+                seed_seconds = time.perf_counter() - started
+
+                scenarios = self._scenarios(client, rng, generator.vocabulary, new_ids)
+                results = []
+                for name, request in scenarios.items():
+                    self.stderr.write(f"  {name}")
+                    with CaptureQueriesContext(connection) as queries:
+                        response = request()
+                    results.append(
+                        {
+                            "scenario": name,
+                            "status": response.status_code,
+                            "queries": len(queries),
+                            **measure(
+                                request, options["iterations"], options["warmup"]
+                            ),
+                        }
+                    )
+                    if response.status_code >= 400:
+                        self.stderr.write(
+                            f"  {name} : réponse {response.status_code}",
+                            self.style.ERROR,
+                        )
+
+                runs.append(
+                    {
+                        "movies": Movie.objects.count(),
+                        "seed_seconds": round(seed_seconds, 2),
+                        "results": results,
+                    }
+                )
+
+        write_report(
+            {
+                "iterations": options["iterations"],
+                "cast_per_movie": options["cast_per_movie"],
+                "runs": runs,
+            },
+            options["output"],
+            self.stdout,
+        )
+
+    def _scenarios(self, client, rng, vocabulary, new_ids):
+        """Requêtes mesurées, chacune sous la forme d'une fonction sans argument."""
+
+        list_url = reverse("movie-list")
+        ids = list(Movie.objects.order_by("id").values_list("id", flat=True)[:10_000])
+        last_page = max(1, Movie.objects.count() // 20)
+
+        return {
+            "list": lambda: client.get(list_url),
+            "list_last_page": lambda: client.get(list_url, {"page": last_page}),
+            "detail": lambda: client.get(
+                reverse("movie-detail", kwargs={"pk": rng.choice(ids)})
+            ),
+            "filter_category": lambda: client.get(
+                list_url, {"categories": "Catégorie 3"}
+            ),
+            "filter_categories_all": lambda: client.get(
+                list_url,
+                {"categories": "Catégorie 1,Catégorie 2", "categories_match": "all"},
+            ),
+            "filter_duration": lambda: client.get(
+                list_url,
+                {"min_duration": 90, "max_duration": 120, "ordering": "duration"},
+            ),
+            "search": lambda: client.get(
+                list_url, {"search": vocabulary[len(vocabulary) // 10]}
+            ),
+            "facets": lambda: client.get(reverse("movie-facets")),
+            "imdb_search": lambda: client.get(
+                reverse("movie-search_movie"), {"title": vocabulary[0]}
+            ),
+            "add": lambda: client.post(
+                reverse("movie-add_movie"),
+                {"imdb_id": next(new_ids)},
+                content_type="application/json",
+            ),
+        }
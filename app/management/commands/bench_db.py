@@ -0,0 +1,183 @@
+import random
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.urls import reverse
+
+from app.benchmarking import (
+    add_output_argument,
+    bench_settings,
+    database_profile,
+    imdb_dataset,
+    latency_summary,
+    seed_catalogue,
+    throwaway_database,
+    write_report,
+)
+from app.container import override
+from app.models import Movie
+from app.providers import LocalProvider
+from app.services import IMDbService
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare les profils de connexion SQLite (DATABASE_PROFILES) sous une charge mixte : des "
+        "lecteurs parcourent la liste et le détail des films pendant que des écrivains ajoutent "
+        "des films par /api/movies/add. Chaque profil est mesuré dans une base jetable, avec le "
+        "même catalogue et les mêmes ajouts. Le résultat (latences, débit, erreurs) est écrit en "
+        "JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--movies", type=int, default=20_000)
+        parser.add_argument("--cast-per-movie", type=int, default=5)
+        parser.add_argument("--readers", type=int, default=8)
+        parser.add_argument("--writers", type=int, default=2)
+        parser.add_argument(
+            "--writes",
+            type=int,
+            default=200,
+            help="Nombre total d'ajouts de films ; les lectures durent jusqu'au dernier.",
+        )
+        parser.add_argument(
+            "--profiles",
+            nargs="+",
+            help="Profils comparés (par défaut, tous ceux de DATABASE_PROFILES).",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        add_output_argument(parser)
+
+    def handle(self, *args, **options):
+        profiles = options["profiles"] or list(settings.DATABASE_PROFILES)
+        unknown = set(profiles) - set(settings.DATABASE_PROFILES)
+        if unknown:
+            raise CommandError(f"Profil(s) inconnu(s) : {', '.join(sorted(unknown))}")
+
+        dataset = imdb_dataset(options["writes"], seed=options["seed"])
+        override(IMDbService, IMDbService(LocalProvider(dataset, seed=options["seed"])))
+
+        runs = []
+        with bench_settings():
+            for name in profiles:
+                self.stderr.write(f"Profil {name}...")
+                with database_profile(
+                    settings.DATABASE_PROFILES[name]
+                ), throwaway_database():
+                    seed_catalogue(
+                        options["movies"],
+                        cast_per_movie=options["cast_per_movie"],
+                        seed=options["seed"],
+                    )
+                    with connection.cursor() as cursor:
+                        cursor.execute("PRAGMA journal_mode")
+                        journal_mode = cursor.fetchone()[0]
+                    result = self._run([movie["imdb_id"] for movie in dataset], options)
+                    result["movies_added"] = Movie.objects.filter(
+                        imdb_id__in=[movie["imdb_id"] for movie in dataset]
+                    ).count()
+                runs.append({"profile": name, "journal_mode": journal_mode, **result})
+
+        write_report(
+            {
+                "movies": options["movies"],
+                "readers": options["readers"],
+                "writers": options["writers"],
+                "writes": options["writes"],
+                "runs": runs,
+            },
+            options["output"],
+            self.stdout,
+        )
+
+    def _run(self, imdb_ids, options):
+        """Lance lecteurs et écrivains simultanément et mesure chaque requête."""
+
+        list_url = reverse("movie-list")
+        add_url = reverse("movie-add_movie")
+        movie_ids = list(Movie.objects.values_list("id", flat=True)[:10_000])
+        last_page = max(1, len(movie_ids) // 20)
+
+        pending = iter(imdb_ids)
+        lock = threading.Lock()
+        done = threading.Event()
+        barrier = threading.Barrier(options["readers"] + options["writers"] + 1)
+        reads, writes, statuses = [], [], Counter()
+
+        def record(durations, response, started):
+            duration = (time.perf_counter() - started) * 1000
+            with lock:
+                durations.append(duration)
+                statuses[response.status_code] += 1
+
+        def reader(index):
+            client = Client(HTTP_HOST="localhost", raise_request_exception=False)
+            rng = random.Random(f"{options['seed']}:{index}")
+            requests = [
+                lambda: client.get(list_url, {"page": rng.randint(1, last_page)}),
+                lambda: client.get(
+                    reverse("movie-detail", kwargs={"pk": rng.choice(movie_ids)})
+                ),
+                lambda: client.get(
+                    list_url, {"categories": f"Catégorie {rng.randrange(20)}"}
+                ),
+            ]
+            barrier.wait()
+            try:
+                while not done.is_set():
+                    started = time.perf_counter()
+                    record(reads, rng.choice(requests)(), started)
+            finally:
+                connections.close_all()
+
+        def writer():
+            client = Client(HTTP_HOST="localhost", raise_request_exception=False)
+            barrier.wait()
+            try:
+                while True:
+                    with lock:
+                        imdb_id = next(pending, None)
+                    if imdb_id is None:
+                        return
+                    started = time.perf_counter()
+                    response = client.post(
+                        add_url, {"imdb_id": imdb_id}, content_type="application/json"
+                    )
+                    record(writes, response, started)
+            finally:
+                connections.close_all()
+
+        readers = [
+            threading.Thread(target=reader, args=(index,))
+            for index in range(options["readers"])
+        ]
+        writers = [threading.Thread(target=writer) for _ in range(options["writers"])]
+        for thread in readers + writers:
+            thread.start()
+
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        return {
+            "seconds": round(elapsed, 2),
+            "reads": {
+                **latency_summary(reads),
+                "throughput_per_s": round(len(reads) / elapsed, 1),
+            },
+            "writes": {
+                **latency_summary(writes),
+                "throughput_per_s": round(len(writes) / elapsed, 1),
+            },
+            "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        }
@@ -0,0 +1,82 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from app.benchmarking import (
+    CatalogueGenerator,
+    measure,
+    seed_catalogue,
+    throwaway_database,
+)
+from app.models import Movie
+from app.search import search_movies
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare la recherche plein texte indexée à un balayage LIKE (icontains) sur un "
+        "catalogue synthétique, dans une base jetable."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--movies", type=int, default=100_000)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Conserve la base de benchmark (et son catalogue) entre deux exécutions.",
+        )
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+
+        with throwaway_database(keepdb=options["keepdb"]):
+            if Movie.objects.count() != options["movies"]:
+                Movie.objects.all().delete()
+                self.stderr.write(f"Création de {options['movies']} films...")
+                generator = seed_catalogue(options["movies"], categories_per_movie=0)
+            else:
+                generator = CatalogueGenerator()
+
+            vocabulary = generator.vocabulary
+            # Termes fréquents, moyens et rares, ainsi qu'une recherche de deux mots
+            queries = {
+                "frequent": vocabulary[0],
+                "medium": vocabulary[len(vocabulary) // 10],
+                "rare": vocabulary[-1],
+                "two_words": f"{vocabulary[1]} {vocabulary[2]}",
+            }
+
+            results = []
+            for label, text in queries.items():
+                # Ce que fait la liste paginée : un comptage puis la première page
+                def fts():
+                    queryset = search_movies(Movie.objects.all(), text)
+                    return queryset.count(), list(queryset[:page_size])
+
+                def like():
+                    condition = Q()
+                    for word in text.split():
+                        condition &= Q(title__icontains=word) | Q(
+                            summary__icontains=word
+                        )
+                    queryset = Movie.objects.filter(condition).order_by("id")
+                    return queryset.count(), list(queryset[:page_size])
+
+                matches = fts()[0]
+                results.append(
+                    {
+                        "query": label,
+                        "text": text,
+                        "matches": matches,
+                        "like_matches": like()[0],
+                        "fts": measure(fts, options["iterations"]),
+                        "like": measure(like, options["iterations"]),
+                    }
+                )
+
+        self.stdout.write(
+            json.dumps({"movies": options["movies"], "results": results}, indent=2)
+        )
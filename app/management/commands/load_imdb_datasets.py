@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.imdb_datasets import DatasetLoader
+
+
+class Command(BaseCommand):
+    help = (
+        "Charge le catalogue depuis les fichiers publics d'IMDb (title.basics, "
+        "title.principals et name.basics, compressés en gzip), sans accès réseau."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--basics", help="Chemin du fichier title.basics.tsv.gz (films et genres)."
+        )
+        parser.add_argument(
+            "--principals",
+            help="Chemin du fichier title.principals.tsv.gz (réalisateurs, producteurs, acteurs).",
+        )
+        parser.add_argument(
+            "--names", help="Chemin du fichier name.basics.tsv.gz (noms des personnes)."
+        )
+        parser.add_argument(
+            "--title-types",
+            default="movie",
+            help="Types de titres chargés, séparés par des virgules (movie, tvMovie...).",
+        )
+        parser.add_argument(
+            "--include-adult",
+            action="store_true",
+            help="Charge aussi les titres pour adultes.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Nombre de lignes enregistrées par lot.",
+        )
+
+    def handle(self, *args, **options):
+        if not any(options[name] for name in ("basics", "principals", "names")):
+            raise CommandError(
+                "Indiquez au moins un fichier : --basics, --principals ou --names."
+            )
+
+        loader = DatasetLoader(
+            batch_size=options["batch_size"], write=self.stdout.write
+        )
+        try:
+            # Les personnes sont rattachées aux films chargés, puis nommées : l'ordre importe
+            if options["basics"]:
+                loader.load_titles(
+                    options["basics"],
+                    title_types=options["title_types"].split(","),
+                    include_adult=options["include_adult"],
+                )
+            if options["principals"]:
+                loader.load_principals(options["principals"])
+            if options["names"]:
+                loader.load_names(options["names"])
+        except (OSError, KeyError) as e:
+            raise CommandError(f"Fichier IMDb illisible ou invalide : {e}")
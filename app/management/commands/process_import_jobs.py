@@ -0,0 +1,51 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from app.container import injector
+from app.jobs import ImportWorker
+from app.services import MovieImportService
+
+
+class Command(BaseCommand):
+    help = "Exécute les tâches d'import de films mises en file d'attente par l'API."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Nombre de tâches exécutées simultanément.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Attente, en secondes, lorsque la file est vide.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Vide la file puis s'arrête au lieu d'attendre de nouvelles tâches.",
+        )
+
+    def handle(self, *args, **options):
+        worker = ImportWorker(
+            injector.get(MovieImportService),
+            concurrency=options["concurrency"],
+            poll_interval=options["poll_interval"],
+        )
+
+        if options["once"]:
+            done = worker.drain()
+            self.stdout.write(f"{done} tâche(s) exécutée(s)")
+            return
+
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: worker.stop())
+
+        self.stdout.write(
+            f"Worker d'import démarré (concurrence : {options['concurrency']})"
+        )
+        worker.run_forever()
+        self.stdout.write("Worker d'import arrêté")
@@ -0,0 +1,321 @@
+import glob
+import json
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _labels_key(labels: Dict[str, str]) -> str:
+    return json.dumps(sorted(labels.items()))
+
+
+def _format_labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    escaped = [
+        (
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in pairs
+    ]
+    if not escaped:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return "+Inf" if value == math.inf else repr(float(value))
+
+
+class Metric:
+    """Métrique nommée dont les valeurs sont indexées par un jeu d'étiquettes."""
+
+    kind = ""
+
+    def __init__(self, registry, name: str, documentation: str, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> str:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Étiquettes attendues pour {self.name} : {', '.join(self.labelnames)}"
+            )
+        return _labels_key({name: str(value) for name, value in labels.items()})
+
+
+class Counter(Metric):
+    """Compteur croissant."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self.registry.updating() as values:
+            series = values.setdefault(self.name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        """Valeur du compteur dans ce processus (0 si jamais incrémenté)."""
+
+        return self.registry.values().get(self.name, {}).get(self._key(labels), 0)
+
+
+class Histogram(Metric):
+    """Histogramme d'observations (par exemple des durées, en secondes)."""
+
+    kind = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=None):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets or DEFAULT_BUCKETS))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self.registry.updating() as values:
+            series = values.setdefault(self.name, {})
+            data = series.get(key)
+            if data is None:
+                data = series[key] = {
+                    "buckets": [0] * len(self.buckets),
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data["buckets"][index] += 1
+            data["sum"] += value
+            data["count"] += 1
+
+    def get(self, **labels) -> Optional[Dict]:
+        """Buckets, somme et nombre d'observations dans ce processus (None si aucune)."""
+
+        return self.registry.values().get(self.name, {}).get(self._key(labels))
+
+
+class MetricsRegistry:
+    """
+    Registre des métriques de l'application, au format texte de Prometheus.
+
+    Chaque processus tient ses valeurs en mémoire. Si `METRICS_DIR` est défini, il les écrit
+    aussi (au plus toutes les `METRICS_FLUSH_INTERVAL` secondes) dans un fichier JSON propre à
+    son pid : l'export additionne les fichiers de tous les processus (workers gunicorn), y compris
+    ceux des workers arrêtés pour que les compteurs ne décroissent pas. Le répertoire doit être
+    vidé au redémarrage du service.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self._values: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=None) -> Histogram:
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        if metric.name in self.metrics:
+            raise ValueError(f"Métrique déjà enregistrée : {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    @contextmanager
+    def updating(self):
+        """Donne accès, sous verrou, aux valeurs de ce processus et programme leur écriture."""
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # Processus issu d'un fork : les valeurs héritées appartiennent au parent
+                self._pid = os.getpid()
+                self._values = {}
+                self._flush_timer = None
+            yield self._values
+            self._schedule_flush()
+
+    def values(self) -> Dict[str, Dict]:
+        with self._lock:
+            return json.loads(json.dumps(self._values))
+
+    def _schedule_flush(self) -> None:
+        if not settings.METRICS_DIR or self._flush_timer is not None:
+            return
+        self._flush_timer = threading.Timer(settings.METRICS_FLUSH_INTERVAL, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Écrit les valeurs de ce processus dans `METRICS_DIR` (écriture atomique)."""
+
+        directory = settings.METRICS_DIR
+        with self._lock:
+            self._flush_timer = None
+            if not directory:
+                return
+            snapshot = json.dumps(self._values)
+
+        path = os.path.join(directory, f"metrics-{os.getpid()}.json")
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(temporary, "w") as file:
+                file.write(snapshot)
+            os.replace(temporary, path)
+        except OSError:
+            logging.exception(f"Écriture des métriques impossible dans {directory}")
+
+    def collect(self) -> Dict[str, Dict]:
+        """
+        Additionne les valeurs de tous les processus (ou de ce seul processus sans `METRICS_DIR`).
+
+        Returns:
+            Dict[str, Dict]: Valeurs par métrique puis par jeu d'étiquettes.
+        """
+        if not settings.METRICS_DIR:
+            return self.values()
+
+        self.flush()
+        merged: Dict[str, Dict] = {}
+        for path in glob.glob(os.path.join(settings.METRICS_DIR, "metrics-*.json")):
+            try:
+                with open(path) as file:
+                    snapshot = json.load(file)
+            except (OSError, ValueError):
+                logging.warning(f"Fichier de métriques illisible : {path}")
+                continue
+            for name, series in snapshot.items():
+                if name in self.metrics:
+                    self._merge(merged.setdefault(name, {}), series)
+        return merged
+
+    @staticmethod
+    def _merge(target: Dict, series: Dict) -> None:
+        for key, value in series.items():
+            if isinstance(value, dict):
+                data = target.setdefault(
+                    key,
+                    {"buckets": [0] * len(value["buckets"]), "sum": 0.0, "count": 0},
+                )
+                data["buckets"] = [
+                    a + b for a, b in zip(data["buckets"], value["buckets"])
+                ]
+                data["sum"] += value["sum"]
+                data["count"] += value["count"]
+            else:
+                target[key] = target.get(key, 0) + value
+
+    def render(self) -> str:
+        """Produit l'export au format texte de Prometheus (version 0.0.4)."""
+
+        values = self.collect()
+        lines: List[str] = []
+        for name, metric in self.metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(values.get(name, {}).items()):
+                labels = [tuple(pair) for pair in json.loads(key)]
+                if metric.kind == "counter":
+                    lines.append(
+                        f"{name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+                    continue
+                for bound, count in zip(
+                    (*metric.buckets, math.inf), (*value["buckets"], value["count"])
+                ):
+                    bucket_labels = _format_labels(
+                        [*labels, ("le", _format_value(bound))]
+                    )
+                    lines.append(f"{name}_bucket{bucket_labels} {count}")
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} {_format_value(value['sum'])}"
+                )
+                lines.append(f"{name}_count{_format_labels(labels)} {value['count']}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+IMDB_CALLS = registry.counter(
+    "cinevault_imdb_calls_total",
+    "Appels à IMDbService par opération et par issue (success, error, timeout, cache_hit).",
+    ["operation", "outcome"],
+)
+IMDB_CALL_DURATION = registry.histogram(
+    "cinevault_imdb_call_duration_seconds",
+    "Durée des appels à IMDbService, en secondes.",
+    ["operation", "outcome"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_REQUESTS = registry.counter(
+    "cinevault_http_requests_total",
+    "Requêtes traitées par les vues de l'API, par vue, action, méthode et statut.",
+    ["view", "action", "method", "status"],
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "cinevault_http_request_duration_seconds",
+    "Durée de traitement des requêtes par les vues de l'API, en secondes.",
+    ["view", "action"],
+)
+
+
+def _is_timeout(error: BaseException) -> bool:
+    while error is not None:
+        if isinstance(error, TimeoutError):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def record_imdb_call(operation: str, outcome: str, duration: float) -> None:
+    IMDB_CALLS.inc(operation=operation, outcome=outcome)
+    IMDB_CALL_DURATION.observe(duration, operation=operation, outcome=outcome)
+
+
+@contextmanager
+def track_imdb_call(operation: str):
+    """
+    Mesure un appel à IMDb : issue (`success`, `error` ou `timeout`) et durée.
+
+    Args:
+        operation (str): Nom de l'opération (`search_movie`, `get_movie_details`).
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        outcome = "timeout" if _is_timeout(e) else "error"
+        record_imdb_call(operation, outcome, time.perf_counter() - started)
+        raise
+    record_imdb_call(operation, "success", time.perf_counter() - started)
+
+
+class ViewMetricsMixin:
+    """Compte et mesure les requêtes traitées par chaque action d'un ViewSet."""
+
+    def dispatch(self, request, *args, **kwargs):
+        started = time.perf_counter()
+        response = super().dispatch(request, *args, **kwargs)
+        action = getattr(self, "action", None) or request.method.lower()
+        view = self.__class__.__name__
+        HTTP_REQUESTS.inc(
+            view=view,
+            action=action,
+            method=request.method,
+            status=response.status_code,
+        )
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started, view=view, action=action
+        )
+        return response
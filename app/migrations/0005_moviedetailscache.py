@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0004_category_movie_categories"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieDetailsCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("imdb_id", models.CharField(max_length=20, unique=True)),
+                ("payload", models.JSONField()),
+                ("fetched_at", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name_plural": "Movie details cache",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="category",
+            options={"verbose_name_plural": "Categories"},
+        ),
+    ]
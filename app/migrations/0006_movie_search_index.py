@@ -0,0 +1,79 @@
+from django.db import migrations
+
+# Copie figée de l'index plein texte de `app.search` : une migration ne doit pas dépendre du code
+# applicatif, qui peut évoluer. Sous SQLite, table virtuelle FTS5 synchronisée par des triggers.
+SQLITE_INDEX_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS app_movie_fts USING fts5(
+        title, summary,
+        content='app_movie', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS app_movie_fts_insert AFTER INSERT ON app_movie BEGIN
+        INSERT INTO app_movie_fts(rowid, title, summary)
+        VALUES (new.id, new.title, new.summary);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS app_movie_fts_delete AFTER DELETE ON app_movie BEGIN
+        INSERT INTO app_movie_fts(app_movie_fts, rowid, title, summary)
+        VALUES ('delete', old.id, old.title, old.summary);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS app_movie_fts_update AFTER UPDATE OF title, summary
+    ON app_movie BEGIN
+        INSERT INTO app_movie_fts(app_movie_fts, rowid, title, summary)
+        VALUES ('delete', old.id, old.title, old.summary);
+        INSERT INTO app_movie_fts(rowid, title, summary)
+        VALUES (new.id, new.title, new.summary);
+    END
+    """,
+    "INSERT INTO app_movie_fts(app_movie_fts) VALUES ('rebuild')",
+]
+SQLITE_DROP_SQL = [
+    "DROP TRIGGER IF EXISTS app_movie_fts_insert",
+    "DROP TRIGGER IF EXISTS app_movie_fts_delete",
+    "DROP TRIGGER IF EXISTS app_movie_fts_update",
+    "DROP TABLE IF EXISTS app_movie_fts",
+]
+
+# Sous PostgreSQL, index GIN sur une expression
+POSTGRESQL_INDEX_SQL = [
+    "CREATE INDEX IF NOT EXISTS app_movie_search_idx ON app_movie "
+    "USING GIN ((to_tsvector('simple', coalesce(title, '') || ' ' "
+    "|| coalesce(summary, ''))))",
+]
+POSTGRESQL_DROP_SQL = ["DROP INDEX IF EXISTS app_movie_search_idx"]
+
+
+def run_statements(schema_editor, statements):
+    # Les autres moteurs n'ont pas d'index : la recherche s'y fait sans index
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            cursor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    run_statements(
+        schema_editor, {"sqlite": SQLITE_INDEX_SQL, "postgresql": POSTGRESQL_INDEX_SQL}
+    )
+
+
+def remove_search_index(apps, schema_editor):
+    run_statements(
+        schema_editor, {"sqlite": SQLITE_DROP_SQL, "postgresql": POSTGRESQL_DROP_SQL}
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0005_moviedetailscache"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, remove_search_index),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:45
+
+import re
+
+from django.db import migrations, models
+
+# Copie figée des règles de `app.utils.parse_duration` : une migration ne doit pas dépendre du
+# code applicatif, qui peut évoluer.
+DURATION_RE = re.compile(
+    r"^\s*(?:(?P<hours>\d+)\s*h)?\s*(?:(?P<minutes>\d+)\s*(?:m|min|mn)?)?\s*$",
+    re.IGNORECASE,
+)
+BATCH_SIZE = 2000
+
+
+def parse_duration(value):
+    match = DURATION_RE.match(value or "")
+    if not match or not (match.group("hours") or match.group("minutes")):
+        return None
+    return int(match.group("hours") or 0) * 60 + int(match.group("minutes") or 0)
+
+
+def backfill_duration_minutes(apps, schema_editor):
+    Movie = apps.get_model("app", "Movie")
+    movies = []
+    for movie in Movie.objects.only("id", "duration").iterator(chunk_size=BATCH_SIZE):
+        movie.duration_minutes = parse_duration(movie.duration)
+        if movie.duration_minutes is not None:
+            movies.append(movie)
+        if len(movies) >= BATCH_SIZE:
+            Movie.objects.bulk_update(movies, ["duration_minutes"])
+            movies = []
+    Movie.objects.bulk_update(movies, ["duration_minutes"])
+
+
+def restore_duration(apps, schema_editor):
+    Movie = apps.get_model("app", "Movie")
+    movies = []
+    for movie in Movie.objects.only("id", "duration_minutes").iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        if movie.duration_minutes is not None:
+            movie.duration = (
+                f"{movie.duration_minutes // 60}h{movie.duration_minutes % 60}"
+            )
+            movies.append(movie)
+        if len(movies) >= BATCH_SIZE:
+            Movie.objects.bulk_update(movies, ["duration"])
+            movies = []
+    Movie.objects.bulk_update(movies, ["duration"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0007_importjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="duration_minutes",
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_duration_minutes, restore_duration),
+        migrations.RemoveField(
+            model_name="movie",
+            name="duration",
+        ),
+    ]
@@ -0,0 +1,219 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Rôle du crédit, relation de `Movie` et modèle de personne d'origine
+ROLES = [
+    ("director", "directors", "Director"),
+    ("producer", "producers", "Producer"),
+    ("actor", "actors", "Actor"),
+]
+BATCH_SIZE = 2000
+
+
+def person_key(imdb_id, name):
+    # Une personne est identifiée par son identifiant IMDb, ou à défaut par son nom
+    return ("imdb_id", imdb_id) if imdb_id else ("name", name)
+
+
+def copy_people_to_credits(apps, schema_editor):
+    Movie = apps.get_model("app", "Movie")
+    Person = apps.get_model("app", "Person")
+    Credit = apps.get_model("app", "Credit")
+
+    # Une personne présente dans plusieurs tables (réalisatrice et actrice...) n'est créée qu'une fois
+    people = {}
+    old_keys = {}
+    for _, _, model_name in ROLES:
+        model = apps.get_model("app", model_name)
+        for old_id, name, imdb_id in model.objects.values_list(
+            "id", "name", "imdb_id"
+        ).iterator(chunk_size=BATCH_SIZE):
+            key = person_key(imdb_id, name)
+            people.setdefault(key, Person(name=name, imdb_id=imdb_id or None))
+            old_keys[model_name, old_id] = key
+    Person.objects.bulk_create(people.values(), batch_size=BATCH_SIZE)
+
+    person_ids = {
+        person_key(imdb_id, name): person_id
+        for person_id, name, imdb_id in Person.objects.values_list(
+            "id", "name", "imdb_id"
+        ).iterator(chunk_size=BATCH_SIZE)
+    }
+
+    for role, relation, model_name in ROLES:
+        through = getattr(Movie, relation).through
+        credits = []
+        previous_movie, billing_order = None, 0
+        # Faute d'ordre enregistré, le rang au générique suit l'ordre d'ajout des personnes
+        for movie_id, old_id in (
+            through.objects.order_by("movie_id", "id")
+            .values_list("movie_id", f"{model_name.lower()}_id")
+            .iterator(chunk_size=BATCH_SIZE)
+        ):
+            billing_order = billing_order + 1 if movie_id == previous_movie else 0
+            previous_movie = movie_id
+            credits.append(
+                Credit(
+                    movie_id=movie_id,
+                    person_id=person_ids[old_keys[model_name, old_id]],
+                    role=role,
+                    billing_order=billing_order,
+                )
+            )
+            if len(credits) >= BATCH_SIZE:
+                Credit.objects.bulk_create(credits, ignore_conflicts=True)
+                credits = []
+        Credit.objects.bulk_create(credits, ignore_conflicts=True)
+
+
+def restore_people(apps, schema_editor):
+    Movie = apps.get_model("app", "Movie")
+    Person = apps.get_model("app", "Person")
+    Credit = apps.get_model("app", "Credit")
+
+    for role, relation, model_name in ROLES:
+        model = apps.get_model("app", model_name)
+        # Les tables d'origine sont vides : chaque personne y reprend son identifiant
+        model.objects.bulk_create(
+            (
+                model(id=person_id, name=name, imdb_id=imdb_id)
+                for person_id, name, imdb_id in Person.objects.filter(
+                    credits__role=role
+                )
+                .distinct()
+                .values_list("id", "name", "imdb_id")
+                .iterator(chunk_size=BATCH_SIZE)
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        through = getattr(Movie, relation).through
+        through.objects.bulk_create(
+            (
+                through(movie_id=movie_id, **{f"{model_name.lower()}_id": person_id})
+                for movie_id, person_id in Credit.objects.filter(role=role)
+                .order_by("movie_id", "billing_order", "id")
+                .values_list("movie_id", "person_id")
+                .iterator(chunk_size=BATCH_SIZE)
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0008_movie_duration_minutes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Person",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(db_index=True, max_length=200)),
+                (
+                    "imdb_id",
+                    models.CharField(blank=True, max_length=20, null=True, unique=True),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "People",
+            },
+        ),
+        migrations.CreateModel(
+            name="Credit",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[
+                            ("director", "Réalisateur"),
+                            ("producer", "Producteur"),
+                            ("actor", "Acteur"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("billing_order", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "movie",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="credits",
+                        to="app.movie",
+                    ),
+                ),
+                (
+                    "person",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="credits",
+                        to="app.person",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["billing_order", "id"],
+            },
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="people",
+            field=models.ManyToManyField(
+                blank=True, related_name="movies", through="app.Credit", to="app.person"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="credit",
+            index=models.Index(
+                fields=["person", "role"], name="app_credit_person__1c8676_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="credit",
+            constraint=models.UniqueConstraint(
+                fields=("movie", "person", "role"), name="unique_credit"
+            ),
+        ),
+        migrations.RunPython(copy_people_to_credits, restore_people),
+        migrations.RemoveField(
+            model_name="movie",
+            name="directors",
+        ),
+        migrations.RemoveField(
+            model_name="movie",
+            name="producers",
+        ),
+        migrations.RemoveField(
+            model_name="movie",
+            name="actors",
+        ),
+        migrations.DeleteModel(
+            name="Director",
+        ),
+        migrations.DeleteModel(
+            name="Producer",
+        ),
+        migrations.DeleteModel(
+            name="Actor",
+        ),
+    ]
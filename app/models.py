@@ -1,50 +1,159 @@
 from django.db import models
 
 
+class PersonQuerySet(models.QuerySet):
+    """QuerySet dédié aux personnes."""
+
+    def with_credit_counts(self):
+        """
+        Ajoute à chaque personne son nombre de crédits par rôle (`director_count`,
+        `producer_count`, `actor_count`), calculé dans la requête qui lit la personne.
+
+        Returns:
+            PersonQuerySet: QuerySet annoté.
+        """
+        return self.annotate(
+            **{
+                f"{role}_count": models.Count(
+                    "credits", filter=models.Q(credits__role=role)
+                )
+                for role, _ in Credit.ROLE_CHOICES
+            }
+        )
+
+
 class Person(models.Model):
-    """Modèle abstrait pour une personne associée à un film, comme un directeur, un producteur ou un acteur."""
+    """Personne associée à des films (réalisateur, producteur ou acteur), enregistrée une seule fois
+    quels que soient ses rôles."""
 
-    name = models.CharField(max_length=200)
+    name = models.CharField(max_length=200, db_index=True)
     imdb_id = models.CharField(max_length=20, unique=True, null=True, blank=True)
 
+    objects = PersonQuerySet.as_manager()
+
     class Meta:
-        abstract = True
+        verbose_name_plural = "People"
 
     def __str__(self):
         return self.name
 
 
-class Director(Person):
-    """Modèle pour un réalisateur de film."""
+class Category(models.Model):
+    """Modèle pour définir une catégorie de film."""
+
+    name = models.CharField(max_length=50, unique=True)
+
+    def __str__(self):
+        return self.name
 
     class Meta:
-        verbose_name_plural = "Directors"
+        verbose_name_plural = "Categories"
 
 
-class Producer(Person):
-    """Modèle pour un producteur de film."""
+class MovieQuerySet(models.QuerySet):
+    """QuerySet dédié aux films, regroupant les chargements optimisés selon l'usage."""
 
-    class Meta:
-        verbose_name_plural = "Producers"
+    # Champs lus par défaut pour la liste des films (ceux de `MovieListSerializer`)
+    LIST_FIELDS = ("id", "title", "poster_url", "categories")
 
+    def for_fields(self, fields):
+        """
+        Limite le chargement des films aux champs demandés.
 
-class Actor(Person):
-    """Modèle pour un acteur de film."""
+        Seules les colonnes demandées sont lues (`only`), et seules les relations demandées sont
+        préchargées, chacune en une requête quel que soit le nombre de films : les catégories, et
+        les crédits des seuls rôles demandés (`directors`, `producers`, `actors`), avec leur
+        personne.
 
-    class Meta:
-        verbose_name_plural = "Actors"
+        Args:
+            fields (Iterable[str]): Champs du modèle, ou listes de personnes par rôle.
 
+        Returns:
+            MovieQuerySet: QuerySet réduit aux champs demandés.
+        """
+        fields = set(fields)
+        columns = {field.name for field in self.model._meta.concrete_fields}
+        queryset = self.only("id", *sorted(fields & columns))
 
-class Category(models.Model):
-    """Modèle pour définir une catégorie de film."""
+        if "categories" in fields:
+            queryset = queryset.prefetch_related(
+                models.Prefetch(
+                    "categories", queryset=Category.objects.only("id", "name")
+                )
+            )
+        roles = [role for role, field in Credit.ROLE_FIELDS.items() if field in fields]
+        if roles:
+            queryset = queryset.prefetch_related(
+                models.Prefetch(
+                    "credits",
+                    queryset=Credit.objects.filter(role__in=roles)
+                    .select_related("person")
+                    .only(
+                        "movie",
+                        "role",
+                        "billing_order",
+                        "person__name",
+                        "person__imdb_id",
+                    ),
+                )
+            )
+        return queryset
 
-    name = models.CharField(max_length=50, unique=True)
+    def for_list(self, fields=LIST_FIELDS):
+        """
+        Prépare le QuerySet utilisé par la liste des films.
 
-    def __str__(self):
-        return self.name
+        Seules les colonnes affichées par `MovieListSerializer` (ou les champs demandés) sont
+        chargées et les relations sont préchargées en une seule requête chacune, quel que soit le
+        nombre de films.
 
-    class Meta:
-        verbose_name_plural = "Categories"
+        Args:
+            fields (Iterable[str]): Champs affichés (voir `for_fields`).
+
+        Returns:
+            MovieQuerySet: QuerySet ordonné et optimisé pour la liste.
+        """
+        return self.for_fields(fields).order_by("id")
+
+    def with_details(self, fields=None):
+        """
+        Prépare le QuerySet utilisé pour le détail d'un film.
+
+        Tous les crédits (réalisateurs, producteurs et acteurs) sont préchargés en une seule
+        requête avec leur personne, puis les catégories : la lecture d'un film et de toutes ses
+        relations se fait en un nombre fixe de requêtes.
+
+        Args:
+            fields (Optional[Iterable[str]]): Champs affichés, pour ne charger qu'eux (voir
+                `for_fields`) ; par défaut, tous.
+
+        Returns:
+            MovieQuerySet: QuerySet avec les relations préchargées.
+        """
+        if fields is not None:
+            return self.for_fields(fields)
+        return self.prefetch_related(
+            models.Prefetch(
+                "credits", queryset=Credit.objects.select_related("person")
+            ),
+            "categories",
+        )
+
+    def category_facets(self):
+        """
+        Compte les films de ce QuerySet par catégorie, en une seule requête d'agrégation.
+
+        Returns:
+            list[dict]: Nom de chaque catégorie représentée et nombre de films associés,
+            par nombre décroissant.
+        """
+        return list(
+            self.order_by()
+            .values(name=models.F("categories__name"))
+            .annotate(count=models.Count("id"))
+            .filter(name__isnull=False)
+            .order_by("-count", "name")
+        )
 
 
 class Movie(models.Model):
@@ -52,15 +161,130 @@ class Movie(models.Model):
 
     imdb_id = models.CharField(max_length=20, unique=True)
     title = models.CharField(max_length=255)
-    duration = models.CharField(max_length=10, default="Non indiqué")
+    duration_minutes = models.PositiveIntegerField(null=True, blank=True, db_index=True)
     summary = models.TextField(default="Non indiqué")
     poster_url = models.URLField(blank=True)
 
     # Relations
-    directors = models.ManyToManyField(Director, related_name="movies", blank=True)
-    producers = models.ManyToManyField(Producer, related_name="movies", blank=True)
-    actors = models.ManyToManyField(Actor, related_name="movies", blank=True)
+    people = models.ManyToManyField(
+        Person, through="Credit", related_name="movies", blank=True
+    )
     categories = models.ManyToManyField(Category, related_name="movies", blank=True)
 
+    objects = MovieQuerySet.as_manager()
+
     def __str__(self):
         return self.title
+
+    def credited(self, role: str) -> list:
+        """
+        Retourne les personnes créditées pour un rôle, dans l'ordre du générique.
+
+        Les crédits préchargés (`MovieQuerySet.with_details`) sont utilisés s'ils existent :
+        les trois rôles sont alors lus sans nouvelle requête.
+
+        Args:
+            role (str): Rôle recherché (`Credit.DIRECTOR`, `Credit.PRODUCER` ou `Credit.ACTOR`).
+
+        Returns:
+            list[Person]: Personnes créditées pour ce rôle.
+        """
+        return [credit.person for credit in self.credits.all() if credit.role == role]
+
+    @property
+    def directors(self) -> list:
+        return self.credited(Credit.DIRECTOR)
+
+    @property
+    def producers(self) -> list:
+        return self.credited(Credit.PRODUCER)
+
+    @property
+    def actors(self) -> list:
+        return self.credited(Credit.ACTOR)
+
+
+class Credit(models.Model):
+    """Participation d'une personne à un film, avec son rôle et son rang au générique."""
+
+    DIRECTOR = "director"
+    PRODUCER = "producer"
+    ACTOR = "actor"
+    ROLE_CHOICES = [
+        (DIRECTOR, "Réalisateur"),
+        (PRODUCER, "Producteur"),
+        (ACTOR, "Acteur"),
+    ]
+    # Champ de l'API (liste de personnes) correspondant à chaque rôle
+    ROLE_FIELDS = {DIRECTOR: "directors", PRODUCER: "producers", ACTOR: "actors"}
+
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name="credits")
+    person = models.ForeignKey(Person, on_delete=models.CASCADE, related_name="credits")
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    billing_order = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ["billing_order", "id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["movie", "person", "role"], name="unique_credit"
+            )
+        ]
+        # Filmographie d'une personne, éventuellement pour un seul rôle
+        indexes = [models.Index(fields=["person", "role"])]
+
+    def __str__(self):
+        return f"{self.person} ({self.role}) - {self.movie}"
+
+
+class MovieDetailsCache(models.Model):
+    """Cache persistant des détails de films récupérés depuis IMDb."""
+
+    imdb_id = models.CharField(max_length=20, unique=True)
+    payload = models.JSONField()
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name_plural = "Movie details cache"
+
+    def __str__(self):
+        return self.imdb_id
+
+
+class ImportJob(models.Model):
+    """Tâche d'import d'un film depuis IMDb, exécutée en arrière-plan par un worker."""
+
+    STATUS_PENDING = "pending"
+    STATUS_FETCHING = "fetching"
+    STATUS_SAVING = "saving"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "En attente"),
+        (STATUS_FETCHING, "Récupération des détails"),
+        (STATUS_SAVING, "Enregistrement"),
+        (STATUS_SUCCEEDED, "Terminée"),
+        (STATUS_FAILED, "En échec"),
+    ]
+    RUNNING_STATUSES = (STATUS_FETCHING, STATUS_SAVING)
+
+    imdb_id = models.CharField(max_length=20)
+    refresh = models.BooleanField(default=False)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    result = models.CharField(max_length=10, blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    movie = models.ForeignKey(
+        Movie, null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"{self.imdb_id} ({self.status})"
@@ -0,0 +1,9 @@
+from django.conf import settings
+from rest_framework.pagination import PageNumberPagination
+
+
+class MoviePagination(PageNumberPagination):
+    """Pagination par numéro de page pour le catalogue, avec une taille de page configurable par le client."""
+
+    page_size_query_param = "page_size"
+    max_page_size = settings.MOVIE_MAX_PAGE_SIZE
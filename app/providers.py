@@ -0,0 +1,327 @@
+import json
+import logging
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from imdb import IMDbError
+
+from .utils import parse_duration
+
+CINEMAGOER = "cinemagoer"
+LOCAL = "local"
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class IMDbProvider(ABC):
+    """
+    Source des données de films utilisée par `IMDbService`.
+
+    Les deux méthodes retournent des données déjà normalisées : le cache, le regroupement des
+    appels et la protection des appels (délai, nouveaux essais, disjoncteur) restent à la charge
+    du service.
+    """
+
+    @abstractmethod
+    def search(self, title: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Recherche des films par titre.
+
+        Args:
+            title (str): Le titre du film à rechercher.
+            limit (Optional[int]): Nombre maximum de films à retourner (None : tous).
+
+        Returns:
+            List[Dict]: Films trouvés (`imdb_id`, `title`, `poster_url`).
+        """
+
+    @abstractmethod
+    def details(self, imdb_id: str) -> Dict:
+        """
+        Récupère les détails complets d'un film.
+
+        Args:
+            imdb_id (str): L'identifiant IMDb du film.
+
+        Returns:
+            Dict: Détails du film, au format attendu par `MovieDetailSerializer`.
+        """
+
+    def warm_up(self) -> None:
+        """Prépare le fournisseur (imports, clients) avant le premier appel."""
+
+
+def get_movie(imdb_id: str):
+    """
+    Récupère un film avec imdbinfo.
+
+    imdbinfo n'est importé qu'au premier appel : son import (environ une demi-seconde) n'est
+    payé que par les processus qui interrogent réellement IMDb.
+    """
+    from imdbinfo.services import get_movie as imdbinfo_get_movie
+
+    return imdbinfo_get_movie(imdb_id)
+
+
+def runtime_minutes(runtime) -> Optional[int]:
+    """
+    Convertit la durée d'un film en minutes.
+
+    Le formatage pour l'affichage ("2h22") est fait par le sérialiseur.
+
+    Args:
+        runtime (int | str | None): La durée du film fournie par IMDb.
+
+    Returns:
+        Optional[int]: La durée en minutes, ou None si elle est inconnue ou invalide.
+    """
+
+    try:
+        return parse_duration(runtime)
+    except ValueError as e:
+        logging.warning(f"Erreur dans le calcul du runtime ({e})")
+        return None
+
+
+class CinemagoerProvider(IMDbProvider):
+    """
+    Interroge IMDb : recherche via Cinemagoer, détails via imdbinfo.
+
+    Le client Cinemagoer est construit au premier appel (ou par `warm_up`).
+    """
+
+    def __init__(self):
+        self._ia = None
+        self._lock = threading.Lock()
+
+    @property
+    def ia(self):
+        if self._ia is None:
+            with self._lock:
+                if self._ia is None:
+                    from imdb import Cinemagoer
+
+                    self._ia = Cinemagoer()
+        return self._ia
+
+    def warm_up(self) -> None:
+        import imdbinfo.services  # noqa: F401
+
+        self.ia
+
+    def search(self, title: str, limit: Optional[int] = None) -> List[Dict]:
+        return [
+            {
+                "imdb_id": movie.movieID,
+                "title": movie.get("title", ""),
+                "poster_url": movie.get("cover url", ""),
+            }
+            for movie in self.ia.search_movie(title)[:limit]
+        ]
+
+    def details(self, imdb_id: str) -> Dict:
+        # movie = web.get_title(imdb_id)
+        movie = get_movie(imdb_id)
+
+        return {
+            "imdb_id": imdb_id,
+            "title": getattr(movie, "title", "N/A"),
+            "duration": runtime_minutes(getattr(movie, "duration", None)),
+            "summary": getattr(movie, "plot", "N/A"),
+            "poster_url": getattr(movie, "cover_url", "N/A"),
+            "directors": self._extract_people(getattr(movie, "directors", [])),
+            "producers": self._extract_people(getattr(movie, "producers", [])),
+            "actors": self._extract_people(getattr(movie, "stars", [])[:10]),
+            "categories": [{"name": genre} for genre in getattr(movie, "genres", [])],
+        }
+
+    def _extract_people(self, people) -> List[Dict]:
+        """
+        Extrait une liste d'individus (réalisateurs, producteurs, acteurs).
+
+        Args:
+            people: Liste d'objets personnes récupérés de l'API IMDb.
+
+        Returns:
+            List[Dict]: Liste de dictionnaires contenant le nom et l'ID IMDb des personnes
+                (`None` si IMDb ne le fournit pas : la personne est alors identifiée par son nom).
+        """
+
+        return [
+            {
+                "name": getattr(person, "name", "N/A"),
+                "imdb_id": getattr(person, "imdbId", None) or None,
+            }
+            for person in people
+        ]
+
+
+class LocalProvider(IMDbProvider):
+    """
+    Remplace IMDb par un jeu de données local, pour les tests de charge et l'intégration continue.
+
+    Les films sont indexés par identifiant et par mot du titre : une recherche retourne, dans
+    l'ordre du jeu de données, les films dont le titre contient tous les mots recherchés. Une
+    latence (fixe plus une part aléatoire) et une proportion d'erreurs (`IMDbError`, comme une
+    panne d'IMDb) peuvent être simulées.
+    """
+
+    def __init__(
+        self,
+        movies: Iterable[Dict],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialise le jeu de données.
+
+        Args:
+            movies (Iterable[Dict]): Films, au format des détails (`duration`, catégories
+                `{"name": ...}`) ou de l'export NDJSON du catalogue (`duration_minutes`,
+                catégories par nom).
+            latency (float): Latence simulée de chaque appel, en secondes.
+            jitter (float): Latence supplémentaire aléatoire maximum, en secondes.
+            error_rate (float): Proportion d'appels en erreur, entre 0 et 1.
+            seed (Optional[int]): Graine du tirage de la latence et des erreurs.
+        """
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.movies: Dict[str, Dict] = {}
+        self.index: Dict[str, List[str]] = {}
+        for movie in movies:
+            movie = self._normalize(movie)
+            if movie["imdb_id"] in self.movies:
+                continue
+            self.movies[movie["imdb_id"]] = movie
+            for word in set(_WORD_RE.findall(movie["title"].casefold())):
+                self.index.setdefault(word, []).append(movie["imdb_id"])
+
+    @classmethod
+    def from_file(cls, path: str, **options) -> "LocalProvider":
+        """
+        Charge le jeu de données d'un fichier JSON (liste de films) ou NDJSON (un film par
+        ligne, comme l'export `/api/movies/export`).
+
+        Args:
+            path (str): Chemin du fichier.
+            **options: Options de simulation transmises au constructeur.
+
+        Returns:
+            LocalProvider: Le fournisseur chargé.
+        """
+        with open(path, encoding="utf-8") as file:
+            if file.read(1) == "[":
+                file.seek(0)
+                movies = json.load(file)
+            else:
+                file.seek(0)
+                movies = [json.loads(line) for line in file if line.strip()]
+        logging.info(
+            f"Jeu de données IMDb local : {len(movies)} films chargés de {path}"
+        )
+        return cls(movies, **options)
+
+    @staticmethod
+    def _normalize(movie: Dict) -> Dict:
+        def people(key):
+            return [
+                {"name": person["name"], "imdb_id": person["imdb_id"]}
+                for person in movie.get(key) or []
+            ]
+
+        return {
+            "imdb_id": movie["imdb_id"],
+            "title": movie.get("title", ""),
+            "duration": runtime_minutes(
+                movie.get("duration", movie.get("duration_minutes"))
+            ),
+            "summary": movie.get("summary", ""),
+            "poster_url": movie.get("poster_url", ""),
+            "directors": people("directors"),
+            "producers": people("producers"),
+            "actors": people("actors"),
+            "categories": [
+                category if isinstance(category, dict) else {"name": category}
+                for category in movie.get("categories") or []
+            ],
+        }
+
+    def _simulate(self, operation: str) -> None:
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            raise IMDbError(f"Erreur simulée par le jeu de données local ({operation})")
+
+    def search(self, title: str, limit: Optional[int] = None) -> List[Dict]:
+        self._simulate("search")
+        words = set(_WORD_RE.findall(title.casefold()))
+        if not words:
+            return []
+        postings = sorted((self.index.get(word, []) for word in words), key=len)
+        matches = set(postings[0]).intersection(*postings[1:])
+        results = []
+        for imdb_id in postings[0]:
+            if imdb_id in matches:
+                movie = self.movies[imdb_id]
+                results.append(
+                    {
+                        "imdb_id": imdb_id,
+                        "title": movie["title"],
+                        "poster_url": movie["poster_url"],
+                    }
+                )
+                if limit is not None and len(results) >= limit:
+                    break
+        return results
+
+    def details(self, imdb_id: str) -> Dict:
+        self._simulate("details")
+        try:
+            movie = self.movies[imdb_id]
+        except KeyError:
+            raise LookupError(
+                f"Film {imdb_id} absent du jeu de données local"
+            ) from None
+        return json.loads(json.dumps(movie))
+
+
+def build_provider(config: Dict) -> IMDbProvider:
+    """
+    Construit le fournisseur de données décrit par `IMDB_PROVIDER`.
+
+    Args:
+        config (Dict): Configuration (`BACKEND`, et pour `local` : `DATASET`, `LATENCY`,
+            `JITTER`, `ERROR_RATE`).
+
+    Returns:
+        IMDbProvider: Le fournisseur configuré.
+
+    Raises:
+        ImproperlyConfigured: Si le fournisseur est inconnu ou si le jeu de données local manque.
+    """
+    backend = config.get("BACKEND", CINEMAGOER)
+    if backend == CINEMAGOER:
+        return CinemagoerProvider()
+    if backend == LOCAL:
+        if not config.get("DATASET"):
+            raise ImproperlyConfigured(
+                "IMDB_PROVIDER['DATASET'] doit indiquer le jeu de données local"
+            )
+        return LocalProvider.from_file(
+            config["DATASET"],
+            latency=config.get("LATENCY", 0.0),
+            jitter=config.get("JITTER", 0.0),
+            error_rate=config.get("ERROR_RATE", 0.0),
+        )
+    raise ImproperlyConfigured(f"Fournisseur IMDb inconnu : {backend}")
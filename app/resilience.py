@@ -0,0 +1,217 @@
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from typing import Callable, Optional, Tuple, Type
+
+from imdb import IMDbError
+
+
+class UpstreamTimeout(TimeoutError):
+    """Le service distant n'a pas répondu dans le délai imparti."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Le service distant est considéré comme indisponible : l'appel n'est pas tenté."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"Service IMDb indisponible, nouvel essai possible dans {retry_after:.0f} s"
+        )
+        self.retry_after = retry_after
+
+
+# Erreurs révélant un service distant défaillant : elles justifient un nouvel essai et comptent
+# pour le disjoncteur. Les autres erreurs (données invalides...) sont propagées immédiatement.
+RETRYABLE_ERRORS: Tuple[Type[BaseException], ...] = (TimeoutError, OSError, IMDbError)
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur : après `failure_threshold` échecs consécutifs, les appels sont refusés pendant
+    `reset_timeout` secondes, puis un seul appel d'essai est autorisé. Son succès referme le
+    disjoncteur, son échec le rouvre.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    # Délai minimum annoncé aux appels refusés : pendant un essai, le délai de réouverture est
+    # écoulé mais l'issue de l'essai n'est pas encore connue
+    MIN_RETRY_AFTER = 1.0
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_call(self) -> None:
+        """
+        Autorise ou refuse un appel.
+
+        Raises:
+            CircuitOpenError: Si le disjoncteur est ouvert, ou si un appel d'essai est en cours.
+        """
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self.trial_running:
+                self.trial_running = True
+                return
+            retry_after = max(
+                self.MIN_RETRY_AFTER,
+                self.opened_at + self.reset_timeout - self.clock(),
+            )
+        raise CircuitOpenError(retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.opened_at is not None:
+                logging.info("Disjoncteur IMDb refermé")
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.trial_running or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self.trial_running:
+                    logging.warning(
+                        f"Disjoncteur IMDb ouvert pour {self.reset_timeout:.0f} s "
+                        f"après {self.failures} échec(s)"
+                    )
+                self.opened_at = self.clock()
+                self.trial_running = False
+
+
+class Resilience:
+    """
+    Appels protégés vers un service distant : délai maximum par appel, nouveaux essais bornés
+    avec attente exponentielle aléatoire (« full jitter ») et disjoncteur.
+
+    Les appels sont exécutés dans un pool de threads borné : un appel qui dépasse son délai est
+    abandonné (le thread termine seul) et l'appelant est libéré immédiatement.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff_base: float = 0.2,
+        backoff_max: float = 2.0,
+        breaker: Optional[CircuitBreaker] = None,
+        workers: int = 16,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialise la protection des appels.
+
+        Args:
+            timeout (float): Délai maximum d'un essai, en secondes.
+            retries (int): Nombre de nouveaux essais après un échec.
+            backoff_base (float): Attente de référence avant le premier nouvel essai.
+            backoff_max (float): Attente maximum entre deux essais.
+            breaker (Optional[CircuitBreaker]): Disjoncteur partagé par les appels.
+            workers (int): Taille du pool exécutant les appels.
+            sleep (Callable[[float], None]): Fonction d'attente (remplaçable dans les tests).
+        """
+
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.sleep = sleep
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="imdb-call"
+        )
+
+    @classmethod
+    def from_settings(cls, config: dict) -> "Resilience":
+        """Construit la protection à partir de `IMDB_RESILIENCE`."""
+
+        return cls(
+            timeout=config.get("TIMEOUT", 10.0),
+            retries=config.get("RETRIES", 2),
+            backoff_base=config.get("BACKOFF_BASE", 0.2),
+            backoff_max=config.get("BACKOFF_MAX", 2.0),
+            breaker=CircuitBreaker(
+                failure_threshold=config.get("BREAKER_THRESHOLD", 5),
+                reset_timeout=config.get("BREAKER_RESET_TIMEOUT", 30.0),
+            ),
+            workers=config.get("WORKERS", 16),
+        )
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Exécute un appel vers le service distant avec délai, nouveaux essais et disjoncteur.
+
+        Args:
+            func (Callable): Fonction appelant le service distant.
+
+        Returns:
+            Résultat de la fonction.
+
+        Raises:
+            CircuitOpenError: Si le disjoncteur est ouvert.
+            UpstreamTimeout: Si le dernier essai a dépassé son délai.
+            Exception: Dernière erreur de la fonction, ou erreur non retentable.
+        """
+        for attempt in range(self.retries + 1):
+            self.breaker.before_call()
+            try:
+                result = self._call_with_deadline(func, *args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                self.breaker.record_failure()
+                if attempt == self.retries:
+                    raise
+                delay = random.uniform(
+                    0, min(self.backoff_max, self.backoff_base * 2**attempt)
+                )
+                logging.warning(
+                    f"Échec de l'appel à IMDb ({e!r}), nouvel essai dans {delay:.2f} s"
+                )
+                self.sleep(delay)
+            except Exception:
+                # Le service a répondu (données inattendues...) : il n'est pas défaillant
+                self.breaker.record_success()
+                raise
+            else:
+                self.breaker.record_success()
+                return result
+
+    def _call_with_deadline(self, func: Callable, *args, **kwargs):
+        future = self.executor.submit(copy_context().run, func, *args, **kwargs)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise UpstreamTimeout(
+                f"Pas de réponse d'IMDb après {self.timeout:.1f} s"
+            ) from None
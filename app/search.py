@@ -0,0 +1,199 @@
+import logging
+import re
+
+from django.db import connection as default_connection
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+# Index plein texte SQLite (FTS5) : table virtuelle à contenu externe, synchronisée avec
+# `app_movie` par des triggers, y compris lors des insertions en lot.
+SQLITE_INDEX_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS app_movie_fts USING fts5(
+        title, summary,
+        content='app_movie', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS app_movie_fts_insert AFTER INSERT ON app_movie BEGIN
+        INSERT INTO app_movie_fts(rowid, title, summary)
+        VALUES (new.id, new.title, new.summary);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS app_movie_fts_delete AFTER DELETE ON app_movie BEGIN
+        INSERT INTO app_movie_fts(app_movie_fts, rowid, title, summary)
+        VALUES ('delete', old.id, old.title, old.summary);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS app_movie_fts_update AFTER UPDATE OF title, summary
+    ON app_movie BEGIN
+        INSERT INTO app_movie_fts(app_movie_fts, rowid, title, summary)
+        VALUES ('delete', old.id, old.title, old.summary);
+        INSERT INTO app_movie_fts(rowid, title, summary)
+        VALUES (new.id, new.title, new.summary);
+    END
+    """,
+]
+SQLITE_REBUILD_SQL = "INSERT INTO app_movie_fts(app_movie_fts) VALUES ('rebuild')"
+SQLITE_DROP_SQL = [
+    "DROP TRIGGER IF EXISTS app_movie_fts_insert",
+    "DROP TRIGGER IF EXISTS app_movie_fts_delete",
+    "DROP TRIGGER IF EXISTS app_movie_fts_update",
+    "DROP TABLE IF EXISTS app_movie_fts",
+]
+
+# Index plein texte PostgreSQL : index GIN sur une expression, tenu à jour par PostgreSQL.
+# La requête de recherche doit reprendre exactement la même expression pour l'utiliser.
+POSTGRESQL_DOCUMENT = (
+    "to_tsvector('simple', coalesce(app_movie.title, '') || ' ' "
+    "|| coalesce(app_movie.summary, ''))"
+)
+POSTGRESQL_INDEX_SQL = [
+    "CREATE INDEX IF NOT EXISTS app_movie_search_idx ON app_movie "
+    "USING GIN ((to_tsvector('simple', coalesce(title, '') || ' ' "
+    "|| coalesce(summary, ''))))",
+]
+POSTGRESQL_DROP_SQL = ["DROP INDEX IF EXISTS app_movie_search_idx"]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def is_supported(connection=default_connection) -> bool:
+    """Indique si la recherche indexée est disponible pour ce moteur de base de données."""
+
+    return connection.vendor in ("sqlite", "postgresql")
+
+
+def install_search_index(connection=default_connection, rebuild=False) -> None:
+    """
+    Crée l'index plein texte des films s'il n'existe pas (opération idempotente).
+
+    Sous SQLite, les triggers sont recréés s'ils ont disparu (par exemple lorsqu'une migration
+    reconstruit la table `app_movie`).
+
+    Args:
+        connection: Connexion à la base de données.
+        rebuild (bool): Réindexe l'ensemble du catalogue (SQLite uniquement).
+    """
+    if connection.vendor == "sqlite":
+        statements = SQLITE_INDEX_SQL + ([SQLITE_REBUILD_SQL] if rebuild else [])
+    elif connection.vendor == "postgresql":
+        statements = POSTGRESQL_INDEX_SQL
+    else:
+        logging.warning(
+            f"Recherche plein texte non disponible pour le moteur {connection.vendor}"
+        )
+        return
+
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def drop_search_index(connection=default_connection) -> None:
+    """Supprime l'index plein texte des films."""
+
+    statements = {"sqlite": SQLITE_DROP_SQL, "postgresql": POSTGRESQL_DROP_SQL}
+    with connection.cursor() as cursor:
+        for statement in statements.get(connection.vendor, []):
+            cursor.execute(statement)
+
+
+def to_fts5_query(text: str) -> str:
+    """
+    Convertit une saisie utilisateur en requête FTS5 sûre.
+
+    Chaque mot est cité (la syntaxe FTS5 de la saisie n'est donc pas interprétée), tous les mots
+    sont requis et le dernier est recherché comme préfixe pour la saisie incrémentale.
+
+    Args:
+        text (str): Saisie de l'utilisateur.
+
+    Returns:
+        str: Requête FTS5, vide si la saisie ne contient aucun mot.
+    """
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return ""
+    quoted = [f'"{token}"' for token in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _order_by_rank(queryset):
+    """
+    Trie les résultats d'une recherche par pertinence, sans écraser un tri déjà demandé.
+
+    Un tri explicite (par exemple `?ordering=`) reste prioritaire et la pertinence ne sert qu'à
+    départager les ex aequo, avant l'identifiant qui garantit un ordre déterministe.
+    """
+    ordering = [field for field in queryset.query.order_by if field != "id"]
+    return queryset.order_by(*ordering, "search_rank", "id")
+
+
+def search_movies(queryset, text: str, connection=default_connection):
+    """
+    Filtre un QuerySet de films par recherche plein texte sur le titre et le résumé.
+
+    Les résultats sont annotés d'un score `search_rank` (plus petit = plus pertinent) et triés
+    par pertinence, sauf si le QuerySet est déjà trié sur un autre champ que l'identifiant : ce
+    tri est conservé et la pertinence ne départage que les ex aequo. Sous SQLite, le QuerySet
+    obtenu joint la table FTS5 par son nom : il ne doit pas être utilisé comme sous-requête.
+    Les moteurs sans index plein texte recherchent chaque mot dans le titre ou le résumé
+    (`icontains`), sans index ni pertinence.
+
+    Args:
+        queryset: QuerySet de films à filtrer.
+        text (str): Texte recherché.
+        connection: Connexion à la base de données.
+
+    Returns:
+        QuerySet: Films correspondant à la recherche.
+    """
+    if connection.vendor == "sqlite":
+        fts_query = to_fts5_query(text)
+        if not fts_query:
+            return queryset.none()
+        # Jointure avec la table FTS5 : le score `rank` (bm25) est calculé une seule fois par
+        # film trouvé, là où une sous-requête corrélée réévaluerait la recherche pour chaque film.
+        return _order_by_rank(
+            queryset.extra(
+                tables=["app_movie_fts"],
+                where=["app_movie_fts.rowid = app_movie.id", "app_movie_fts MATCH %s"],
+                params=[fts_query],
+                select={"search_rank": "app_movie_fts.rank"},
+            )
+        )
+
+    if connection.vendor == "postgresql":
+        return _order_by_rank(
+            queryset.filter(
+                RawSQL(
+                    f"{POSTGRESQL_DOCUMENT} @@ websearch_to_tsquery('simple', %s)",
+                    (text,),
+                    output_field=BooleanField(),
+                )
+            ).annotate(
+                search_rank=RawSQL(
+                    f"-ts_rank({POSTGRESQL_DOCUMENT}, websearch_to_tsquery('simple', %s))",
+                    (text,),
+                    output_field=FloatField(),
+                )
+            )
+        )
+
+    # Autres moteurs : recherche non indexée de chaque mot dans le titre ou le résumé, sans
+    # score de pertinence (tous les films trouvés sont ex aequo)
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return queryset.none()
+    for token in tokens:
+        queryset = queryset.filter(
+            Q(title__icontains=token) | Q(summary__icontains=token)
+        )
+    return _order_by_rank(
+        queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+    )
@@ -1,35 +1,60 @@
 import logging
 
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
 from rest_framework import serializers
-from .models import Movie, Director, Producer, Actor, Category
+from . import export
+from .instrumentation import timed
+from .models import Movie, Person, Credit, Category, ImportJob
+from .utils import format_duration, parse_duration
 
 
-class PersonBaseSerializer(serializers.ModelSerializer):
-    """Sérializer de base gérant les données liées à des personnes"""
+class MovieDurationField(serializers.Field):
+    """Durée d'un film, stockée en minutes et présentée au format "2h28".
 
-    class Meta:
-        fields = ("name", "imdb_id")
+    En écriture, accepte un nombre de minutes ou une durée au format heures/minutes.
+    """
+
+    def to_representation(self, value):
+        return format_duration(value)
+
+    def to_internal_value(self, data):
+        try:
+            return parse_duration(data)
+        except (TypeError, ValueError):
+            raise serializers.ValidationError(
+                "La durée doit être un nombre de minutes ou au format '2h28'."
+            )
 
 
-class DirectorSerializer(PersonBaseSerializer):
-    """Serializer pour le modèle Director."""
+class PersonSerializer(serializers.ModelSerializer):
+    """Sérialiseur pour le modèle Person, utilisé pour chaque rôle d'un film."""
 
-    class Meta(PersonBaseSerializer.Meta):
-        model = Director
+    class Meta:
+        model = Person
+        fields = ("name", "imdb_id")
+        # Les personnes existantes sont résolues en lot dans `MovieDetailSerializer.create` :
+        # le contrôle d'unicité (une requête par personne) rejetterait à tort une personne déjà connue.
+        extra_kwargs = {"imdb_id": {"validators": []}}
 
 
-class ProducerSerializer(PersonBaseSerializer):
-    """Serializer pour le modèle Producer."""
+class PersonDetailSerializer(serializers.ModelSerializer):
+    """Sérialiseur du détail d'une personne, avec son nombre de films par rôle.
 
-    class Meta(PersonBaseSerializer.Meta):
-        model = Producer
+    Les nombres sont lus dans les annotations de `PersonQuerySet.with_credit_counts`.
+    """
 
+    credits = serializers.SerializerMethodField()
 
-class ActorSerializer(PersonBaseSerializer):
-    """Serializer fpour le modèle Acteur."""
+    class Meta:
+        model = Person
+        fields = ("imdb_id", "name", "credits")
 
-    class Meta(PersonBaseSerializer.Meta):
-        model = Actor
+    def get_credits(self, person):
+        return {
+            role: getattr(person, f"{role}_count") for role, _ in Credit.ROLE_CHOICES
+        }
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -43,18 +68,16 @@ class CategorySerializer(serializers.ModelSerializer):
         """
         Personnalise la méthode to_internal_value pour gérer l'existence de catégories.
 
-        Cette méthode est redéfinie pour vérifier l'existence des catégories avant leur création,
-        afin de prévenir les erreurs dues à la contrainte d'unicité sur le champ 'name'.
-        Lors de la validation, le sérialiseur essaierait de créer une nouvelle catégorie pour chaque
-        entrée, même si celle-ci existe déjà, ce qui provoque une erreur de duplicata.
-        Nous vérifions donc l'existence de la catégorie à ce stade et récupérons l'instance existante
-        si elle est déjà en base, sinon on passe pour permettre la création.
+        Cette méthode est redéfinie pour court-circuiter la contrainte d'unicité sur le champ 'name' :
+        lors de la validation, le sérialiseur rejetterait toute catégorie déjà présente en base.
+        L'existence des catégories n'est pas vérifiée ici (ce qui coûterait une requête par
+        catégorie) : elles sont résolues en une seule requête lors de la création du film.
 
         Args:
             data (str|dict): Données passées au sérialiseur pour le champ 'name' de la catégorie.
 
         Returns:
-            dict: Instance de catégorie (sous forme de dict) ou données sous forme de dict.
+            dict: Données de la catégorie sous forme de dict.
 
         Raises:
             serializers.ValidationError: Si le champ 'name' est vide.
@@ -69,36 +92,134 @@ class CategorySerializer(serializers.ModelSerializer):
                 "Le nom de la catégorie doit être fourni."
             )
 
-        try:
-            category = Category.objects.get(name=name)
-            return {
-                "name": category.name,
-                "id": category.id,
-            }  # Retourne les données formatées
-        except Category.DoesNotExist:
-            return {"name": name}  # Permet la création d'une nouvelle catégorie
+        return {"name": name}
+
+
+class TimedListSerializer(serializers.ListSerializer):
+    """Liste sérialisée dont la durée est mesurée (étape `serialize`, voir `app.instrumentation`)."""
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+class TimedSerializerMixin:
+    """Mesure la durée de sérialisation d'un objet (étape `serialize`).
+
+    Avec `many=True`, la mesure est faite par la liste : déclarer
+    `list_serializer_class = TimedListSerializer` dans la classe `Meta`.
+    """
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+class SparseFieldsetMixin:
+    """Restreint les champs rendus à ceux demandés (`fields`) et y ajoute des champs étendus
+    (`expand`).
+
+    Sans `fields`, les champs rendus sont ceux de `Meta.default_fields` (à défaut, tous ceux de
+    `Meta.fields`). Les champs écartés sont retirés du sérialiseur : ils ne sont ni lus ni rendus.
+    """
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        rendered = self.rendered_fields(fields, expand)
+        for name in set(self.fields) - rendered:
+            self.fields.pop(name)
+
+    @classmethod
+    def available_fields(cls) -> tuple:
+        """Champs pouvant être demandés par `fields` ou `expand`."""
+
+        return cls.Meta.fields
+
+    @classmethod
+    def rendered_fields(cls, fields=None, expand=None) -> set:
+        """Champs rendus pour les champs demandés et étendus."""
+
+        default = getattr(cls.Meta, "default_fields", cls.Meta.fields)
+        return set(fields or default) | set(expand or ())
+
+    @classmethod
+    def rendered_sources(cls, fields=None, expand=None) -> list:
+        """Attributs des objets lus par les champs rendus (`duration` lit `duration_minutes`)."""
 
+        serializer = cls(fields=fields, expand=expand)
+        return [field.source for field in serializer.fields.values()]
 
-class MovieListSerializer(serializers.ModelSerializer):
-    """Sérialiseur pour lister les films avec informations minimales, incluant les catégories."""
+
+class MovieListSerializer(
+    SparseFieldsetMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
+    """Sérialiseur pour lister les films avec informations minimales, incluant les catégories.
+
+    Le résumé, la durée, l'identifiant IMDb et les personnes de chaque rôle ne sont rendus que
+    sur demande (`?expand=directors,summary`).
+    """
 
     categories = serializers.SlugRelatedField(
         many=True, read_only=True, slug_field="name"
     )
+    duration = MovieDurationField(source="duration_minutes", read_only=True)
+    directors = PersonSerializer(many=True, read_only=True)
+    producers = PersonSerializer(many=True, read_only=True)
+    actors = PersonSerializer(many=True, read_only=True)
 
     class Meta:
         model = Movie
-        fields = ("id", "title", "poster_url", "categories")
+        fields = (
+            "id",
+            "imdb_id",
+            "title",
+            "duration",
+            "summary",
+            "poster_url",
+            "directors",
+            "producers",
+            "actors",
+            "categories",
+        )
+        default_fields = ("id", "title", "poster_url", "categories")
+        list_serializer_class = TimedListSerializer
 
 
-class MovieDetailSerializer(serializers.ModelSerializer):
+class FilmographySerializer(MovieListSerializer):
+    """Sérialiseur d'un film de la filmographie d'une personne, avec les rôles qu'elle y tient.
+
+    Les rôles sont lus dans les crédits de la personne préchargés dans `person_credits`.
+    """
+
+    roles = serializers.SerializerMethodField()
+
+    class Meta(MovieListSerializer.Meta):
+        fields = MovieListSerializer.Meta.fields + ("roles",)
+        default_fields = MovieListSerializer.Meta.default_fields + ("roles",)
+
+    def get_roles(self, movie):
+        return [credit.role for credit in movie.person_credits]
+
+
+class MovieDetailSerializer(
+    SparseFieldsetMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
     """Sérialiseur détaillé pour le modèle Movie, intégrant les relations
-    avec réalisateurs, producteurs, acteurs et catégories."""
+    avec réalisateurs, producteurs, acteurs et catégories.
+
+    Les trois listes de personnes sont lues dans les crédits du film (`Movie.credited`) :
+    préchargés par `MovieQuerySet.with_details`, ils sont récupérés en une seule requête.
+    """
 
-    directors = DirectorSerializer(many=True)
-    producers = ProducerSerializer(many=True)
-    actors = ActorSerializer(many=True)
+    directors = PersonSerializer(many=True)
+    producers = PersonSerializer(many=True)
+    actors = PersonSerializer(many=True)
     categories = CategorySerializer(many=True)
+    duration = MovieDurationField(
+        source="duration_minutes", required=False, allow_null=True
+    )
 
     class Meta:
         model = Movie
@@ -116,32 +237,135 @@ class MovieDetailSerializer(serializers.ModelSerializer):
         )
 
     def create(self, validated_data):
-        """Crée une instance de film en effectuant les relations ManyToMany pour les sous-modèles."""
+        """
+        Crée une instance de film avec ses crédits et ses catégories.
+
+        Les personnes de tous les rôles et les catégories existantes sont résolues par une requête
+        IN par table, les manquantes sont insérées en lot, et les crédits sont écrits en une seule
+        insertion, avec leur rang dans l'ordre reçu. Le tout est exécuté dans une transaction : le
+        nombre de requêtes ne dépend pas de la taille du casting.
+        """
 
-        directors_data = validated_data.pop("directors")
-        producers_data = validated_data.pop("producers")
-        actors_data = validated_data.pop("actors")
+        people_data = {
+            role: validated_data.pop(field)
+            for role, field in Credit.ROLE_FIELDS.items()
+        }
         categories_data = validated_data.pop("categories")
 
-        movie = Movie.objects.create(**validated_data)
+        with transaction.atomic():
+            movie = Movie.objects.create(**validated_data)
+
+            people = self._get_or_create_people(
+                [person for data in people_data.values() for person in data]
+            )
+            credits = []
+            for role, data in people_data.items():
+                credited = set()
+                for person_data in data:
+                    person = people.get(self._person_key(person_data))
+                    if person is None or person.pk in credited:
+                        continue
+                    credits.append(
+                        Credit(
+                            movie=movie,
+                            person=person,
+                            role=role,
+                            billing_order=len(credited),
+                        )
+                    )
+                    credited.add(person.pk)
+            Credit.objects.bulk_create(credits)
+            movie.categories.add(*self._get_or_create_categories(categories_data))
+
+        return movie
 
-        for director_data in directors_data:
-            director, _ = Director.objects.get_or_create(**director_data)
-            movie.directors.add(director)
+    @staticmethod
+    def _person_key(person_data):
+        """Clé d'une personne : son identifiant IMDb, ou à défaut son nom."""
 
-        for producer_data in producers_data:
-            producer, _ = Producer.objects.get_or_create(**producer_data)
-            movie.producers.add(producer)
+        imdb_id = person_data.get("imdb_id") or None
+        return ("imdb_id", imdb_id) if imdb_id else ("name", person_data["name"])
 
-        for actor_data in actors_data:
-            actor, _ = Actor.objects.get_or_create(**actor_data)
-            movie.actors.add(actor)
+    @classmethod
+    def _get_or_create_people(cls, people_data):
+        """
+        Récupère ou crée en lot des personnes, quels que soient leurs rôles.
 
-        for category_data in categories_data:
-            category, _ = Category.objects.get_or_create(name=category_data["name"])
-            movie.categories.add(category)
+        Les personnes sont identifiées par leur identifiant IMDb, ou à défaut par leur nom.
 
-        return movie
+        Args:
+            people_data (list[dict]): Données validées des personnes.
+
+        Returns:
+            dict: Instances des personnes par clé (voir `_person_key`).
+        """
+
+        if not people_data:
+            return {}
+
+        data_by_key = {}
+        for person_data in people_data:
+            data_by_key.setdefault(
+                cls._person_key(person_data),
+                {
+                    "name": person_data["name"],
+                    "imdb_id": person_data.get("imdb_id") or None,
+                },
+            )
+
+        def lookup(wanted_keys):
+            imdb_ids = [value for kind, value in wanted_keys if kind == "imdb_id"]
+            names = [value for kind, value in wanted_keys if kind == "name"]
+            query = Q(imdb_id__in=imdb_ids) | Q(imdb_id__isnull=True, name__in=names)
+            found = {}
+            for person in Person.objects.filter(query):
+                key = (
+                    ("imdb_id", person.imdb_id)
+                    if person.imdb_id
+                    else ("name", person.name)
+                )
+                found.setdefault(key, person)
+            return found
+
+        people = lookup(data_by_key)
+        missing = [key for key in data_by_key if key not in people]
+        if missing:
+            # `ignore_conflicts` protège contre une insertion concurrente de la même personne,
+            # mais ne renseigne pas les clés primaires : les personnes créées sont relues.
+            Person.objects.bulk_create(
+                [Person(**data_by_key[key]) for key in missing], ignore_conflicts=True
+            )
+            people.update(lookup(missing))
+
+        return people
+
+    @staticmethod
+    def _get_or_create_categories(categories_data):
+        """
+        Récupère ou crée en lot les catégories à partir de leur nom.
+
+        Args:
+            categories_data (list[dict]): Données validées des catégories.
+
+        Returns:
+            list[Category]: Instances des catégories, sans doublon.
+        """
+
+        names = list(dict.fromkeys(data["name"] for data in categories_data))
+        if not names:
+            return []
+
+        categories = {c.name: c for c in Category.objects.filter(name__in=names)}
+        missing = [name for name in names if name not in categories]
+        if missing:
+            Category.objects.bulk_create(
+                [Category(name=name) for name in missing], ignore_conflicts=True
+            )
+            categories.update(
+                {c.name: c for c in Category.objects.filter(name__in=missing)}
+            )
+
+        return [categories[name] for name in names if name in categories]
 
 
 class MovieSearchRequestSerializer(serializers.Serializer):
@@ -154,6 +378,53 @@ class MovieSearchRequestSerializer(serializers.Serializer):
     )
 
 
+class MovieExportRequestSerializer(serializers.Serializer):
+    """Sérialiseur des paramètres d'export du catalogue.
+
+    Le format est passé dans `output` : le paramètre `format` est réservé par DRF au choix du
+    rendu de la réponse.
+    """
+
+    output = serializers.ChoiceField(
+        choices=[export.NDJSON, export.CSV], required=False, default=export.NDJSON
+    )
+
+
+class FilmographyRequestSerializer(serializers.Serializer):
+    """Sérialiseur des paramètres de la filmographie d'une personne."""
+
+    role = serializers.ChoiceField(choices=Credit.ROLE_CHOICES, required=False)
+
+
+class SparseFieldsetRequestSerializer(serializers.Serializer):
+    """Sérialiseur des paramètres `fields` et `expand` : noms de champs séparés par des virgules.
+
+    Les champs acceptés sont passés dans le contexte (`available`).
+    """
+
+    fields = serializers.CharField(required=False, allow_blank=True)
+    expand = serializers.CharField(required=False, allow_blank=True)
+
+    def _field_names(self, value):
+        names = list(
+            dict.fromkeys(name.strip() for name in value.split(",") if name.strip())
+        )
+        available = self.context["available"]
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise serializers.ValidationError(
+                f"Champ(s) inconnu(s) : {', '.join(unknown)}. "
+                f"Champs disponibles : {', '.join(available)}."
+            )
+        return names
+
+    def validate_fields(self, value):
+        return self._field_names(value)
+
+    def validate_expand(self, value):
+        return self._field_names(value)
+
+
 class MovieAddRequestSerializer(serializers.Serializer):
     """Sérialiseur pour requêtes d'ajout de film par identifiant IMDb."""
 
@@ -165,3 +436,44 @@ class MovieAddRequestSerializer(serializers.Serializer):
             "max_length": "Assurez-vous que ce champ ne comporte pas plus de 10 caractères.",
         },
     )
+    refresh = serializers.BooleanField(required=False, default=False, write_only=True)
+    background = serializers.BooleanField(
+        required=False, default=False, write_only=True
+    )
+
+
+class MovieBulkAddRequestSerializer(serializers.Serializer):
+    """Sérialiseur pour requêtes d'ajout de plusieurs films par identifiants IMDb."""
+
+    imdb_ids = serializers.ListField(
+        child=serializers.CharField(
+            max_length=10,
+            error_messages={
+                "blank": "L'identifiant IMDb de ce film ne peut être vide",
+                "max_length": "Assurez-vous que ce champ ne comporte pas plus de 10 caractères.",
+            },
+        ),
+        allow_empty=False,
+        max_length=settings.MOVIE_BULK_ADD_MAX_IDS,
+        error_messages={"empty": "La liste des identifiants IMDb ne peut être vide."},
+    )
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    """Sérialiseur pour le suivi d'une tâche d'import de film en arrière-plan."""
+
+    class Meta:
+        model = ImportJob
+        fields = (
+            "id",
+            "imdb_id",
+            "status",
+            "result",
+            "error",
+            "attempts",
+            "movie",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+        read_only_fields = fields
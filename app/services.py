@@ -1,92 +1,236 @@
-import os
 import logging
-from injector import singleton
-from imdb import Cinemagoer, IMDbError
-from imdbinfo.services import get_movie
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, connections, transaction
+from injector import inject, singleton
+from imdb import IMDbError
+from typing import Callable, Iterable, List, Dict, Optional
+
+from .cache import MovieDetailsStore, build_search_cache
+from .instrumentation import measured_queries, timed
+from .metrics import record_imdb_call, track_imdb_call
+from .models import Movie
+from .providers import IMDbProvider, build_provider
+from .resilience import CircuitOpenError, Resilience, UpstreamTimeout
+from .serializers import MovieDetailSerializer
+from .singleflight import SingleFlight, distributed_lock
+
+
+def call_with_db_cleanup(close_all: bool, func, *args, **kwargs):
+    """
+    Exécute une fonction dans un thread de pool, en libérant ses connexions à la base.
+
+    Django ne ferme les connexions qu'en fin de requête, pour le thread de la requête : celles
+    ouvertes par un thread de pool (cache persistant des détails) doivent l'être ici. Les requêtes
+    SQL du thread sont comptées dans les mesures de la requête HTTP en cours.
+
+    Args:
+        close_all (bool): Ferme toutes les connexions du thread après l'appel (pool temporaire),
+            ou seulement les connexions périmées (pool permanent, dont les threads réutilisent
+            leurs connexions).
+        func: Fonction exécutée, avec ses arguments.
+    """
+    close_old_connections()
+    try:
+        with measured_queries():
+            return func(*args, **kwargs)
+    finally:
+        if close_all:
+            connections.close_all()
+        else:
+            close_old_connections()
 
 
 @singleton
 class IMDbService:
     """Service pour interagir avec IMDb et récupérer des données de film."""
 
-    def __init__(self):
-        """Initialise le service IMDb en configurant l'API Cinemagoer."""
+    @inject
+    def __init__(self, provider: Optional[IMDbProvider] = None):
+        """
+        Initialise le service IMDb avec sa source de données et ses caches.
 
-        self.ia = Cinemagoer()
+        Args:
+            provider (Optional[IMDbProvider]): Source des données (par défaut, celle décrite par
+                `IMDB_PROVIDER`).
+        """
+
+        self.provider = provider or build_provider(settings.IMDB_PROVIDER)
+        self.search_cache = build_search_cache()
+        self.details_store = MovieDetailsStore()
+        self.single_flight = SingleFlight()
+        self.resilience = Resilience.from_settings(settings.IMDB_RESILIENCE)
+        self.search_limit = settings.IMDB_SEARCH_LIMIT
 
-    def search_movie(
-        self, title: str, limit: int = int(os.getenv("SEARCH_FILM_LIMIT"))
-    ) -> List[Dict]:
+    def warm_up(self) -> None:
+        """
+        Prépare la source des données IMDb (imports des bibliothèques, client) avant la première
+        requête, par exemple dans le processus maître d'un serveur pre-fork (voir `IMDB_WARM_UP`).
+        """
+        self.provider.warm_up()
+
+    @timed("imdb")
+    def search_movie(self, title: str, limit: Optional[int] = None) -> List[Dict]:
         """
         Recherche des films sur IMDb par titre.
 
+        Les résultats sont mis en cache (voir `IMDB_SEARCH_CACHE`) : une recherche identique,
+        à la casse et aux espaces près, est servie sans interroger IMDb. Les recherches identiques
+        simultanées partagent une seule interrogation d'IMDb.
+
         Args:
             title (str): Le titre du film à rechercher.
-            limit (int): Nombre maximum de films à retourner.
+            limit (Optional[int]): Nombre maximum de films à retourner (par défaut
+                `IMDB_SEARCH_LIMIT`).
 
         Returns:
             List[Dict]: Liste de dictionnaires contenant les détails des films trouvés.
 
         Raises:
             IMDbError: Si une erreur se produit avec l'API IMDb.
+            UpstreamTimeout: Si IMDb n'a pas répondu dans le délai imparti.
+            CircuitOpenError: Si IMDb est considéré comme indisponible (voir `IMDB_RESILIENCE`).
             RuntimeError: Pour d'autres erreurs lors de la recherche.
         """
         logging.info(f"Recherche du film {title}")
 
+        if limit is None:
+            limit = self.search_limit
+        started = time.perf_counter()
+        cached = self.search_cache.get(title, limit)
+        if cached is not None:
+            logging.debug(f"Résultats de recherche servis depuis le cache pour {title}")
+            record_imdb_call("search_movie", "cache_hit", time.perf_counter() - started)
+            return cached
+
+        key = self.search_cache.make_key(title, limit)
+        with track_imdb_call("search_movie"):
+            return self._coalesce(
+                f"search:{key}",
+                lookup=lambda: self.search_cache.get(title, limit),
+                fetch=lambda: self._search_movie(title, limit),
+            )
+
+    def _search_movie(self, title: str, limit: int) -> List[Dict]:
+        """
+        Recherche des films directement sur IMDb et met les résultats en cache.
+
+        Args:
+            title (str): Le titre du film à rechercher.
+            limit (int): Nombre maximum de films à retourner.
+
+        Returns:
+            List[Dict]: Liste de dictionnaires contenant les détails des films trouvés.
+        """
         try:
-            results = self.ia.search_movie(title)
-            movies_data = [
-                {
-                    "imdb_id": movie.movieID,
-                    "title": movie.get("title", ""),
-                    "poster_url": movie.get("cover url", ""),
-                }
-                for movie in results[:limit]
-            ]
+            movies_data = self.resilience.call(self.provider.search, title, limit)
 
+            self.search_cache.set(title, limit, movies_data)
             return movies_data
         except IMDbError as e:
             logging.exception(f"Erreur provenant de IMDb: {e}")
             raise e
+        except (CircuitOpenError, UpstreamTimeout) as e:
+            logging.warning(f"Recherche IMDb impossible pour {title}: {e}")
+            raise
         except Exception as e:
             logging.exception(
                 f"Erreur inconnue survenue lors de la recherche IMDb: {str(e)}"
             )
             raise RuntimeError("Erreur survenue lors de l'interaction avec IMDb") from e
 
-    def get_movie_details(self, imdb_id: str) -> Dict:
+    @timed("imdb")
+    def get_movie_details(self, imdb_id: str, refresh: bool = False) -> Dict:
         """
         Récupère les détails complets d'un film selon son ID IMDb.
 
+        Les détails récupérés sont conservés dans un cache persistant (voir
+        `IMDB_DETAILS_CACHE_TTL`) : tant qu'ils sont frais, IMDb n'est pas interrogé. Les demandes
+        simultanées pour un même film partagent une seule récupération.
+
         Args:
             imdb_id (str): L'identifiant IMDb du film.
+            refresh (bool): Ignore le cache et force la récupération depuis IMDb.
 
         Returns:
             Dict: Détails du film sous forme de dictionnaire.
 
         Raises:
-            IMDbError: Si une erreur se produit avec l'API IMDb.
+            UpstreamTimeout: Si IMDb n'a pas répondu dans le délai imparti.
+            CircuitOpenError: Si IMDb est considéré comme indisponible (voir `IMDB_RESILIENCE`).
             RuntimeError: Pour d'autres erreurs lors de la récupération des détails.
         """
-        try:
-            # movie = web.get_title(imdb_id)
-            movie = get_movie(imdb_id)
-
-            return {
-                "imdb_id": imdb_id,
-                "title": getattr(movie, "title", "N/A"),
-                "duration": self.format_runtime(getattr(movie, "duration", "N/A")),
-                "summary": getattr(movie, "plot", "N/A"),
-                "poster_url": getattr(movie, "cover_url", "N/A"),
-                "directors": self._extract_people(getattr(movie, "directors", [])),
-                "producers": self._extract_people(getattr(movie, "producers", [])),
-                "actors": self._extract_people(getattr(movie, "stars", [])[:10]),
-                "categories": [
-                    {"name": genre} for genre in getattr(movie, "genres", [])
-                ],
-            }
+        started = time.perf_counter()
+        if not refresh:
+            cached = self.details_store.get(imdb_id)
+            if cached is not None:
+                logging.debug(f"Détails du film {imdb_id} servis depuis le cache")
+                record_imdb_call(
+                    "get_movie_details", "cache_hit", time.perf_counter() - started
+                )
+                return cached
+
+        def fetch():
+            movie_details = self._fetch_movie_details(imdb_id)
+            self.details_store.set(imdb_id, movie_details)
+            return movie_details
+
+        with track_imdb_call("get_movie_details"):
+            return self._coalesce(
+                f"details:{imdb_id}",
+                lookup=lambda: None if refresh else self.details_store.get(imdb_id),
+                fetch=fetch,
+            )
+
+    def _coalesce(self, key: str, lookup, fetch):
+        """
+        Regroupe les récupérations identiques simultanées auprès d'IMDb.
+
+        Dans un même processus, les appels simultanés portant la même clé partagent une seule
+        exécution de `fetch`. Si `IMDB_SINGLE_FLIGHT["DISTRIBUTED"]` est activé, un verrou posé
+        dans le cache Django les regroupe aussi entre processus : une fois le verrou obtenu,
+        `lookup` est consulté pour réutiliser le résultat mis en cache par un autre processus.
+
+        Args:
+            key (str): Clé identifiant la récupération.
+            lookup (Callable): Consulte le cache, retourne None en cas d'absence.
+            fetch (Callable): Interroge IMDb et met le résultat en cache.
+
+        Returns:
+            Résultat de `lookup` ou de `fetch`.
+        """
 
+        def run():
+            if not settings.IMDB_SINGLE_FLIGHT.get("DISTRIBUTED", False):
+                return fetch()
+            with distributed_lock(key) as acquired:
+                cached = lookup() if acquired else None
+                return cached if cached is not None else fetch()
+
+        return self.single_flight.do(key, run)
+
+    def _fetch_movie_details(self, imdb_id: str) -> Dict:
+        """
+        Récupère les détails d'un film directement depuis IMDb.
+
+        Args:
+            imdb_id (str): L'identifiant IMDb du film.
+
+        Returns:
+            Dict: Détails du film sous forme de dictionnaire.
+
+        Raises:
+            UpstreamTimeout: Si IMDb n'a pas répondu dans le délai imparti.
+            CircuitOpenError: Si IMDb est considéré comme indisponible.
+            RuntimeError: Si la récupération des détails échoue.
+        """
+        try:
+            return self.resilience.call(self.provider.details, imdb_id)
+        except (CircuitOpenError, UpstreamTimeout) as e:
+            logging.warning(f"Récupération impossible du film {imdb_id}: {e}")
+            raise
         except Exception as e:
             logging.exception(
                 f"Erreur lors de la récupération des détails du film (IMDb Id: {imdb_id})."
@@ -95,40 +239,170 @@ class IMDbService:
                 "Erreur lors de la récupération des détails du film"
             ) from e
 
-    def format_runtime(self, runtime):
+
+@singleton
+class MovieImportService:
+    """Service pour importer des films depuis IMDb dans le catalogue."""
+
+    STATUS_CREATED = "created"
+    STATUS_EXISTS = "exists"
+    STATUS_FAILED = "failed"
+
+    @inject
+    def __init__(self, imdb_service: IMDbService):
+        """Initialise le service d'import avec le service IMDb utilisé pour les récupérations."""
+
+        self.imdb_service = imdb_service
+
+    def import_movie(
+        self,
+        imdb_id: str,
+        refresh: bool = False,
+        on_step: Optional[Callable[[str], None]] = None,
+    ) -> Dict:
         """
-        Formate la durée d'un film.
+        Importe un film à partir de son identifiant IMDb.
 
         Args:
-            runtime (int | str): La durée du film en minutes.
+            imdb_id (str): Identifiant IMDb du film.
+            refresh (bool): Ignore le cache des détails et force la récupération depuis IMDb.
+            on_step (Optional[Callable[[str], None]]): Appelée au début de chaque étape
+                ("fetching" puis "saving") pour suivre la progression.
 
         Returns:
-            str: La durée formatée en heures et minutes ("hh:mm").
+            Dict: Résultat de l'import, au même format que pour `bulk_import`.
         """
+        if Movie.objects.filter(imdb_id=imdb_id).exists():
+            return self._exists(imdb_id)
 
+        if on_step:
+            on_step("fetching")
         try:
-            q = int(runtime) // 60
-            r = int(runtime) % 60
-            return f"{q}h{r}"
+            movie_details = self.imdb_service.get_movie_details(
+                imdb_id, refresh=refresh
+            )
         except Exception as e:
-            logging.warning(f"Erreur dans le calcul du runtime ({e})", exc_info=True)
-            return "N/A"
+            return self._failure(imdb_id, str(e))
+
+        if on_step:
+            on_step("saving")
+        return self._save_batch([(imdb_id, movie_details)])[imdb_id]
 
-    def _extract_people(self, people) -> List[Dict]:
+    def bulk_import(self, imdb_ids: Iterable[str]) -> List[Dict]:
         """
-        Extrait une liste d'individus (réalisateurs, producteurs, acteurs).
+        Importe plusieurs films à partir de leurs identifiants IMDb.
+
+        Les films déjà présents sont écartés en une seule requête, les détails des autres sont
+        récupérés en parallèle par un pool borné de workers (`IMDB_FETCH_WORKERS`), puis
+        enregistrés par lots de `MOVIE_IMPORT_BATCH_SIZE` films, chaque lot dans une transaction.
+
+        Args:
+            imdb_ids (Iterable[str]): Identifiants IMDb des films à importer.
+
+        Returns:
+            List[Dict]: Résultat de l'import pour chaque identifiant, dans l'ordre reçu.
+        """
+        imdb_ids = list(dict.fromkeys(imdb_ids))
+        results = {}
+
+        existing = set(
+            Movie.objects.filter(imdb_id__in=imdb_ids).values_list("imdb_id", flat=True)
+        )
+        for imdb_id in existing:
+            results[imdb_id] = self._exists(imdb_id)
+
+        to_fetch = [imdb_id for imdb_id in imdb_ids if imdb_id not in existing]
+        logging.info(
+            f"Import de {len(to_fetch)} film(s) ({len(existing)} déjà présent(s))"
+        )
+
+        if to_fetch:
+            batch = []
+            with ThreadPoolExecutor(
+                max_workers=min(settings.IMDB_FETCH_WORKERS, len(to_fetch))
+            ) as executor:
+                futures = {
+                    # Chaque thread reprend le contexte de la requête (mesures de `timed`)
+                    executor.submit(
+                        copy_context().run,
+                        call_with_db_cleanup,
+                        True,
+                        self.imdb_service.get_movie_details,
+                        imdb_id,
+                    ): imdb_id
+                    for imdb_id in to_fetch
+                }
+                for future in as_completed(futures):
+                    imdb_id = futures[future]
+                    try:
+                        batch.append((imdb_id, future.result()))
+                    except Exception as e:
+                        results[imdb_id] = self._failure(imdb_id, str(e))
+                        continue
+
+                    if len(batch) >= settings.MOVIE_IMPORT_BATCH_SIZE:
+                        results.update(self._save_batch(batch))
+                        batch = []
+
+            if batch:
+                results.update(self._save_batch(batch))
+
+        return [results[imdb_id] for imdb_id in imdb_ids]
+
+    def _save_batch(self, batch) -> Dict[str, Dict]:
+        """
+        Enregistre un lot de films dans une même transaction.
+
+        Chaque film est enregistré dans son propre point de sauvegarde : l'échec de l'un
+        n'annule pas l'enregistrement des autres films du lot.
 
         Args:
-            people: Liste d'objets personnes récupérés de l'API IMDb.
+            batch (list[tuple[str, dict]]): Couples (identifiant IMDb, détails du film).
 
         Returns:
-            List[Dict]: Liste de dictionnaires contenant le nom et l'ID IMDb des personnes.
+            Dict[str, Dict]: Résultat de l'enregistrement pour chaque identifiant.
         """
+        results = {}
+        with transaction.atomic():
+            for imdb_id, movie_details in batch:
+                serializer = MovieDetailSerializer(data=movie_details)
+                if not serializer.is_valid():
+                    logging.error(
+                        f"Erreurs de validation lors de l'import du film {imdb_id} : {serializer.errors}"
+                    )
+                    results[imdb_id] = self._failure(imdb_id, serializer.errors)
+                    continue
+                try:
+                    with transaction.atomic():
+                        movie = serializer.save()
+                except IntegrityError:
+                    # Film enregistré entre-temps par un import concurrent
+                    results[imdb_id] = self._exists(imdb_id)
+                    continue
+                except Exception as e:
+                    logging.exception(
+                        f"Erreur lors de l'enregistrement du film {imdb_id}"
+                    )
+                    results[imdb_id] = self._failure(imdb_id, str(e))
+                    continue
+                results[imdb_id] = {
+                    "imdb_id": imdb_id,
+                    "status": self.STATUS_CREATED,
+                    "id": movie.id,
+                }
+        logging.info(f"Lot de {len(batch)} film(s) enregistré")
+        return results
+
+    def _exists(self, imdb_id: str) -> Dict:
+        """Construit le résultat de l'import d'un film déjà présent dans le catalogue."""
+
+        return {
+            "imdb_id": imdb_id,
+            "status": self.STATUS_EXISTS,
+            "detail": "Le film existe déjà dans le catalogue.",
+        }
+
+    def _failure(self, imdb_id: str, detail) -> Dict:
+        """Construit le résultat d'un import en échec."""
 
-        return [
-            {
-                "name": getattr(person, "name", "N/A"),
-                "imdb_id": getattr(person, "imdbId", "N/A"),
-            }
-            for person in people
-        ]
+        return {"imdb_id": imdb_id, "status": self.STATUS_FAILED, "detail": detail}
@@ -0,0 +1,101 @@
+import copy
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class _Call:
+    """Appel en cours, partagé entre l'appelant qui l'exécute et ceux qui l'attendent."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Regroupe les appels identiques simultanés d'un même processus en une seule exécution."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """
+        Exécute `func` une seule fois pour tous les appels simultanés portant la même clé.
+
+        Le premier appelant exécute la fonction ; les suivants attendent la fin de cette exécution
+        et reçoivent une copie de son résultat, ou la même exception.
+
+        Args:
+            key (Hashable): Clé identifiant l'appel.
+            func (Callable): Fonction à exécuter.
+
+        Returns:
+            Any: Résultat de la fonction.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            logging.debug(f"Appel {key} déjà en cours, attente de son résultat")
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+
+@contextmanager
+def distributed_lock(name: str):
+    """
+    Verrou partagé entre processus, posé dans le cache Django (voir `IMDB_SINGLE_FLIGHT`).
+
+    Le verrou repose sur l'opération atomique `cache.add` : il n'est réellement partagé que si le
+    cache configuré l'est (Redis, Memcached, base de données). Si le verrou n'a pas pu être obtenu
+    avant `WAIT_TIMEOUT`, le bloc est tout de même exécuté, sans verrou.
+
+    Args:
+        name (str): Nom du verrou.
+
+    Yields:
+        bool: True si le verrou a été obtenu.
+    """
+    config = settings.IMDB_SINGLE_FLIGHT
+    cache = caches[config.get("CACHE_ALIAS", "default")]
+    key = "imdb:lock:" + hashlib.sha1(name.encode()).hexdigest()
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + config.get("WAIT_TIMEOUT", 30)
+
+    acquired = cache.add(key, token, timeout=config.get("LOCK_TIMEOUT", 30))
+    while not acquired and time.monotonic() < deadline:
+        time.sleep(config.get("POLL_INTERVAL", 0.05))
+        acquired = cache.add(key, token, timeout=config.get("LOCK_TIMEOUT", 30))
+
+    if not acquired:
+        logging.warning(f"Verrou {name} non obtenu, exécution sans verrou")
+    try:
+        yield acquired
+    finally:
+        if acquired and cache.get(key) == token:
+            cache.delete(key)
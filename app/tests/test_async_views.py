@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+
+from .test_setup import TestModelSetup
+from ..models import ImportJob, Movie
+from ..services import IMDbService
+
+
+class TestAsyncMovieViews(TestModelSetup):
+    """Tests des endpoints asynchrones de recherche et d'ajout de films."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.search_url = reverse("movie-async_search_movie")
+        self.add_movie_url = reverse("movie-async_add_movie")
+
+    @patch.object(IMDbService, "search_movie")
+    async def test_search_movies_valid(self, mock_search_movie):
+        """Vérifie la recherche asynchrone avec un titre valide."""
+
+        mock_search_movie.return_value = [
+            {
+                "imdb_id": "tt0111161",
+                "title": "The Shawshank Redemption",
+                "poster_url": "http://example.com/shawshank.jpg",
+            }
+        ]
+        response = await self.async_client.get(self.search_url, {"title": "Shawshank"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), mock_search_movie.return_value)
+
+    async def test_search_movies_blank_title(self):
+        """Vérifie qu'une recherche asynchrone avec un titre vide est rejetée."""
+
+        response = await self.async_client.get(self.search_url, {"title": ""})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Le titre du film ne peut être vide.", response.json()["title"])
+
+    @patch.object(IMDbService, "search_movie")
+    async def test_search_movies_generic_exception(self, mock_search_movie):
+        """Vérifie la gestion des exceptions lors de la recherche asynchrone."""
+
+        mock_search_movie.side_effect = Exception("Erreur générique")
+        response = await self.async_client.get(self.search_url, {"title": "Inception"})
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @patch.object(IMDbService, "get_movie_details")
+    async def test_add_movie_success(self, mock_get_movie_details):
+        """Vérifie l'ajout asynchrone d'un nouveau film au catalogue."""
+
+        mock_get_movie_details.return_value = {
+            "imdb_id": "tt0068646",
+            "title": "The Godfather",
+            "duration": "2h55",
+            "summary": "Crime film.",
+            "poster_url": "http://example.com/godfather.jpg",
+            "directors": [{"name": "Francis Ford Coppola", "imdb_id": "nm0001123"}],
+            "producers": [{"name": "Albert S. Ruddy", "imdb_id": "nm0748918"}],
+            "actors": [{"name": "Marlon Brando", "imdb_id": "nm0000008"}],
+            "categories": [{"name": "Drama"}, {"name": "Crime"}],
+        }
+
+        response = await self.async_client.post(
+            self.add_movie_url,
+            {"imdb_id": "tt0068646"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json(), {"imdb_id": "tt0068646"})
+        self.assertTrue(await Movie.objects.filter(imdb_id="tt0068646").aexists())
+
+    @patch.object(IMDbService, "get_movie_details")
+    async def test_add_movie_duplicate(self, mock_get_movie_details):
+        """Vérifie que l'ajout asynchrone d'un film existant échoue sans appel à IMDb."""
+
+        response = await self.async_client.post(
+            self.add_movie_url,
+            {"imdb_id": self.movie_data_1["imdb_id"]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(
+            "Le film existe déjà dans le catalogue.", response.json()["detail"]
+        )
+        mock_get_movie_details.assert_not_called()
+
+    @patch.object(IMDbService, "get_movie_details")
+    async def test_add_movie_background(self, mock_get_movie_details):
+        """Vérifie que l'ajout asynchrone en arrière-plan crée une tâche sans appel à IMDb."""
+
+        response = await self.async_client.post(
+            self.add_movie_url,
+            {"imdb_id": "tt0068646", "background": True},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        data = response.json()
+        self.assertEqual(data["status"], ImportJob.STATUS_PENDING)
+        self.assertTrue(
+            data["status_url"].endswith(reverse("job-detail", args=[data["job_id"]]))
+        )
+        mock_get_movie_details.assert_not_called()
+
+        job = await ImportJob.objects.aget(id=data["job_id"])
+        self.assertEqual(job.imdb_id, "tt0068646")
+        self.assertFalse(await Movie.objects.filter(imdb_id="tt0068646").aexists())
+
+    async def test_add_movie_requires_post(self):
+        """Vérifie que l'ajout asynchrone n'accepte que la méthode POST."""
+
+        response = await self.async_client.get(self.add_movie_url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
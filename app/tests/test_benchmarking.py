@@ -0,0 +1,112 @@
+import contextlib
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import SimpleTestCase, TestCase
+
+from ..benchmarking import latency_summary, percentile
+from ..container import override, resolve
+from ..models import Credit, Movie
+from ..services import IMDbService
+
+
+class TestLatencyStatistics(SimpleTestCase):
+    """Tests du calcul des percentiles et du résumé des latences."""
+
+    def test_percentile(self):
+        """Vérifie l'interpolation entre deux valeurs et les cas limites."""
+
+        self.assertEqual(percentile([], 95), 0.0)
+        self.assertEqual(percentile([7.0], 50), 7.0)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+        self.assertEqual(percentile([4.0, 1.0, 3.0, 2.0], 50), 2.5)
+        self.assertEqual(percentile([1.0, 2.0, 3.0], 0), 1.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0], 100), 3.0)
+
+    def test_latency_summary(self):
+        self.assertEqual(
+            latency_summary([]),
+            {"count": 0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "mean_ms": None},
+        )
+        self.assertEqual(latency_summary([2.0, 4.0])["mean_ms"], 3.0)
+
+
+class TestBenchApiCommand(TestCase):
+    """Tests de la commande de mesure des endpoints des films."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.addCleanup(override, IMDbService, resolve(IMDbService))
+
+    # La base de test tient lieu de base jetable
+    @patch(
+        "app.management.commands.bench_api.throwaway_database", contextlib.nullcontext
+    )
+    def test_report(self):
+        """Vérifie le rapport JSON : chaque scénario réussit et ses requêtes SQL sont comptées."""
+
+        out = StringIO()
+        call_command(
+            "bench_api",
+            movies=[30],
+            iterations=1,
+            warmup=0,
+            cast_per_movie=3,
+            stdout=out,
+            stderr=StringIO(),
+        )
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["iterations"], 1)
+        self.assertEqual(report["cast_per_movie"], 3)
+        self.assertEqual(len(report["runs"]), 1)
+
+        run = report["runs"][0]
+        # Catalogue synthétique, plus les films ajoutés par le scénario `add`
+        self.assertGreaterEqual(run["movies"], 30)
+        self.assertEqual(
+            {result["scenario"] for result in run["results"]},
+            {
+                "list",
+                "list_last_page",
+                "detail",
+                "filter_category",
+                "filter_categories_all",
+                "filter_duration",
+                "search",
+                "facets",
+                "imdb_search",
+                "add",
+            },
+        )
+        for result in run["results"]:
+            with self.subTest(scenario=result["scenario"]):
+                self.assertLess(result["status"], 400)
+                # La recherche sur IMDb ne lit pas le catalogue
+                if result["scenario"] != "imdb_search":
+                    self.assertGreater(result["queries"], 0)
+                self.assertEqual(result["iterations"], 1)
+                self.assertGreater(result["p50_ms"], 0)
+
+        # Casting du catalogue synthétique : chaque film a 1 à 2 réalisateurs, 1 à 3
+        # producteurs et 1 à `cast_per_movie` acteurs
+        seeded = Movie.objects.filter(imdb_id__startswith="tt0")
+        self.assertEqual(seeded.count(), 30)
+        for role, most in (
+            (Credit.DIRECTOR, 2),
+            (Credit.PRODUCER, 3),
+            (Credit.ACTOR, 3),
+        ):
+            counts = list(
+                Credit.objects.filter(movie__in=seeded, role=role)
+                .values("movie")
+                .annotate(count=Count("id"))
+                .values_list("count", flat=True)
+            )
+            self.assertEqual(len(counts), 30)
+            self.assertLessEqual(max(counts), most)
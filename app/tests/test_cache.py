@@ -0,0 +1,117 @@
+from unittest.mock import patch, MagicMock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ..cache import (
+    DjangoSearchCache,
+    MemorySearchCache,
+    SearchResultCache,
+    build_search_cache,
+)
+from ..services import IMDbService
+
+
+class FakeClock:
+    """Horloge contrôlée par les tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSearchResultCache(SimpleTestCase):
+    """Tests unitaires du cache des recherches IMDb."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = SearchResultCache(
+            MemorySearchCache(ttl=60, max_size=2, clock=self.clock)
+        )
+        self.results = [{"imdb_id": "1375666", "title": "Inception", "poster_url": ""}]
+
+    def test_key_is_normalized(self):
+        """Vérifie que la casse et les espaces n'influent pas sur la clé de cache."""
+
+        self.cache.set("  Inception ", 5, self.results)
+        self.assertEqual(self.cache.get("inception", 5), self.results)
+        self.assertIsNone(self.cache.get("inception", 10))
+
+    def test_hits_and_misses_are_counted(self):
+        """Vérifie le comptage des hits et des misses."""
+
+        self.assertIsNone(self.cache.get("Inception", 5))
+        self.cache.set("Inception", 5, self.results)
+        self.cache.get("Inception", 5)
+        self.cache.get("Inception", 5)
+        self.assertEqual(self.cache.stats(), {"hits": 2, "misses": 1})
+
+    def test_entries_expire_after_ttl(self):
+        """Vérifie qu'une entrée expirée n'est plus servie."""
+
+        self.cache.set("Inception", 5, self.results)
+        self.clock.now = 61
+        self.assertIsNone(self.cache.get("Inception", 5))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Vérifie l'éviction de l'entrée la moins récemment utilisée."""
+
+        self.cache.set("Inception", 5, self.results)
+        self.cache.set("Matrix", 5, self.results)
+        self.cache.get("Inception", 5)
+        self.cache.set("Heat", 5, self.results)
+
+        self.assertIsNone(self.cache.get("Matrix", 5))
+        self.assertIsNotNone(self.cache.get("Inception", 5))
+        self.assertEqual(len(self.cache.backend), 2)
+
+    def test_cached_results_are_not_shared(self):
+        """Vérifie que modifier un résultat retourné n'altère pas le cache."""
+
+        self.cache.set("Inception", 5, self.results)
+        self.cache.get("Inception", 5)[0]["title"] = "Modifié"
+        self.assertEqual(self.cache.get("Inception", 5)[0]["title"], "Inception")
+
+    def test_django_backend(self):
+        """Vérifie le backend partagé via le framework de cache de Django."""
+
+        cache = SearchResultCache(DjangoSearchCache(ttl=60))
+        cache.clear()
+        cache.set("Inception", 5, self.results)
+        self.assertEqual(cache.get("INCEPTION", 5), self.results)
+
+    @override_settings(IMDB_SEARCH_CACHE={"BACKEND": "django", "TTL": 60})
+    def test_build_search_cache_from_settings(self):
+        """Vérifie la sélection du backend depuis les paramètres."""
+
+        self.assertIsInstance(build_search_cache().backend, DjangoSearchCache)
+
+    @override_settings(IMDB_SEARCH_CACHE={"BACKEND": "inconnu"})
+    def test_build_search_cache_unknown_backend(self):
+        """Vérifie qu'un backend inconnu est refusé."""
+
+        with self.assertRaises(ValueError):
+            build_search_cache()
+
+
+class TestIMDbServiceSearchCache(TestCase):
+    """Tests de l'intégration du cache dans IMDbService.search_movie."""
+
+    @patch("imdb.IMDbBase.search_movie")
+    def test_repeated_search_is_served_from_cache(self, mock_search_movie):
+        """Vérifie qu'une recherche répétée n'interroge IMDb qu'une seule fois."""
+
+        movie = MagicMock(movieID="1375666")
+        movie.get.side_effect = lambda key, default="": {"title": "Inception"}.get(
+            key, default
+        )
+        mock_search_movie.return_value = [movie]
+
+        imdb_service = IMDbService()
+        first = imdb_service.search_movie("Inception", limit=5)
+        second = imdb_service.search_movie("inception ", limit=5)
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_search_movie.call_count, 1)
+        self.assertEqual(imdb_service.search_cache.stats(), {"hits": 1, "misses": 1})
@@ -0,0 +1,75 @@
+import copy
+import os
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase
+
+
+class TestDatabaseProfiles(SimpleTestCase):
+    """Tests des profils de connexion SQLite."""
+
+    def connect(self, profile):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_dict = copy.deepcopy(connections.settings["default"])
+        settings_dict.update(copy.deepcopy(profile))
+        settings_dict["NAME"] = os.path.join(directory.name, "profile.sqlite3")
+        wrapper = DatabaseWrapper(settings_dict, alias="profile")
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def pragma(self, wrapper, name):
+        with wrapper.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_production_profile(self):
+        """Vérifie les pragmas et le mode de transaction appliqués par le profil production."""
+
+        wrapper = self.connect(settings.DATABASE_PROFILES["production"])
+
+        self.assertEqual(self.pragma(wrapper, "journal_mode"), "wal")
+        self.assertEqual(self.pragma(wrapper, "synchronous"), 1)  # NORMAL
+        self.assertEqual(self.pragma(wrapper, "cache_size"), -65536)
+        self.assertEqual(self.pragma(wrapper, "busy_timeout"), 20000)
+        self.assertEqual(wrapper.transaction_mode, "IMMEDIATE")
+        self.assertEqual(wrapper.settings_dict["CONN_MAX_AGE"], 600)
+
+    def test_production_profile_under_asgi(self):
+        """Vérifie que les connexions persistantes sont désactivées sous ASGI."""
+
+        env = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE="cinevault_back.settings",
+            DATABASE_PROFILE="production",
+        )
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import cinevault_back.asgi\n"
+                "from django.conf import settings\n"
+                "print(settings.DATABASES['default']['CONN_MAX_AGE'])",
+            ],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip().splitlines()[-1], "0")
+
+    def test_default_profile(self):
+        """Vérifie que le profil par défaut garde le comportement de SQLite."""
+
+        wrapper = self.connect(settings.DATABASE_PROFILES["default"])
+
+        self.assertEqual(self.pragma(wrapper, "journal_mode"), "delete")
+        self.assertIsNone(wrapper.transaction_mode)
@@ -0,0 +1,124 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from ..db_routers import PRIMARY, ReplicaRouter, ReplicaRoutingMiddleware
+from ..models import ImportJob, Movie
+
+REPLICAS = ["replica_1", "replica_2"]
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class TestReplicaRouter(SimpleTestCase):
+    """Tests de l'aiguillage des lectures vers les réplicas."""
+
+    def setUp(self):
+
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def run_request(self, request, view):
+        """Passe une requête dans le middleware avec `view` comme vue."""
+
+        return ReplicaRoutingMiddleware(view)(request)
+
+    async def test_async_read_your_writes(self):
+        """Vérifie le choix de base et le cookie de lecture de ses écritures sous ASGI."""
+
+        databases = []
+
+        async def write_view(request):
+            databases.append(await sync_to_async(self.router.db_for_read)(Movie))
+            await sync_to_async(self.router.db_for_write)(Movie)
+            return HttpResponse(status=201)
+
+        async def read_view(request):
+            databases.append(await sync_to_async(self.router.db_for_read)(Movie))
+            return HttpResponse()
+
+        middleware = ReplicaRoutingMiddleware(read_view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        await middleware(self.factory.get("/api/movies/"))
+        self.assertIn(databases.pop(), REPLICAS)
+
+        response = await ReplicaRoutingMiddleware(write_view)(
+            self.factory.post("/api/movies/async/add/")
+        )
+        self.assertEqual(databases.pop(), PRIMARY)
+        self.assertIn("cinevault_primary", response.cookies)
+
+    def test_outside_requests_reads_go_to_primary(self):
+        """Vérifie que hors requête (commandes, worker) tout passe par la base principale."""
+
+        self.assertEqual(self.router.db_for_read(Movie), PRIMARY)
+        self.assertEqual(self.router.db_for_write(Movie), PRIMARY)
+        self.assertTrue(self.router.allow_migrate(PRIMARY, "app"))
+        self.assertFalse(self.router.allow_migrate("replica_1", "app"))
+
+    def test_safe_request_reads_from_one_replica(self):
+        """Vérifie qu'une requête GET lit sur un même réplica, sauf pour la file d'imports."""
+
+        databases = []
+
+        def view(request):
+            databases.extend(self.router.db_for_read(Movie) for _ in range(5))
+            databases.append(self.router.db_for_read(ImportJob))
+            return HttpResponse()
+
+        response = self.run_request(self.factory.get("/api/movies/"), view)
+
+        self.assertIn(databases[0], REPLICAS)
+        self.assertEqual(set(databases[:5]), {databases[0]})
+        self.assertEqual(databases[5], PRIMARY)
+        self.assertNotIn("cinevault_primary", response.cookies)
+
+    def test_read_your_writes(self):
+        """Vérifie qu'après une écriture le client lit sur la base principale."""
+
+        databases = []
+
+        def write_view(request):
+            databases.append(self.router.db_for_read(Movie))
+            self.router.db_for_write(Movie)
+            return HttpResponse(status=201)
+
+        def read_view(request):
+            databases.append(self.router.db_for_read(Movie))
+            return HttpResponse()
+
+        response = self.run_request(self.factory.post("/api/movies/add/"), write_view)
+        cookie = response.cookies["cinevault_primary"]
+        self.assertEqual(cookie["max-age"], 5)
+
+        request = self.factory.get("/api/movies/")
+        request.COOKIES["cinevault_primary"] = cookie.value
+        self.run_request(request, read_view)
+
+        self.assertEqual(databases, [PRIMARY, PRIMARY])
+
+    def test_streaming_response_keeps_replica(self):
+        """Vérifie que les lectures faites pendant la diffusion d'un export restent sur le réplica."""
+
+        def view(request):
+            return StreamingHttpResponse(
+                self.router.db_for_read(Movie) for _ in range(3)
+            )
+
+        response = self.run_request(self.factory.get("/api/movies/export/"), view)
+        chunks = {chunk.decode() for chunk in response.streaming_content}
+
+        self.assertEqual(len(chunks), 1)
+        self.assertIn(chunks.pop(), REPLICAS)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas(self):
+        """Vérifie que sans réplica tout passe par la base principale, sans cookie."""
+
+        def view(request):
+            self.router.db_for_write(Movie)
+            return HttpResponse(self.router.db_for_read(Movie))
+
+        response = self.run_request(self.factory.get("/api/movies/"), view)
+
+        self.assertEqual(response.content.decode(), PRIMARY)
+        self.assertNotIn("cinevault_primary", response.cookies)
@@ -0,0 +1,117 @@
+import gzip
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+
+from .test_setup import TestModelSetup
+from ..models import Category, Credit, Movie, Person
+
+BASICS = [
+    "tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult\tstartYear\tendYear\truntimeMinutes\tgenres",
+    "tt0068646\tmovie\tThe Godfather\tThe Godfather\t0\t1972\t\\N\t175\tCrime,Drama",
+    "tt0071562\tmovie\tThe Godfather Part II\tThe Godfather Part II\t0\t1974\t\\N\t\\N\tCrime",
+    "tt0098936\ttvSeries\tTwin Peaks\tTwin Peaks\t0\t1990\t1991\t47\tDrama",
+    "tt1234567\tmovie\tInception (remaster)\tInception\t0\t2010\t\\N\t148\tAction",
+]
+PRINCIPALS = [
+    "tconst\tordering\tnconst\tcategory\tjob\tcharacters",
+    'tt0068646\t1\tnm0000008\tactor\t\\N\t["Vito Corleone"]',
+    "tt0068646\t2\tnm0001123\tdirector\t\\N\t\\N",
+    "tt0068646\t3\tnm0000199\tproducer\tproducer\t\\N",
+    "tt0068646\t4\tnm0000338\tcinematographer\t\\N\t\\N",
+    'tt0071562\t1\tnm0000199\tactor\t\\N\t["Michael"]',
+    "tt0098936\t1\tnm0000380\tactor\t\\N\t\\N",
+]
+NAMES = [
+    "nconst\tprimaryName\tbirthYear\tdeathYear\tprimaryProfession\tknownForTitles",
+    "nm0000008\tMarlon Brando\t1924\t2004\tactor\ttt0068646",
+    "nm0001123\tFrancis Ford Coppola\t1939\t\\N\tdirector\ttt0068646",
+    "nm0000199\tAl Pacino\t1940\t\\N\tactor,producer\ttt0068646",
+    "nm0000380\tKyle MacLachlan\t1959\t\\N\tactor\ttt0098936",
+]
+
+
+class TestLoadImdbDatasets(TestModelSetup):
+    """Tests du chargement des fichiers publics d'IMDb."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.files = {
+            "basics": self._write("title.basics.tsv.gz", BASICS),
+            "principals": self._write("title.principals.tsv.gz", PRINCIPALS),
+            "names": self._write("name.basics.tsv.gz", NAMES),
+        }
+
+    def _write(self, name, lines):
+        path = os.path.join(self.directory.name, name)
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        return path
+
+    def _load(self, **options):
+        out = StringIO()
+        call_command("load_imdb_datasets", batch_size=2, stdout=out, **options)
+        return out.getvalue()
+
+    def test_load_datasets(self):
+        """Vérifie le chargement des films, catégories, personnes et de leurs liens."""
+
+        output = self._load(**self.files)
+
+        godfather = Movie.objects.get(imdb_id="tt0068646")
+        self.assertEqual(godfather.title, "The Godfather")
+        self.assertEqual(godfather.duration_minutes, 175)
+        self.assertEqual(
+            set(godfather.categories.values_list("name", flat=True)),
+            {"Crime", "Drama"},
+        )
+        self.assertEqual(
+            [person.name for person in godfather.directors], ["Francis Ford Coppola"]
+        )
+        self.assertEqual([person.name for person in godfather.producers], ["Al Pacino"])
+        self.assertEqual(
+            [person.name for person in godfather.actors], ["Marlon Brando"]
+        )
+        self.assertEqual(
+            list(godfather.credits.values_list("role", "billing_order")),
+            [(Credit.ACTOR, 1), (Credit.DIRECTOR, 2), (Credit.PRODUCER, 3)],
+        )
+        # Al Pacino, producteur puis acteur, n'est enregistré qu'une fois
+        self.assertEqual(Person.objects.get(imdb_id="nm0000199").credits.count(), 2)
+        self.assertIsNone(Movie.objects.get(imdb_id="tt0071562").duration_minutes)
+        self.assertIn("title.basics (terminé) : 4 lignes lues", output)
+
+        # Les séries et leurs participants ne sont pas chargés
+        self.assertFalse(Movie.objects.filter(imdb_id="tt0098936").exists())
+        self.assertFalse(Person.objects.filter(imdb_id="nm0000380").exists())
+
+        # Un film déjà présent est mis à jour, sans doublon de catégorie
+        inception = Movie.objects.get(imdb_id="tt1234567")
+        self.assertEqual(inception.title, "Inception (remaster)")
+        self.assertEqual(Category.objects.filter(name="Drama").count(), 1)
+
+    def test_load_datasets_is_idempotent(self):
+        """Vérifie qu'un second chargement des mêmes fichiers ne crée aucun doublon."""
+
+        self._load(**self.files)
+        counts = [model.objects.count() for model in (Movie, Category, Person, Credit)]
+
+        self._load(**self.files)
+        self.assertEqual(
+            [model.objects.count() for model in (Movie, Category, Person, Credit)],
+            counts,
+        )
+        self.assertEqual(
+            Person.objects.get(imdb_id="nm0000199").name,
+            "Al Pacino",
+        )
+
+    def test_load_datasets_without_file(self):
+        with self.assertRaises(CommandError):
+            call_command("load_imdb_datasets", stdout=StringIO())
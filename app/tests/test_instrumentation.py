@@ -0,0 +1,148 @@
+import logging
+from unittest.mock import patch
+
+from django.core.handlers.asgi import ASGIHandler
+from django.test import override_settings
+from django.urls import reverse, reverse_lazy
+from rest_framework import status
+
+from .test_setup import TestModelSetup
+from ..instrumentation import RequestMetrics, current_metrics, timed
+from ..models import Movie
+from ..services import IMDbService
+
+
+def parse_server_timing(header):
+    """Retourne les métriques de l'en-tête Server-Timing sous forme de dictionnaire."""
+
+    metrics = {}
+    for entry in header.split(", "):
+        name, *params = entry.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+class TestRequestInstrumentation(TestModelSetup):
+    """Tests des mesures par requête (en-tête Server-Timing et journal)."""
+
+    def test_server_timing_header(self):
+        """Vérifie que l'en-tête rend compte des requêtes SQL et de la sérialisation."""
+
+        response = self.client.get(reverse_lazy("movie-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        metrics = parse_server_timing(response["Server-Timing"])
+        # comptage + page de films + catégories préchargées
+        self.assertEqual(metrics["db"]["desc"], '"3 queries"')
+        self.assertGreater(float(metrics["db"]["dur"]), 0)
+        self.assertIn("serialize", metrics)
+        self.assertGreaterEqual(
+            float(metrics["total"]["dur"]), float(metrics["db"]["dur"])
+        )
+
+    @patch.object(IMDbService, "_search_movie", return_value=[])
+    def test_server_timing_imdb(self, mock_search_movie):
+        """Vérifie que le temps passé dans IMDbService est mesuré."""
+
+        response = self.client.get(
+            reverse_lazy("movie-search_movie"), {"title": "Instrumentation"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("imdb", parse_server_timing(response["Server-Timing"]))
+
+    @override_settings(REQUEST_SLOW_THRESHOLD_MS=0)
+    def test_slow_request_logs_queries(self):
+        """Vérifie qu'une requête lente est journalisée avec ses requêtes SQL."""
+
+        with self.assertLogs(level="INFO") as logs:
+            self.client.get(reverse_lazy("movie-list"))
+
+        self.assertTrue(
+            any('"db_queries": 3' in line for line in logs.output), logs.output
+        )
+        slow = [line for line in logs.output if "Requête lente" in line]
+        self.assertEqual(len(slow), 1)
+        self.assertIn('FROM "app_movie"', slow[0])
+
+    @override_settings(REQUEST_INSTRUMENTATION=False)
+    def test_instrumentation_disabled(self):
+        response = self.client.get(reverse_lazy("movie-list"))
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(DEBUG=True)  # Django ne journalise les adaptations qu'en DEBUG
+    def test_asgi_handler_does_not_adapt_middleware(self):
+        """Vérifie que sous ASGI aucun middleware n'est exécuté dans un thread par adaptation."""
+
+        # Le journal de Django est désactivé par la configuration LOGGING du projet
+        logger = logging.getLogger("django.request")
+        self.addCleanup(setattr, logger, "disabled", logger.disabled)
+        logger.disabled = False
+
+        with self.assertLogs(logger, level="DEBUG") as logs:
+            ASGIHandler()
+            # `assertLogs` exige au moins un message
+            logger.debug("Chaîne ASGI chargée")
+
+        adapted = [line for line in logs.output if "adapted for middleware" in line]
+        self.assertEqual(adapted, [])
+
+    async def test_async_request_is_measured(self):
+        """Vérifie que les requêtes SQL d'une vue asynchrone sont mesurées."""
+
+        response = await self.async_client.post(
+            reverse("movie-async_add_movie"),
+            {"imdb_id": self.movie_data_1["imdb_id"]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        metrics = parse_server_timing(response["Server-Timing"])
+        self.assertEqual(metrics["db"]["desc"], '"1 queries"')
+
+    def test_pool_thread_queries_are_measured(self):
+        """Vérifie que les requêtes SQL des threads de récupération d'un ajout en lot sont
+        comptées."""
+
+        def bulk_add_queries(get_movie_details):
+            with patch.object(
+                IMDbService, "get_movie_details", side_effect=get_movie_details
+            ):
+                response = self.client.post(
+                    reverse("movie-bulk_add_movies"),
+                    {"imdb_ids": ["tt0000001", "tt0000002"]},
+                    format="json",
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            desc = parse_server_timing(response["Server-Timing"])["db"]["desc"]
+            return int(desc.strip('"').split()[0])
+
+        def failing_details(imdb_id):
+            raise RuntimeError("Film introuvable")
+
+        def reading_details(imdb_id):
+            # Comme le cache persistant des détails, lit la base depuis le thread du pool
+            Movie.objects.exists()
+            raise RuntimeError("Film introuvable")
+
+        self.assertEqual(
+            bulk_add_queries(reading_details), bulk_add_queries(failing_details) + 2
+        )
+
+    def test_timed_outside_request(self):
+        """Vérifie que `timed` n'a aucun effet hors d'une requête instrumentée."""
+
+        self.assertIsNone(current_metrics())
+        with timed("imdb"):
+            pass
+
+    def test_request_metrics(self):
+        metrics = RequestMetrics(max_recorded_queries=1)
+        for sql in ("SELECT 1", "SELECT 2"):
+            metrics.record_query(lambda *args: None, sql, (), False, {})
+        metrics.add_timing("imdb", 0.5)
+        metrics.add_timing("imdb", 0.25)
+
+        self.assertEqual(metrics.db_queries, 2)
+        self.assertEqual(len(metrics.queries), 1)
+        self.assertEqual(metrics.timings, {"imdb": 0.75})
+        self.assertIn("imdb;dur=750.00", metrics.server_timing(1))
@@ -0,0 +1,150 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.conf import settings
+from django.urls import reverse_lazy
+from django.utils import timezone
+from rest_framework import status
+
+from .test_setup import TestModelSetup
+from ..container import injector
+from ..jobs import ImportWorker, claim_next_job, enqueue_import, requeue_stale_jobs
+from ..models import ImportJob, Movie
+from ..services import IMDbService, MovieImportService
+
+
+class TestImportJobs(TestModelSetup):
+    """Tests de l'import de films en arrière-plan."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.add_movie_url = reverse_lazy("movie-add_movie")
+        self.worker = ImportWorker(injector.get(MovieImportService))
+        self.movie_details = {
+            "imdb_id": "tt0068646",
+            "title": "The Godfather",
+            "duration": "2h55",
+            "summary": "Crime film.",
+            "poster_url": "http://example.com/godfather.jpg",
+            "directors": [{"name": "Francis Ford Coppola", "imdb_id": "nm0001123"}],
+            "producers": [],
+            "actors": [{"name": "Marlon Brando", "imdb_id": "nm0000008"}],
+            "categories": [{"name": "Crime"}],
+        }
+
+    @patch.object(IMDbService, "get_movie_details")
+    def test_background_add_movie(self, mock_get_movie_details):
+        """Vérifie l'ajout en arrière-plan : 202, exécution par le worker puis suivi de la tâche."""
+
+        mock_get_movie_details.return_value = self.movie_details
+
+        response = self.client.post(
+            self.add_movie_url, {"imdb_id": "tt0068646", "background": True}
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], ImportJob.STATUS_PENDING)
+        mock_get_movie_details.assert_not_called()
+        self.assertFalse(Movie.objects.filter(imdb_id="tt0068646").exists())
+
+        self.assertEqual(self.worker.drain(), 1)
+
+        response = self.client.get(response.data["status_url"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], ImportJob.STATUS_SUCCEEDED)
+        self.assertEqual(response.data["result"], MovieImportService.STATUS_CREATED)
+        self.assertEqual(
+            response.data["movie"], Movie.objects.get(imdb_id="tt0068646").id
+        )
+        self.assertEqual(response.data["attempts"], 1)
+
+    @patch.object(IMDbService, "get_movie_details")
+    def test_failed_job_reports_error(self, mock_get_movie_details):
+        """Vérifie qu'une tâche en échec conserve l'erreur rencontrée."""
+
+        mock_get_movie_details.side_effect = RuntimeError(
+            "Erreur lors de la récupération des détails du film"
+        )
+        job = enqueue_import("tt0068646")
+
+        self.worker.drain()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.STATUS_FAILED)
+        self.assertIn("Erreur lors de la récupération", job.error)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_job_is_claimed_once(self):
+        """Vérifie qu'une tâche réservée ne peut plus être réservée par un autre worker."""
+
+        job = enqueue_import("tt0068646")
+
+        claimed = claim_next_job()
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.status, ImportJob.STATUS_FETCHING)
+        self.assertIsNone(claim_next_job())
+
+    def test_stale_jobs_are_requeued(self):
+        """Vérifie la remise en attente des tâches abandonnées par un worker arrêté."""
+
+        job = enqueue_import("tt0068646")
+        claim_next_job()
+        ImportJob.objects.filter(id=job.id).update(
+            started_at=timezone.now() - timedelta(hours=1)
+        )
+
+        self.assertEqual(requeue_stale_jobs(older_than=600, max_attempts=3), 1)
+        self.assertEqual(claim_next_job().id, job.id)
+
+    def test_stale_jobs_fail_after_max_attempts(self):
+        """Vérifie qu'une tâche abandonnée à chaque tentative finit en échec."""
+
+        job = enqueue_import("tt0068646")
+        for attempt in range(3):
+            self.assertEqual(claim_next_job().id, job.id)
+            ImportJob.objects.filter(id=job.id).update(
+                started_at=timezone.now() - timedelta(hours=1)
+            )
+            requeue_stale_jobs(older_than=600, max_attempts=3)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.STATUS_FAILED)
+        self.assertEqual(job.attempts, 3)
+        self.assertIn("3 tentative", job.error)
+        self.assertIsNotNone(job.finished_at)
+        self.assertIsNone(claim_next_job())
+
+    @patch.object(IMDbService, "get_movie_details")
+    def test_running_worker_requeues_abandoned_jobs(self, mock_get_movie_details):
+        """Vérifie qu'un worker en attente reprend la tâche d'un autre worker arrêté en cours."""
+
+        mock_get_movie_details.return_value = self.movie_details
+        job = enqueue_import("tt0068646")
+        # Tâche réservée par un worker qui s'arrête ensuite sans la terminer
+        claim_next_job()
+
+        now = [0.0]
+        worker = ImportWorker(
+            injector.get(MovieImportService), poll_interval=0, clock=lambda: now[0]
+        )
+        waits = []
+
+        def wait(timeout):
+            waits.append(timeout)
+            if len(waits) == 1:
+                # La tâche devient abandonnée pendant que le worker attend
+                ImportJob.objects.filter(id=job.id).update(
+                    started_at=timezone.now() - timedelta(hours=1)
+                )
+                now[0] += settings.IMPORT_JOB_STALE_AFTER
+            else:
+                worker.stop()
+
+        worker.stopping.wait = wait
+        worker.run_forever()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.STATUS_SUCCEEDED)
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(len(waits), 2)
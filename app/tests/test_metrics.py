@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.urls import reverse_lazy
+from rest_framework import status
+
+from .test_setup import TestModelSetup
+from ..container import injector
+from ..metrics import (
+    HTTP_REQUESTS,
+    IMDB_CALL_DURATION,
+    IMDB_CALLS,
+    MetricsRegistry,
+    track_imdb_call,
+)
+from ..services import IMDbService
+
+
+class TestMetrics(TestModelSetup):
+    """Tests des métriques exportées sur /metrics."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.imdb_service = injector.get(IMDbService)
+        self.imdb_service.search_cache.clear()
+
+    @patch.object(IMDbService, "_search_movie", return_value=[{"imdb_id": "1"}])
+    def test_imdb_calls(self, mock_search_movie):
+        """Vérifie le comptage des appels IMDb réussis et servis depuis le cache."""
+
+        labels = {"operation": "search_movie"}
+        success = IMDB_CALLS.get(outcome="success", **labels)
+        cache_hit = IMDB_CALLS.get(outcome="cache_hit", **labels)
+
+        mock_search_movie.side_effect = lambda title, limit: (
+            self.imdb_service.search_cache.set(title, limit, [{"imdb_id": "1"}])
+            or [{"imdb_id": "1"}]
+        )
+        self.imdb_service.search_movie("Metrics")
+        self.imdb_service.search_movie("Metrics")
+
+        self.assertEqual(IMDB_CALLS.get(outcome="success", **labels), success + 1)
+        self.assertEqual(IMDB_CALLS.get(outcome="cache_hit", **labels), cache_hit + 1)
+        self.assertGreaterEqual(
+            IMDB_CALL_DURATION.get(outcome="success", **labels)["count"], 1
+        )
+
+    def test_imdb_call_outcomes(self):
+        """Vérifie qu'une erreur et un délai dépassé sont distingués."""
+
+        labels = {"operation": "test"}
+        with self.assertRaises(RuntimeError):
+            with track_imdb_call("test"):
+                raise RuntimeError("IMDb indisponible")
+        with self.assertRaises(RuntimeError):
+            with track_imdb_call("test"):
+                try:
+                    raise TimeoutError()
+                except TimeoutError as e:
+                    raise RuntimeError("Délai dépassé") from e
+
+        self.assertEqual(IMDB_CALLS.get(outcome="error", **labels), 1)
+        self.assertEqual(IMDB_CALLS.get(outcome="timeout", **labels), 1)
+
+    def test_metrics_endpoint(self):
+        """Vérifie l'export au format Prometheus, avec les métriques des actions des vues."""
+
+        labels = {
+            "view": "MovieViewSet",
+            "action": "list",
+            "method": "GET",
+            "status": "200",
+        }
+        before = HTTP_REQUESTS.get(**labels)
+        self.client.get(reverse_lazy("movie-list"))
+        self.assertEqual(HTTP_REQUESTS.get(**labels), before + 1)
+
+        response = self.client.get(reverse_lazy("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        content = response.content.decode()
+        self.assertIn("# TYPE cinevault_http_requests_total counter", content)
+        self.assertIn(
+            'cinevault_http_requests_total{action="list",method="GET",'
+            f'status="200",view="MovieViewSet"}} {float(before + 1)}',
+            content,
+        )
+        self.assertIn(
+            'cinevault_http_request_duration_seconds_bucket{action="list",'
+            'view="MovieViewSet",le="+Inf"}',
+            content,
+        )
+
+    def test_aggregation_across_processes(self):
+        """Vérifie que l'export additionne les valeurs écrites par les autres processus."""
+
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Tâches.", ["outcome"])
+        histogram = registry.histogram("job_seconds", "Durée.", [], buckets=(1, 5))
+
+        with tempfile.TemporaryDirectory() as directory, override_settings(
+            METRICS_DIR=directory
+        ):
+            # Valeurs écrites par un autre worker
+            key = json.dumps([["outcome", "ok"]])
+            with open(os.path.join(directory, "metrics-1.json"), "w") as file:
+                json.dump(
+                    {
+                        "jobs_total": {key: 2},
+                        "job_seconds": {
+                            "[]": {"buckets": [1, 1], "sum": 3, "count": 2}
+                        },
+                    },
+                    file,
+                )
+            counter.inc(outcome="ok")
+            histogram.observe(0.5)
+            content = registry.render()
+            self.assertTrue(
+                os.path.exists(os.path.join(directory, f"metrics-{os.getpid()}.json"))
+            )
+
+        self.assertIn('jobs_total{outcome="ok"} 3.0', content)
+        self.assertIn('job_seconds_bucket{le="1.0"} 2', content)
+        self.assertIn('job_seconds_bucket{le="+Inf"} 3', content)
+        self.assertIn("job_seconds_sum 3.5", content)
+        self.assertIn("job_seconds_count 3", content)
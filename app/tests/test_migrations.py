@@ -0,0 +1,157 @@
+from importlib import import_module
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+from ..search import install_search_index, is_supported
+
+
+class MigrationTestCase(TransactionTestCase):
+    """Base des tests de migrations de données, jouées sur la base de test puis rétablies."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.addCleanup(self.restore_schema)
+
+    def restore_schema(self):
+        """
+        Rejoue les migrations restantes et réindexe la recherche plein texte.
+
+        Sous SQLite, une migration qui reconstruit `app_movie` supprime les triggers de l'index :
+        `migrate` les recrée (via `post_migrate`) et la réindexation prend en compte les films
+        écrits entre-temps, que le vidage de la base en fin de test retire ensuite de l'index.
+        """
+        call_command("migrate", verbosity=0)
+        if is_supported(connection):
+            install_search_index(connection, rebuild=True)
+
+    def migrate(self, name):
+        """
+        Migre l'application jusqu'à la migration donnée.
+
+        Args:
+            name (str): Nom de la migration cible.
+
+        Returns:
+            Apps: Registre des modèles historiques à cette migration.
+        """
+        executor = MigrationExecutor(connection)
+        executor.migrate([("app", name)])
+        return executor.loader.project_state(("app", name)).apps
+
+
+class TestDurationMinutesMigration(MigrationTestCase):
+    """Tests de la migration des durées textuelles vers des minutes entières."""
+
+    # Lots de deux films : les mises à jour sont écrites en cours de parcours puis à la fin
+    @patch.object(
+        import_module("app.migrations.0008_movie_duration_minutes"), "BATCH_SIZE", 2
+    )
+    def test_forward_and_backward(self):
+        """Vérifie la conversion des durées en minutes, puis leur restauration en texte."""
+
+        apps = self.migrate("0007_importjob")
+        Movie = apps.get_model("app", "Movie")
+        Movie.objects.bulk_create(
+            [
+                Movie(imdb_id="tt1375666", title="Inception", duration="2h28"),
+                Movie(imdb_id="tt0113277", title="Heat", duration="95"),
+                Movie(imdb_id="tt0000099", title="Court métrage", duration="N/A"),
+            ]
+        )
+
+        apps = self.migrate("0008_movie_duration_minutes")
+        Movie = apps.get_model("app", "Movie")
+        self.assertEqual(
+            dict(Movie.objects.values_list("title", "duration_minutes")),
+            {"Inception": 148, "Heat": 95, "Court métrage": None},
+        )
+
+        apps = self.migrate("0007_importjob")
+        Movie = apps.get_model("app", "Movie")
+        self.assertEqual(
+            dict(Movie.objects.values_list("title", "duration")),
+            {"Inception": "2h28", "Heat": "1h35", "Court métrage": "Non indiqué"},
+        )
+
+
+class TestPersonCreditMigration(MigrationTestCase):
+    """Tests de la migration des réalisateurs, producteurs et acteurs vers les crédits."""
+
+    def test_forward_and_backward(self):
+        """Vérifie que les personnes sont dédoublonnées, puis restaurées dans chaque rôle."""
+
+        apps = self.migrate("0008_movie_duration_minutes")
+        Movie = apps.get_model("app", "Movie")
+        Director = apps.get_model("app", "Director")
+        Producer = apps.get_model("app", "Producer")
+        Actor = apps.get_model("app", "Actor")
+
+        inception = Movie.objects.create(imdb_id="tt1375666", title="Inception")
+        heat = Movie.objects.create(imdb_id="tt0113277", title="Heat")
+        inception.directors.add(
+            Director.objects.create(name="Quentin Tarantino", imdb_id="nm0000233")
+        )
+        inception.producers.add(Producer.objects.create(name="Jean Dupont"))
+        inception.actors.add(Actor.objects.create(name="Marie Martin"))
+        inception.actors.add(
+            Actor.objects.create(name="Quentin Tarantino", imdb_id="nm0000233")
+        )
+        heat.actors.add(Actor.objects.create(name="Jean Dupont"))
+
+        apps = self.migrate("0009_person_credit")
+        Person = apps.get_model("app", "Person")
+        Credit = apps.get_model("app", "Credit")
+
+        self.assertEqual(
+            sorted(Person.objects.values_list("name", "imdb_id")),
+            [
+                ("Jean Dupont", None),
+                ("Marie Martin", None),
+                ("Quentin Tarantino", "nm0000233"),
+            ],
+        )
+        self.assertEqual(
+            list(
+                Credit.objects.order_by(
+                    "movie_id", "role", "billing_order"
+                ).values_list("movie__title", "person__name", "role", "billing_order")
+            ),
+            [
+                ("Inception", "Marie Martin", "actor", 0),
+                ("Inception", "Quentin Tarantino", "actor", 1),
+                ("Inception", "Quentin Tarantino", "director", 0),
+                ("Inception", "Jean Dupont", "producer", 0),
+                ("Heat", "Jean Dupont", "actor", 0),
+            ],
+        )
+
+        apps = self.migrate("0008_movie_duration_minutes")
+        Movie = apps.get_model("app", "Movie")
+
+        inception = Movie.objects.get(imdb_id="tt1375666")
+        heat = Movie.objects.get(imdb_id="tt0113277")
+        self.assertEqual(
+            list(inception.directors.values_list("name", "imdb_id")),
+            [("Quentin Tarantino", "nm0000233")],
+        )
+        self.assertEqual(
+            list(inception.producers.values_list("name", flat=True)), ["Jean Dupont"]
+        )
+        self.assertEqual(
+            list(
+                Movie.actors.through.objects.filter(movie=inception)
+                .order_by("id")
+                .values_list("actor__name", flat=True)
+            ),
+            ["Marie Martin", "Quentin Tarantino"],
+        )
+        self.assertEqual(
+            list(heat.actors.values_list("name", flat=True)), ["Jean Dupont"]
+        )
+        self.assertEqual(apps.get_model("app", "Actor").objects.count(), 3)
@@ -1,4 +1,5 @@
 from .test_setup import TestModelSetup
+from ..models import Credit, Movie
 
 
 class ModelTests(TestModelSetup):
@@ -27,14 +28,14 @@ class ModelTests(TestModelSetup):
         """Vérifie que la création d'un film initialise correctement les champs principaux."""
 
         self.assertEqual(self.movie_1.title, "Inception")
-        self.assertEqual(self.movie_1.duration, "2h28")
+        self.assertEqual(self.movie_1.duration_minutes, 148)
 
     def test_movie_relations(self):
-        """Vérifie que les relations ManyToMany des films sont définies correctement."""
+        """Vérifie que les crédits et les relations ManyToMany des films sont définis correctement."""
 
-        self.assertIn(self.director, self.movie_1.directors.all())
-        self.assertIn(self.producer, self.movie_1.producers.all())
-        self.assertIn(self.actor_1, self.movie_1.actors.all())
+        self.assertEqual(self.movie_1.directors, [self.director])
+        self.assertEqual(self.movie_1.producers, [self.producer])
+        self.assertEqual(self.movie_1.actors, [self.actor_1])
         self.assertIn(self.category_1, self.movie_1.categories.all())
         self.assertIn(self.category_2, self.movie_1.categories.all())
         self.assertIn(self.category_2, self.movie_2.categories.all())
@@ -44,3 +45,19 @@ class ModelTests(TestModelSetup):
 
         self.assertTrue(self.movie_1.categories.exists())
         self.assertTrue(self.movie_2.categories.exists())
+
+    def test_person_credited_for_several_roles(self):
+        """Vérifie qu'une personne créditée pour plusieurs rôles n'est enregistrée qu'une fois."""
+
+        Credit.objects.create(
+            movie=self.movie_2, person=self.director, role=Credit.ACTOR, billing_order=1
+        )
+
+        movie = Movie.objects.with_details().get(pk=self.movie_2.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(movie.directors, [self.director])
+            self.assertEqual(movie.actors, [self.actor_2, self.director])
+        self.assertEqual(
+            list(self.director.movies.distinct().order_by("id")),
+            [self.movie_1, self.movie_2],
+        )
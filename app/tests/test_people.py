@@ -0,0 +1,106 @@
+from django.urls import reverse_lazy
+from rest_framework import status
+
+from .test_setup import TestModelSetup
+from ..models import Credit, Movie, Person
+
+
+class TestPersonViewSet(TestModelSetup):
+    """Tests des endpoints des personnes et de leur filmographie."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.detail_url = reverse_lazy(
+            "person-detail", kwargs={"imdb_id": self.director.imdb_id}
+        )
+        self.movies_url = reverse_lazy(
+            "person-movies", kwargs={"imdb_id": self.director.imdb_id}
+        )
+
+    def test_get_person(self):
+        """Vérifie le détail d'une personne et son nombre de films par rôle, en une requête."""
+
+        Credit.objects.create(
+            movie=self.movie_2, person=self.director, role=Credit.ACTOR, billing_order=1
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {
+                "imdb_id": "nm0000233",
+                "name": "Quentin Tarantino",
+                "credits": {"director": 2, "producer": 0, "actor": 1},
+            },
+        )
+
+    def test_get_unknown_person(self):
+        response = self.client.get(
+            reverse_lazy("person-detail", kwargs={"imdb_id": "nm9999999"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(
+            reverse_lazy("person-movies", kwargs={"imdb_id": "nm9999999"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_filmography(self):
+        """Vérifie la filmographie d'une personne, avec ses rôles dans chaque film."""
+
+        Credit.objects.create(
+            movie=self.movie_2, person=self.director, role=Credit.ACTOR, billing_order=1
+        )
+
+        response = self.client.get(self.movies_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(
+            [(movie["title"], movie["roles"]) for movie in response.data["results"]],
+            [
+                ("Inception", ["director"]),
+                ("Once Upon a Time in Hollywood", ["director", "actor"]),
+            ],
+        )
+        self.assertIn("Science Fiction", response.data["results"][0]["categories"])
+
+        response = self.client.get(self.movies_url, {"role": "actor"})
+        self.assertEqual(
+            [movie["title"] for movie in response.data["results"]],
+            ["Once Upon a Time in Hollywood"],
+        )
+
+    def test_get_filmography_invalid_role(self):
+        response = self.client.get(self.movies_url, {"role": "writer"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("role", response.data)
+
+    def test_get_filmography_query_count_is_constant(self):
+        """Vérifie que la filmographie se lit en un nombre fixe de requêtes, même longue."""
+
+        # personne + count + page de films + catégories + crédits de la personne
+        with self.assertNumQueries(5):
+            self.client.get(self.movies_url)
+
+        movies = Movie.objects.bulk_create(
+            [Movie(imdb_id=f"tt90000{i:02d}", title=f"Film {i}") for i in range(30)]
+        )
+        Credit.objects.bulk_create(
+            [
+                Credit(movie=movie, person=self.director, role=role)
+                for movie in movies
+                for role in (Credit.DIRECTOR, Credit.PRODUCER)
+            ]
+        )
+
+        with self.assertNumQueries(5):
+            response = self.client.get(self.movies_url, {"page_size": 50})
+        self.assertEqual(response.data["count"], 32)
+        self.assertEqual(
+            response.data["results"][-1]["roles"], ["director", "producer"]
+        )
+        self.assertEqual(Person.objects.count(), 4)
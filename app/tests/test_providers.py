@@ -0,0 +1,194 @@
+import json
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+from django.urls import reverse_lazy
+from imdb import IMDbError
+from rest_framework import status
+
+from .test_setup import TestModelSetup
+from ..container import injector
+from ..models import Movie, Person
+from ..providers import LOCAL, CinemagoerProvider, LocalProvider, build_provider
+from ..serializers import MovieDetailSerializer
+from ..services import IMDbService
+
+MOVIES = [
+    {
+        "imdb_id": "tt0133093",
+        "title": "The Matrix",
+        "duration": 136,
+        "summary": "A computer hacker learns about the true nature of reality.",
+        "poster_url": "http://example.com/matrix.jpg",
+        "directors": [{"name": "Lana Wachowski", "imdb_id": "nm0905154"}],
+        "producers": [{"name": "Joel Silver", "imdb_id": "nm0005428"}],
+        "actors": [{"name": "Keanu Reeves", "imdb_id": "nm0000206"}],
+        "categories": [{"name": "Action"}, {"name": "Sci-Fi"}],
+    },
+    {
+        # Format de l'export NDJSON du catalogue
+        "id": 12,
+        "imdb_id": "tt0234215",
+        "title": "The Matrix Reloaded",
+        "duration_minutes": 138,
+        "summary": "Neo and his allies race against time.",
+        "poster_url": "http://example.com/reloaded.jpg",
+        "directors": [{"name": "Lana Wachowski", "imdb_id": "nm0905154"}],
+        "producers": [],
+        "actors": [{"name": "Keanu Reeves", "imdb_id": "nm0000206"}],
+        "categories": ["Action"],
+    },
+    {
+        "imdb_id": "tt0113277",
+        "title": "Heat",
+        "duration": "2h50",
+        "categories": [{"name": "Crime"}],
+    },
+]
+
+
+class TestLocalProvider(SimpleTestCase):
+    """Tests du jeu de données IMDb local."""
+
+    def test_search(self):
+        """Vérifie que la recherche retourne les films contenant tous les mots, dans l'ordre."""
+
+        provider = LocalProvider(MOVIES)
+
+        self.assertEqual(
+            [movie["imdb_id"] for movie in provider.search("matrix")],
+            ["tt0133093", "tt0234215"],
+        )
+        self.assertEqual(
+            provider.search("RELOADED matrix"),
+            [
+                {
+                    "imdb_id": "tt0234215",
+                    "title": "The Matrix Reloaded",
+                    "poster_url": "http://example.com/reloaded.jpg",
+                }
+            ],
+        )
+        self.assertEqual(len(provider.search("the matrix", limit=1)), 1)
+        self.assertEqual(provider.search("inception"), [])
+
+    def test_details_are_normalized(self):
+        """Vérifie que les deux formats de jeu de données donnent les mêmes détails."""
+
+        provider = LocalProvider(MOVIES)
+
+        self.assertEqual(provider.details("tt0133093"), MOVIES[0])
+        reloaded = provider.details("tt0234215")
+        self.assertEqual(reloaded["duration"], 138)
+        self.assertEqual(reloaded["categories"], [{"name": "Action"}])
+        self.assertNotIn("id", reloaded)
+        self.assertEqual(provider.details("tt0113277")["duration"], 170)
+
+        with self.assertRaises(LookupError):
+            provider.details("tt0000000")
+
+    def test_latency_and_errors(self):
+        """Vérifie la latence et les erreurs simulées."""
+
+        provider = LocalProvider(MOVIES, latency=0.05)
+        started = time.perf_counter()
+        provider.search("heat")
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+        provider = LocalProvider(MOVIES, error_rate=1)
+        with self.assertRaises(IMDbError):
+            provider.details("tt0133093")
+
+    def test_build_from_file(self):
+        """Vérifie le chargement d'un fichier NDJSON ou JSON selon `IMDB_PROVIDER`."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            ndjson = os.path.join(directory, "movies.ndjson")
+            with open(ndjson, "w", encoding="utf-8") as file:
+                file.writelines(json.dumps(movie) + "\n" for movie in MOVIES)
+            array = os.path.join(directory, "movies.json")
+            with open(array, "w", encoding="utf-8") as file:
+                json.dump(MOVIES, file)
+
+            for path in (ndjson, array):
+                provider = build_provider({"BACKEND": LOCAL, "DATASET": path})
+                self.assertEqual(len(provider.movies), 3)
+
+        with self.assertRaises(ImproperlyConfigured):
+            build_provider({"BACKEND": LOCAL})
+        with self.assertRaises(ImproperlyConfigured):
+            build_provider({"BACKEND": "unknown"})
+
+
+class TestLocalProviderPipeline(TestModelSetup):
+    """Tests de l'API avec IMDb remplacé par le jeu de données local."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.imdb_service = injector.get(IMDbService)
+        self.imdb_service.search_cache.clear()
+        provider = self.imdb_service.provider
+        self.addCleanup(setattr, self.imdb_service, "provider", provider)
+        self.imdb_service.provider = LocalProvider(MOVIES)
+
+    def test_search_and_add(self):
+        """Vérifie la recherche puis l'ajout d'un film servis par le jeu de données local."""
+
+        response = self.client.get(
+            reverse_lazy("movie-search_movie"), {"title": "Matrix"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+        response = self.client.post(
+            reverse_lazy("movie-add_movie"), {"imdb_id": "tt0133093"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        movie = Movie.objects.get(imdb_id="tt0133093")
+        self.assertEqual(movie.duration_minutes, 136)
+        self.assertEqual([person.name for person in movie.actors], ["Keanu Reeves"])
+
+
+class TestCinemagoerProvider(TestModelSetup):
+    """Tests de la conversion des films IMDb."""
+
+    @patch("app.providers.get_movie")
+    def test_people_without_imdb_id(self, mock_get_movie):
+        """Vérifie que deux personnes sans identifiant IMDb restent distinctes, par leur nom."""
+
+        mock_get_movie.return_value = SimpleNamespace(
+            title="Court métrage",
+            cover_url="http://example.com/court.jpg",
+            directors=[SimpleNamespace(name="Jean Dupont")],
+            stars=[
+                SimpleNamespace(name="Jean Dupont"),
+                SimpleNamespace(name="Marie Martin"),
+            ],
+        )
+
+        details = CinemagoerProvider().details("tt0000099")
+        self.assertEqual(
+            details["actors"],
+            [
+                {"name": "Jean Dupont", "imdb_id": None},
+                {"name": "Marie Martin", "imdb_id": None},
+            ],
+        )
+
+        serializer = MovieDetailSerializer(data=details)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        movie = serializer.save()
+
+        self.assertEqual(
+            [person.name for person in movie.actors], ["Jean Dupont", "Marie Martin"]
+        )
+        self.assertEqual(movie.directors[0].pk, movie.actors[0].pk)
+        self.assertEqual(Person.objects.filter(imdb_id__isnull=True).count(), 2)
@@ -0,0 +1,243 @@
+import threading
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.urls import reverse_lazy
+from rest_framework import status
+
+from .test_setup import TestModelSetup
+from ..container import injector
+from ..resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    UpstreamTimeout,
+)
+from ..services import IMDbService
+
+
+class FakeUpstream:
+    """
+    Service distant simulé : chaque appel consomme l'étape suivante du scénario.
+
+    Une étape est un délai en secondes, une exception à lever ou un couple (délai, exception).
+    Une fois le scénario épuisé, les appels répondent immédiatement.
+    """
+
+    def __init__(self, *steps, result="ok"):
+        self.steps = list(steps)
+        self.result = result
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.calls += 1
+            step = self.steps.pop(0) if self.steps else 0
+        if isinstance(step, tuple):
+            delay, error = step
+        elif isinstance(step, BaseException):
+            delay, error = 0, step
+        else:
+            delay, error = step, None
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return self.result
+
+
+class FakeClock:
+    """Horloge manuelle pour piloter le disjoncteur."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def no_sleep(delay):
+    pass
+
+
+class TestResilience(SimpleTestCase):
+    """Tests du délai maximum, des nouveaux essais et du disjoncteur."""
+
+    def test_deadline(self):
+        """Vérifie qu'un appel trop long est abandonné dès l'expiration du délai."""
+
+        resilience = Resilience(timeout=0.1, retries=0)
+        upstream = FakeUpstream(2)
+
+        started = time.perf_counter()
+        with self.assertRaises(UpstreamTimeout):
+            resilience.call(upstream)
+
+        self.assertLess(time.perf_counter() - started, 1)
+
+    def test_retries_transient_errors(self):
+        """Vérifie qu'un appel est retenté après des erreurs passagères, avec attente bornée."""
+
+        delays = []
+        resilience = Resilience(
+            retries=2, backoff_base=0.2, backoff_max=0.3, sleep=delays.append
+        )
+        upstream = FakeUpstream(ConnectionError(), (0, TimeoutError()))
+
+        self.assertEqual(resilience.call(upstream), "ok")
+        self.assertEqual(upstream.calls, 3)
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0 <= delays[0] <= 0.2)
+        self.assertTrue(0 <= delays[1] <= 0.3)
+        self.assertEqual(resilience.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_retries_are_bounded(self):
+        """Vérifie que la dernière erreur est propagée une fois les essais épuisés."""
+
+        resilience = Resilience(retries=2, sleep=no_sleep)
+        upstream = FakeUpstream(*[ConnectionError()] * 5)
+
+        with self.assertRaises(ConnectionError):
+            resilience.call(upstream)
+
+        self.assertEqual(upstream.calls, 3)
+
+    def test_non_retryable_error(self):
+        """Vérifie qu'une erreur de données n'est ni retentée ni comptée par le disjoncteur."""
+
+        resilience = Resilience(
+            retries=2, breaker=CircuitBreaker(failure_threshold=1), sleep=no_sleep
+        )
+        upstream = FakeUpstream(ValueError("réponse invalide"))
+
+        with self.assertRaises(ValueError):
+            resilience.call(upstream)
+
+        self.assertEqual(upstream.calls, 1)
+        self.assertEqual(resilience.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_breaker_opens_and_fails_fast(self):
+        """Vérifie que le disjoncteur s'ouvre après le seuil et refuse alors les appels."""
+
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        resilience = Resilience(retries=0, breaker=breaker, sleep=no_sleep)
+        upstream = FakeUpstream(*[OSError()] * 3)
+
+        for _ in range(3):
+            with self.assertRaises(OSError):
+                resilience.call(upstream)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        clock.now = 10
+        with self.assertRaises(CircuitOpenError) as context:
+            resilience.call(upstream)
+
+        self.assertEqual(upstream.calls, 3)
+        self.assertEqual(context.exception.retry_after, 20)
+
+    def test_breaker_half_open(self):
+        """Vérifie qu'après le délai un seul essai est autorisé, qui rouvre ou referme le disjoncteur."""
+
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        resilience = Resilience(retries=0, breaker=breaker, sleep=no_sleep)
+        upstream = FakeUpstream(OSError(), OSError())
+
+        with self.assertRaises(OSError):
+            resilience.call(upstream)
+
+        # Essai en échec : le disjoncteur est rouvert pour un nouveau délai
+        clock.now = 30
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(OSError):
+            resilience.call(upstream)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        # Essai réussi : le disjoncteur est refermé
+        clock.now = 60
+        self.assertEqual(resilience.call(upstream), "ok")
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(upstream.calls, 3)
+
+    def test_breaker_allows_a_single_trial(self):
+        """Vérifie que les appels simultanés à un essai en cours échouent immédiatement."""
+
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30
+
+        breaker.before_call()
+        with self.assertRaises(CircuitOpenError) as context:
+            breaker.before_call()
+
+        # Le délai de réouverture est écoulé, mais un nouvel essai n'est pas immédiat
+        self.assertEqual(context.exception.retry_after, CircuitBreaker.MIN_RETRY_AFTER)
+
+
+class TestIMDbServiceResilience(TestModelSetup):
+    """Tests des réponses de l'API lorsque IMDb est lent ou indisponible."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.search_url = reverse_lazy("movie-search_movie")
+        self.imdb_service = injector.get(IMDbService)
+        self.imdb_service.search_cache.clear()
+
+        resilience = self.imdb_service.resilience
+        self.addCleanup(setattr, self.imdb_service, "resilience", resilience)
+
+    def test_open_breaker_returns_503(self):
+        """Vérifie qu'une fois le disjoncteur ouvert, IMDb n'est plus appelé et l'API répond 503."""
+
+        self.imdb_service.resilience = Resilience(
+            retries=0,
+            breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30),
+            sleep=no_sleep,
+        )
+        upstream = FakeUpstream(*[OSError()] * 2)
+
+        with patch("imdb.IMDbBase.search_movie", upstream):
+            for _ in range(2):
+                response = self.client.get(self.search_url, {"title": "Inception"})
+                self.assertEqual(
+                    response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+
+            response = self.client.get(self.search_url, {"title": "Inception"})
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "30")
+        self.assertEqual(upstream.calls, 2)
+
+    def test_half_open_breaker_returns_retry_after(self):
+        """Vérifie que pendant l'essai du disjoncteur, le 503 annonce au moins une seconde."""
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        self.imdb_service.resilience = Resilience(
+            retries=0, breaker=breaker, sleep=no_sleep
+        )
+        breaker.record_failure()
+        # Essai en cours, lancé par une autre requête
+        breaker.before_call()
+
+        for url in (self.search_url, reverse_lazy("movie-async_search_movie")):
+            response = self.client.get(url, {"title": "Inception"})
+            self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+            self.assertEqual(response["Retry-After"], "1")
+
+    def test_timeout_returns_504(self):
+        """Vérifie qu'un appel à IMDb trop long est abandonné et que l'API répond 504."""
+
+        self.imdb_service.resilience = Resilience(timeout=0.1, retries=0)
+
+        with patch("app.providers.get_movie", FakeUpstream(2)):
+            response = self.client.post(
+                reverse_lazy("movie-add_movie"), {"imdb_id": "tt0000001"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_504_GATEWAY_TIMEOUT)
@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+
+from django.urls import reverse_lazy
+from rest_framework import status
+
+from .test_setup import TestModelSetup
+from ..models import Movie
+from ..search import search_movies, to_fts5_query
+
+
+class TestMovieSearch(TestModelSetup):
+    """Tests de la recherche plein texte indexée dans le catalogue local."""
+
+    def setUp(self):
+
+        super().setUp()
+
+        self.list_url = reverse_lazy("movie-list")
+
+    def search_titles(self, text):
+        return [movie.title for movie in search_movies(Movie.objects.all(), text)]
+
+    def test_to_fts5_query(self):
+        """Vérifie que la saisie est citée mot à mot et que le dernier mot est un préfixe."""
+
+        self.assertEqual(to_fts5_query("mind bend"), '"mind" "bend"*')
+        self.assertEqual(to_fts5_query('once" OR NEAR(x'), '"once" "OR" "NEAR" "x"*')
+        self.assertEqual(to_fts5_query(" *\\"), "")
+
+    def test_search_title_and_summary(self):
+        """Vérifie la recherche sur le titre et le résumé, insensible à la casse et aux accents."""
+
+        self.assertEqual(self.search_titles("INCEPTION"), ["Inception"])
+        self.assertEqual(self.search_titles("hollywood 60"), [self.movie_2.title])
+        self.assertEqual(self.search_titles("thrill"), ["Inception"])
+        self.assertEqual(self.search_titles("absent"), [])
+
+        Movie.objects.create(imdb_id="tt0000001", title="Amélie", summary="Paris.")
+        self.assertEqual(self.search_titles("amelie"), ["Amélie"])
+
+    def test_results_are_ranked(self):
+        """Vérifie que les films les plus pertinents sont retournés en premier."""
+
+        Movie.objects.create(
+            imdb_id="tt0000001",
+            title="Heist",
+            summary="A heist in Hollywood, then another heist in Hollywood.",
+        )
+        self.assertEqual(self.search_titles("hollywood")[0], "Heist")
+
+    def test_search_without_index(self):
+        """Vérifie la recherche non indexée des moteurs sans index plein texte."""
+
+        connection = SimpleNamespace(vendor="mysql")
+
+        def search_titles(text):
+            return [
+                movie.title
+                for movie in search_movies(Movie.objects.all(), text, connection)
+            ]
+
+        self.assertEqual(search_titles("INCEPTION"), ["Inception"])
+        self.assertEqual(search_titles("hollywood 60"), [self.movie_2.title])
+        self.assertEqual(search_titles("thrill"), ["Inception"])
+        self.assertEqual(search_titles("absent"), [])
+        self.assertEqual(search_titles(" *"), [])
+
+    def test_index_follows_writes(self):
+        """Vérifie que l'index suit les créations, modifications et suppressions de films."""
+
+        movie = Movie.objects.create(imdb_id="tt0000001", title="Heat")
+        self.assertEqual(self.search_titles("heat"), ["Heat"])
+
+        Movie.objects.filter(pk=movie.pk).update(title="Collateral")
+        self.assertEqual(self.search_titles("heat"), [])
+        self.assertEqual(self.search_titles("collateral"), ["Collateral"])
+
+        movie.delete()
+        self.assertEqual(self.search_titles("collateral"), [])
+
+        Movie.objects.bulk_create([Movie(imdb_id="tt0000002", title="Ronin")])
+        self.assertEqual(self.search_titles("ronin"), ["Ronin"])
+
+    def test_search_movie_list(self):
+        """Vérifie le paramètre `search` de la liste des films."""
+
+        response = self.client.get(self.list_url, {"search": "mind"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["title"], "Inception")
+
+    def test_search_movie_list_with_ordering(self):
+        """Vérifie que `ordering` prime sur la pertinence, qui ne départage que les ex aequo."""
+
+        Movie.objects.bulk_create(
+            [
+                Movie(
+                    imdb_id="tt0000001",
+                    title="Heist",
+                    summary="A heist in Hollywood, then another heist in Hollywood.",
+                    duration_minutes=159,
+                ),
+                Movie(
+                    imdb_id="tt0000002",
+                    title="Sunset",
+                    summary="A long night on a forgotten studio lot, somewhere in Hollywood.",
+                    duration_minutes=90,
+                ),
+            ]
+        )
+
+        response = self.client.get(self.list_url, {"search": "hollywood"})
+        self.assertEqual(response.data["results"][0]["title"], "Heist")
+
+        response = self.client.get(
+            self.list_url, {"search": "hollywood", "ordering": "duration"}
+        )
+        self.assertEqual(
+            [movie["title"] for movie in response.data["results"]],
+            ["Sunset", "Heist", self.movie_2.title],
+        )
+
+        response = self.client.get(
+            self.list_url, {"search": "hollywood", "ordering": "-title"}
+        )
+        self.assertEqual(
+            [movie["title"] for movie in response.data["results"]],
+            ["Sunset", self.movie_2.title, "Heist"],
+        )
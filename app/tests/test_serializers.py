@@ -1,4 +1,8 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from .test_setup import TestModelSetup
+from ..models import Category, Credit, Person
 from ..serializers import (
     MovieListSerializer,
     MovieDetailSerializer,
@@ -48,7 +52,7 @@ class SerializerTest(TestModelSetup):
             },
         )
         self.assertEqual(data["title"], self.movie_data_1["title"])
-        self.assertEqual(data["duration"], self.movie_data_1["duration"])
+        self.assertEqual(data["duration"], "2h28")
         self.assertEqual(data["summary"], self.movie_data_1["summary"])
         self.assertEqual(data["poster_url"], self.movie_data_1["poster_url"])
         self.assertEqual(
@@ -67,6 +71,73 @@ class SerializerTest(TestModelSetup):
             data["categories"][1]["name"], self.movie_data_1["categories"][1]["name"]
         )
 
+    def _movie_payload(self, imdb_id, actors):
+        """Construit les données d'un film à créer avec le casting donné."""
+
+        return {
+            "imdb_id": imdb_id,
+            "title": "Pulp Fiction",
+            "duration": "2h34",
+            "summary": "Crime film.",
+            "poster_url": "http://example.com/pulp.jpg",
+            "directors": [self.director_data],
+            "producers": [{"name": "Lawrence Bender", "imdb_id": f"nm{imdb_id[2:]}"}],
+            "actors": actors,
+            "categories": [self.category_data_2, {"name": f"Crime {imdb_id}"}],
+        }
+
+    def test_movie_detail_serializer_create_reuses_existing_relations(self):
+        """Vérifie que la création réutilise les personnes et catégories existantes sans doublon."""
+
+        serializer = MovieDetailSerializer(
+            data=self._movie_payload(
+                "tt0110912",
+                [self.actor_data_1, {"name": "Uma Thurman", "imdb_id": "nm0000235"}],
+            )
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        movie = serializer.save()
+
+        self.assertEqual(movie.duration_minutes, 154)
+        self.assertEqual(movie.directors, [self.director])
+        self.assertEqual(Person.objects.count(), 6)
+        self.assertEqual(
+            [person.name for person in movie.actors],
+            ["Leonardo DiCaprio", "Uma Thurman"],
+        )
+        self.assertEqual(
+            list(
+                movie.credits.filter(role=Credit.ACTOR).values_list(
+                    "billing_order", flat=True
+                )
+            ),
+            [0, 1],
+        )
+        self.assertEqual(Category.objects.filter(name="Drama").count(), 1)
+        self.assertEqual(
+            set(movie.categories.values_list("name", flat=True)),
+            {"Drama", "Crime tt0110912"},
+        )
+
+    def test_movie_detail_serializer_create_query_count_is_constant(self):
+        """Vérifie que le nombre de requêtes de création ne dépend pas de la taille du casting."""
+
+        counts = []
+        for imdb_id, cast_size in (("tt0000001", 2), ("tt0000002", 30)):
+            actors = [
+                {"name": f"Acteur {i}", "imdb_id": f"nm{imdb_id[2:]}{i:02d}"}
+                for i in range(cast_size)
+            ]
+            serializer = MovieDetailSerializer(
+                data=self._movie_payload(imdb_id, actors)
+            )
+            with CaptureQueriesContext(connection) as context:
+                self.assertTrue(serializer.is_valid(), serializer.errors)
+                serializer.save()
+            counts.append(len(context.captured_queries))
+
+        self.assertEqual(counts[0], counts[1])
+
     def test_add_movie_serializer_valid_data(self):
         """Vérifie que les données valides passent la validation."""
 
@@ -84,6 +155,22 @@ class SerializerTest(TestModelSetup):
             "L'identifiant IMDb de ce film ne peut être vide",
         )
 
+    def test_movie_detail_serializer_duration(self):
+        """Vérifie que la durée est acceptée en minutes ou au format "2h28", et rejetée sinon."""
+
+        for duration, minutes in ((95, 95), ("1h35", 95), ("N/A", None), (None, None)):
+            serializer = MovieDetailSerializer(
+                data=dict(self._movie_payload("tt0000003", []), duration=duration)
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            self.assertEqual(serializer.validated_data["duration_minutes"], minutes)
+
+        serializer = MovieDetailSerializer(
+            data=dict(self._movie_payload("tt0000003", []), duration="long")
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("duration", serializer.errors)
+
     def test_add_movie_serializer_id_imdb_trop_long(self):
         """Vérifie qu'un identifiant IMDb trop long échoue à la validation."""
 
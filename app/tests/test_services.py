@@ -1,10 +1,14 @@
 import unittest
+from datetime import timedelta
 from unittest.mock import patch, MagicMock
 from imdb import IMDbError
 
 # from imdbinfo.models import MovieDetail, Person
+from django.db import connections
 from django.test import TestCase
-from ..services import IMDbService
+from django.utils import timezone
+from ..models import Movie, MovieDetailsCache
+from ..services import IMDbService, MovieImportService
 
 
 class TestIMDbService(TestCase):
@@ -76,7 +80,7 @@ class TestIMDbService(TestCase):
         )
 
     @patch(
-        "app.services.get_movie"
+        "app.providers.get_movie"
     )  # le `patch()` doit viser le module où la fonction à mocker est utilisée, pas là où elle est définie
     def test_get_movie_details_success(self, mock_get_movie):
         """Test la récupération réussie des détails d'un film."""
@@ -126,7 +130,7 @@ class TestIMDbService(TestCase):
         details = self.imdb_service.get_movie_details("0111161")
         self.assertEqual(details["imdb_id"], "0111161")
         self.assertEqual(details["title"], "The Shawshank Redemption")
-        self.assertEqual(details["duration"], "2h22")
+        self.assertEqual(details["duration"], 142)
         self.assertEqual(
             details["summary"],
             "Two imprisoned men bond over a number of years, finding solace and eventual redemption through acts of common decency.",
@@ -153,3 +157,74 @@ class TestIMDbService(TestCase):
         self.assertTrue(
             "Erreur lors de la récupération des détails" in str(context.exception)
         )
+
+    @patch("app.providers.get_movie")
+    def test_get_movie_details_served_from_persistent_cache(self, mock_get_movie):
+        """Vérifie que des détails déjà récupérés sont servis sans appel à IMDb."""
+
+        movie_mock = MagicMock(
+            title="Heat",
+            duration=170,
+            plot="A group of professional bank robbers.",
+            cover_url="http://example.com/heat.jpg",
+            genres=["Crime"],
+        )
+        movie_mock.directors = movie_mock.producers = movie_mock.stars = []
+        mock_get_movie.return_value = movie_mock
+
+        first = self.imdb_service.get_movie_details("0113277")
+        second = IMDbService().get_movie_details("0113277")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get_movie.call_count, 1)
+        self.assertTrue(MovieDetailsCache.objects.filter(imdb_id="0113277").exists())
+
+    @patch("app.providers.get_movie")
+    def test_get_movie_details_refresh_and_staleness(self, mock_get_movie):
+        """Vérifie qu'un rafraîchissement forcé ou une entrée périmée interrogent IMDb."""
+
+        movie_mock = MagicMock(
+            title="Heat",
+            duration=170,
+            plot="A group of professional bank robbers.",
+            cover_url="http://example.com/heat.jpg",
+            genres=["Crime"],
+        )
+        movie_mock.directors = movie_mock.producers = movie_mock.stars = []
+        mock_get_movie.return_value = movie_mock
+
+        self.imdb_service.get_movie_details("0113277")
+        self.imdb_service.get_movie_details("0113277", refresh=True)
+        self.assertEqual(mock_get_movie.call_count, 2)
+
+        MovieDetailsCache.objects.filter(imdb_id="0113277").update(
+            fetched_at=timezone.now() - timedelta(days=365)
+        )
+        self.imdb_service.get_movie_details("0113277")
+        self.assertEqual(mock_get_movie.call_count, 3)
+
+
+class TestMovieImportService(TestCase):
+    """Tests du service d'import de films."""
+
+    def test_bulk_import_closes_worker_connections(self):
+        """Vérifie que les threads de récupération ferment leurs connexions à la base."""
+
+        worker_connections = []
+
+        def get_movie_details(imdb_id):
+            # Comme le cache persistant des détails, lit la base depuis le thread du pool
+            Movie.objects.exists()
+            worker_connections.append(connections["default"])
+            raise RuntimeError("Film introuvable")
+
+        imdb_service = MagicMock(get_movie_details=get_movie_details)
+        results = MovieImportService(imdb_service).bulk_import(
+            ["tt0000001", "tt0000002"]
+        )
+
+        self.assertEqual([result["status"] for result in results], ["failed", "failed"])
+        self.assertEqual(len(worker_connections), 2)
+        for worker_connection in worker_connections:
+            self.assertIsNot(worker_connection, connections["default"])
+            self.assertIsNone(worker_connection.connection)
@@ -1,5 +1,5 @@
 from rest_framework.test import APITestCase
-from ..models import Movie, Director, Producer, Actor, Category
+from ..models import Movie, Person, Credit, Category
 
 
 class TestModelSetup(APITestCase):
@@ -16,7 +16,7 @@ class TestModelSetup(APITestCase):
         self.movie_data_1 = {
             "imdb_id": "tt1234567",
             "title": "Inception",
-            "duration": "2h28",
+            "duration_minutes": 148,
             "summary": "A mind-bending thriller",
             "poster_url": "http://example.com/poster.jpg",
         }
@@ -24,31 +24,37 @@ class TestModelSetup(APITestCase):
         self.movie_data_2 = {
             "imdb_id": "tt7654321",
             "title": "Once Upon a Time in Hollywood",
-            "duration": "2h39m",
+            "duration_minutes": 159,
             "summary": "A movie about Hollywood in the 60s.",
             "poster_url": "http://example.com/poster.jpg",
         }
 
         # Créez des instances de modèles pour les tests
-        self.director = Director.objects.create(**self.director_data)
-        self.producer = Producer.objects.create(**self.producer_data)
-        self.actor_1 = Actor.objects.create(**self.actor_data_1)
-        self.actor_2 = Actor.objects.create(**self.actor_data_2)
+        self.director = Person.objects.create(**self.director_data)
+        self.producer = Person.objects.create(**self.producer_data)
+        self.actor_1 = Person.objects.create(**self.actor_data_1)
+        self.actor_2 = Person.objects.create(**self.actor_data_2)
         self.category_1 = Category.objects.create(**self.category_data_1)
         self.category_2 = Category.objects.create(**self.category_data_2)
 
         self.movie_1 = Movie.objects.create(**self.movie_data_1)
         self.movie_2 = Movie.objects.create(**self.movie_data_2)
 
-        # Ajouter des relations ManyToMany
-        self.movie_1.directors.add(self.director)
-        self.movie_1.producers.add(self.producer)
-        self.movie_1.actors.add(self.actor_1)
+        # Ajouter les crédits et les relations ManyToMany
+        Credit.objects.bulk_create(
+            [
+                Credit(movie=movie, person=person, role=role)
+                for movie, person, role in (
+                    (self.movie_1, self.director, Credit.DIRECTOR),
+                    (self.movie_1, self.producer, Credit.PRODUCER),
+                    (self.movie_1, self.actor_1, Credit.ACTOR),
+                    (self.movie_2, self.director, Credit.DIRECTOR),
+                    (self.movie_2, self.producer, Credit.PRODUCER),
+                    (self.movie_2, self.actor_2, Credit.ACTOR),
+                )
+            ]
+        )
         self.movie_1.categories.add(self.category_1, self.category_2)
-
-        self.movie_2.directors.add(self.director)
-        self.movie_2.producers.add(self.producer)
-        self.movie_2.actors.add(self.actor_2)
         self.movie_2.categories.add(self.category_2)
 
         self.valid_imdb_id_data = {"imdb_id": "tt0111161"}
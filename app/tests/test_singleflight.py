@@ -0,0 +1,135 @@
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+from django.test import SimpleTestCase, override_settings
+
+from ..cache import MovieDetailsStore
+from ..services import IMDbService
+from ..singleflight import SingleFlight, distributed_lock
+
+
+def run_concurrently(func, count):
+    """Lance `func` simultanément dans `count` threads et retourne résultats et erreurs."""
+
+    barrier = threading.Barrier(count)
+    results, errors = [], []
+
+    def target():
+        barrier.wait()
+        try:
+            results.append(func())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+class TestSingleFlight(SimpleTestCase):
+    """Tests du regroupement des appels identiques simultanés."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Vérifie que des appels simultanés de même clé n'exécutent la fonction qu'une fois."""
+
+        single_flight = SingleFlight()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"title": "Inception"}
+
+        results, errors = run_concurrently(
+            lambda: single_flight.do("inception", slow_fetch), 8
+        )
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"title": "Inception"}] * 8)
+
+    def test_error_is_shared_and_call_is_released(self):
+        """Vérifie que l'erreur est propagée aux appels en attente puis que la clé est libérée."""
+
+        single_flight = SingleFlight()
+
+        def failing_fetch():
+            time.sleep(0.2)
+            raise RuntimeError("IMDb indisponible")
+
+        results, errors = run_concurrently(
+            lambda: single_flight.do("inception", failing_fetch), 4
+        )
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(single_flight.do("inception", lambda: "ok"), "ok")
+
+    @override_settings(IMDB_SINGLE_FLIGHT={"CACHE_ALIAS": "default", "WAIT_TIMEOUT": 0})
+    def test_distributed_lock(self):
+        """Vérifie qu'un verrou posé dans le cache n'est obtenu que par un seul détenteur."""
+
+        with distributed_lock("details:tt0111161") as first:
+            with distributed_lock("details:tt0111161") as second:
+                self.assertTrue(first)
+                self.assertFalse(second)
+
+        with distributed_lock("details:tt0111161") as again:
+            self.assertTrue(again)
+
+
+class TestIMDbServiceSingleFlight(SimpleTestCase):
+    """Tests du regroupement des appels dans IMDbService."""
+
+    @patch("imdb.IMDbBase.search_movie")
+    def test_concurrent_identical_searches_share_one_upstream_call(
+        self, mock_search_movie
+    ):
+        """Vérifie que des recherches identiques simultanées n'interrogent IMDb qu'une fois."""
+
+        movie = MagicMock(movieID="1375666")
+        movie.get.side_effect = lambda key, default="": {"title": "Inception"}.get(
+            key, default
+        )
+
+        def slow_search(title):
+            time.sleep(0.2)
+            return [movie]
+
+        mock_search_movie.side_effect = slow_search
+        imdb_service = IMDbService()
+
+        results, errors = run_concurrently(
+            lambda: imdb_service.search_movie("Inception", limit=5), 6
+        )
+
+        self.assertEqual(errors, [])
+        self.assertEqual(mock_search_movie.call_count, 1)
+        self.assertEqual(len(results), 6)
+
+    @patch("app.providers.get_movie")
+    def test_concurrent_identical_details_share_one_upstream_call(self, mock_get_movie):
+        """Vérifie que des demandes de détails simultanées n'interrogent IMDb qu'une fois."""
+
+        movie_mock = MagicMock(title="Heat", duration=170, genres=["Crime"])
+        movie_mock.directors = movie_mock.producers = movie_mock.stars = []
+
+        def slow_get_movie(imdb_id):
+            time.sleep(0.2)
+            return movie_mock
+
+        mock_get_movie.side_effect = slow_get_movie
+        imdb_service = IMDbService()
+        imdb_service.details_store = MovieDetailsStore(ttl=0)
+
+        results, errors = run_concurrently(
+            lambda: imdb_service.get_movie_details("0113277"), 6
+        )
+
+        self.assertEqual(errors, [])
+        self.assertEqual(mock_get_movie.call_count, 1)
+        self.assertTrue(all(result["title"] == "Heat" for result in results))
@@ -0,0 +1,91 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from ..container import Injected, override, resolve
+from ..providers import CinemagoerProvider, LocalProvider
+from ..services import IMDbService
+from ..views import MovieViewSet
+
+# Importe l'application comme le ferait un worker, et mesure la durée des imports
+IMPORT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+import cinevault_back.urls, app.services, app.views, app.async_views
+print(json.dumps({
+    "seconds": time.perf_counter() - started,
+    "imported": [name for name in ("imdbinfo", "imdb.parser.http") if name in sys.modules],
+}))
+"""
+
+
+class TestStartup(SimpleTestCase):
+    """Tests du démarrage des processus : les bibliothèques IMDb ne sont chargées qu'à l'usage."""
+
+    def test_import_does_not_load_imdb_clients(self):
+        """Vérifie que l'import de l'application, sans configuration de recherche, reste léger."""
+
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if key not in ("SEARCH_FILM_LIMIT", "IMDB_WARM_UP")
+        }
+        env["DJANGO_SETTINGS_MODULE"] = "cinevault_back.settings"
+        completed = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        self.assertEqual(result["imported"], [])
+        # Import d'imdbinfo seul : environ 0,5 s
+        self.assertLess(result["seconds"], 5)
+
+    def test_client_is_built_on_first_use(self):
+        """Vérifie que le client Cinemagoer est construit au premier usage ou par `warm_up`."""
+
+        imdb_service = IMDbService(CinemagoerProvider())
+        self.assertIsNone(imdb_service.provider._ia)
+
+        imdb_service.warm_up()
+
+        self.assertIsNotNone(imdb_service.provider._ia)
+        self.assertIs(imdb_service.provider.ia, imdb_service.provider._ia)
+        self.assertIn("imdbinfo.services", sys.modules)
+
+    def test_services_are_not_resolved_on_class_access(self):
+        """Vérifie que l'introspection de la vue (routeur DRF) ne résout pas ses services."""
+
+        self.assertIsInstance(MovieViewSet.imdb_service, Injected)
+        self.assertIsInstance(MovieViewSet().imdb_service, IMDbService)
+
+    def test_override_after_warm_up(self):
+        """Vérifie qu'une dépendance déjà résolue (par exemple par `warm_up`) peut être remplacée."""
+
+        imdb_service = resolve(IMDbService)
+        self.addCleanup(override, IMDbService, imdb_service)
+
+        local_service = override(IMDbService, IMDbService(LocalProvider([])))
+
+        self.assertIs(resolve(IMDbService), local_service)
+        self.assertIsInstance(resolve(IMDbService).provider, LocalProvider)
+        self.assertIs(MovieViewSet().imdb_service, local_service)
+
+    def test_search_limit_from_settings(self):
+        """Vérifie que la limite de recherche par défaut vient de `IMDB_SEARCH_LIMIT`."""
+
+        with self.settings(IMDB_SEARCH_LIMIT=3):
+            imdb_service = IMDbService(CinemagoerProvider())
+
+        self.assertEqual(imdb_service.search_limit, 3)
@@ -1,11 +1,18 @@
+import csv
+import io
+import json
 import logging
 from unittest.mock import patch
+from django.db import IntegrityError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from django.urls import reverse_lazy
 
 from .test_setup import TestModelSetup
+from ..serializers import MovieDetailSerializer
 from ..services import IMDbService
-from ..models import Category
+from ..models import Category, Credit, Movie, Person
 
 
 class TestMovieViewSet(TestModelSetup):
@@ -21,14 +28,43 @@ class TestMovieViewSet(TestModelSetup):
         self.detail_url = reverse_lazy("movie-detail", kwargs={"pk": self.movie_1.id})
         self.search_url = reverse_lazy("movie-search_movie")
         self.add_movie_url = reverse_lazy("movie-add_movie")
+        self.bulk_add_url = reverse_lazy("movie-bulk_add_movies")
+        self.export_url = reverse_lazy("movie-export")
 
     def test_get_movie_list(self):
         """Vérifie la récupération de la liste des films."""
 
         response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
-        self.assertEqual(response.json()[0]["title"], self.movie_data_1.get("title"))
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(
+            response.json()["results"][0]["title"], self.movie_data_1.get("title")
+        )
+
+    def test_get_movie_list_paginated(self):
+        """Vérifie que la liste est paginée et que la taille de page est configurable."""
+
+        response = self.client.get(self.list_url, {"page_size": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNotNone(response.data["next"])
+
+    def test_get_movie_list_query_count_is_constant(self):
+        """Vérifie que le nombre de requêtes SQL de la liste ne dépend pas du nombre de films."""
+
+        # count + page de films + préchargement des catégories
+        with self.assertNumQueries(3):
+            self.client.get(self.list_url)
+
+        for i in range(20):
+            movie = Movie.objects.create(imdb_id=f"tt90000{i:02d}", title=f"Film {i}")
+            movie.categories.add(self.category_1, self.category_2)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_url, {"page_size": 20})
+        self.assertEqual(len(response.data["results"]), 20)
 
     def test_get_movie_detail(self):
         """Vérifie la récupération des détails d'un film spécifique."""
@@ -40,6 +76,81 @@ class TestMovieViewSet(TestModelSetup):
         self.assertIn("categories", response.data)
         self.assertGreater(len(response.data["categories"]), 0)
 
+    def test_get_movie_detail_query_count_is_constant(self):
+        """Vérifie que le détail d'un film se lit en un nombre fixe de requêtes SQL."""
+
+        for i in range(10):
+            actor = Person.objects.create(name=f"Acteur {i}", imdb_id=f"nm90000{i:02d}")
+            Credit.objects.create(
+                movie=self.movie_1, person=actor, role=Credit.ACTOR, billing_order=i + 1
+            )
+
+        # film + crédits (avec leurs personnes) + catégories
+        with self.assertNumQueries(3):
+            response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["actors"]), 11)
+
+    def test_get_movie_list_sparse_fields(self):
+        """Vérifie que `fields` limite les champs rendus et les colonnes lues."""
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.list_url, {"fields": "id,title"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data["results"][0]), {"id", "title"})
+        # count + page de films, sans préchargement des catégories
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertNotIn("poster_url", context.captured_queries[-1]["sql"])
+
+    def test_get_movie_list_expand(self):
+        """Vérifie que `expand` ajoute des champs à la liste en un nombre fixe de requêtes."""
+
+        response = self.client.get(self.list_url, {"expand": "directors,duration"})
+        self.assertEqual(
+            set(response.data["results"][0]),
+            {"id", "title", "poster_url", "categories", "directors", "duration"},
+        )
+        self.assertEqual(response.data["results"][0]["directors"], [self.director_data])
+        self.assertEqual(response.data["results"][0]["duration"], "2h28")
+
+        for i in range(20):
+            movie = Movie.objects.create(imdb_id=f"tt90000{i:02d}", title=f"Film {i}")
+            Credit.objects.create(
+                movie=movie, person=self.director, role=Credit.DIRECTOR
+            )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                self.list_url,
+                {"fields": "title", "expand": "directors", "page_size": 20},
+            )
+        self.assertEqual(set(response.data["results"][0]), {"title", "directors"})
+        # count + page de films + crédits des seuls réalisateurs
+        self.assertEqual(len(context.captured_queries), 3)
+        self.assertIn("'director'", context.captured_queries[-1]["sql"])
+
+    def test_get_movie_detail_sparse_fields(self):
+        """Vérifie que le détail ne lit que les champs et relations demandés."""
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.detail_url, {"fields": "title,actors"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, {"title": "Inception", "actors": [self.actor_data_1]}
+        )
+        # film (sans le résumé) + crédits des seuls acteurs
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertNotIn("summary", context.captured_queries[0]["sql"])
+
+    def test_get_movie_unknown_fields(self):
+        response = self.client.get(self.list_url, {"fields": "title,budget"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("budget", str(response.data["fields"]))
+
+        response = self.client.get(self.detail_url, {"expand": "roles"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("expand", response.data)
+
     @patch.object(IMDbService, "search_movie")
     def test_search_movies_valid(self, mock_search_movie):
         """Vérifie la recherche de films avec un titre valide."""
@@ -117,7 +228,7 @@ class TestMovieViewSet(TestModelSetup):
         mock_get_movie_details.return_value = {
             "imdb_id": self.movie_data_1["imdb_id"],
             "title": self.movie_data_1["title"],
-            "duration": self.movie_data_1["duration"],
+            "duration": "2h28",
             "summary": self.movie_data_1["summary"],
             "poster_url": self.movie_data_1["poster_url"],
             "directors": [self.director_data],
@@ -135,6 +246,27 @@ class TestMovieViewSet(TestModelSetup):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("Le film existe déjà dans le catalogue.", response.data["detail"])
 
+    @patch.object(MovieDetailSerializer, "save", side_effect=IntegrityError)
+    @patch.object(IMDbService, "get_movie_details")
+    def test_add_movie_concurrent_duplicate(self, mock_get_movie_details, mock_save):
+        """Vérifie qu'un ajout concurrent perdu (violation d'unicité) est signalé comme doublon."""
+
+        mock_get_movie_details.return_value = {
+            "imdb_id": "tt0068646",
+            "title": "The Godfather",
+            "duration": "2h55",
+            "summary": "Crime film.",
+            "poster_url": "http://example.com/godfather.jpg",
+            "directors": [],
+            "producers": [],
+            "actors": [],
+            "categories": [],
+        }
+
+        response = self.client.post(self.add_movie_url, {"imdb_id": "tt0068646"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Le film existe déjà dans le catalogue.", response.data["detail"])
+
     def test_add_movie_with_invalid_imdb_id(self):
         """Test d'ajout avec un IMDb ID invalide."""
 
@@ -145,11 +277,195 @@ class TestMovieViewSet(TestModelSetup):
             response.data["detail"],
         )
 
+    @patch.object(IMDbService, "get_movie_details")
+    def test_bulk_add_movies(self, mock_get_movie_details):
+        """Vérifie l'ajout en lot : films créés, déjà présents et en échec sont rapportés par ID."""
+
+        def fake_details(imdb_id):
+            if imdb_id == "tt0000bad":
+                raise RuntimeError("Erreur lors de la récupération des détails du film")
+            return {
+                "imdb_id": imdb_id,
+                "title": f"Film {imdb_id}",
+                "duration": "1h30",
+                "summary": "Résumé.",
+                "poster_url": "http://example.com/poster.jpg",
+                "directors": [self.director_data],
+                "producers": [],
+                "actors": [
+                    {"name": f"Acteur {imdb_id}", "imdb_id": f"nm{imdb_id[2:]}"}
+                ],
+                "categories": [self.category_data_2],
+            }
+
+        mock_get_movie_details.side_effect = fake_details
+        imdb_ids = ["tt0000001", self.movie_data_1["imdb_id"], "tt0000bad", "tt0000002"]
+
+        response = self.client.post(
+            self.bulk_add_url, {"imdb_ids": imdb_ids}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            ["created", "exists", "failed", "created"],
+        )
+        self.assertEqual(
+            response.data["summary"], {"created": 2, "exists": 1, "failed": 1}
+        )
+        self.assertTrue(Movie.objects.filter(imdb_id="tt0000002").exists())
+        # Le film déjà présent n'est pas récupéré à nouveau depuis IMDb
+        self.assertEqual(mock_get_movie_details.call_count, 3)
+
+    def test_bulk_add_movies_empty_list(self):
+        """Vérifie qu'une liste d'identifiants vide est rejetée."""
+
+        response = self.client.post(self.bulk_add_url, {"imdb_ids": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("imdb_ids", response.data)
+
     def test_filter_by_category(self):
         response = self.client.get(
             reverse_lazy("movie-list"), {"categories": "Science Fiction"}
         )
         logging.debug(response.data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        for movie in response.data:
+        for movie in response.data["results"]:
             self.assertIn("Science Fiction", movie["categories"])
+
+    def test_filter_by_several_categories(self):
+        """Vérifie le filtrage exact sur plusieurs catégories, en mode `any` et `all`, sans doublon."""
+
+        response = self.client.get(
+            self.list_url, {"categories": "Science Fiction,Drama"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+
+        response = self.client.get(
+            self.list_url,
+            {"categories": "Science Fiction,Drama", "categories_match": "all"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [movie["title"] for movie in response.data["results"]], ["Inception"]
+        )
+
+        response = self.client.get(self.list_url, {"categories": "fiction"})
+        self.assertEqual(response.data["count"], 0)
+
+        response = self.client.get(
+            self.list_url, {"categories": "Drama,Inconnue", "categories_match": "all"}
+        )
+        self.assertEqual(response.data["count"], 0)
+
+    def test_filter_by_category_invalid_match_mode(self):
+        """Vérifie qu'un mode de correspondance inconnu est rejeté."""
+
+        response = self.client.get(
+            self.list_url, {"categories": "Drama", "categories_match": "some"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filter_by_duration(self):
+        """Vérifie le filtrage par durée minimale et maximale, en minutes."""
+
+        response = self.client.get(self.list_url, {"min_duration": 150})
+        self.assertEqual(
+            [movie["title"] for movie in response.data["results"]],
+            ["Once Upon a Time in Hollywood"],
+        )
+
+        response = self.client.get(
+            self.list_url, {"min_duration": 140, "max_duration": 150}
+        )
+        self.assertEqual(
+            [movie["title"] for movie in response.data["results"]], ["Inception"]
+        )
+
+        response = self.client.get(self.list_url, {"max_duration": "deux heures"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ordering_by_duration(self):
+        """Vérifie que le tri par durée est numérique et non lexicographique."""
+
+        Movie.objects.create(
+            imdb_id="tt0000099", title="Court métrage", duration_minutes=95
+        )
+
+        response = self.client.get(self.list_url, {"ordering": "duration"})
+        self.assertEqual(
+            [movie["title"] for movie in response.data["results"]],
+            ["Court métrage", "Inception", "Once Upon a Time in Hollywood"],
+        )
+
+        response = self.client.get(self.list_url, {"ordering": "-duration"})
+        self.assertEqual(
+            response.data["results"][0]["title"], "Once Upon a Time in Hollywood"
+        )
+
+    def test_export_ndjson(self):
+        """Vérifie l'export du catalogue en NDJSON, un film et ses relations par ligne."""
+
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        movies = [json.loads(line) for line in lines]
+        self.assertEqual(
+            [movie["imdb_id"] for movie in movies],
+            [self.movie_data_1["imdb_id"], self.movie_data_2["imdb_id"]],
+        )
+        self.assertEqual(movies[0]["duration_minutes"], 148)
+        self.assertEqual(movies[0]["directors"], [self.director_data])
+        self.assertEqual(sorted(movies[0]["categories"]), ["Drama", "Science Fiction"])
+
+    def test_export_csv_with_filters(self):
+        """Vérifie l'export CSV, limité aux films retenus par les filtres de la liste."""
+
+        response = self.client.get(
+            self.export_url, {"output": "csv", "categories": "Science Fiction"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["title"], "Inception")
+        self.assertEqual(rows[0]["actors"], self.actor_data_1["name"])
+        self.assertEqual(
+            set(rows[0]["categories"].split("|")), {"Drama", "Science Fiction"}
+        )
+
+    @override_settings(MOVIE_EXPORT_CHUNK_SIZE=1)
+    def test_export_query_count_per_chunk(self):
+        """Vérifie que les relations sont préchargées par lot et non film par film."""
+
+        response = self.client.get(self.export_url)
+        # Une lecture des films, puis par lot (ici un film par lot) une requête pour tous les
+        # crédits et une pour les catégories
+        with self.assertNumQueries(1 + 2 * 2):
+            b"".join(response.streaming_content)
+
+    def test_export_invalid_output(self):
+        response = self.client.get(self.export_url, {"output": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("output", response.data)
+
+    def test_category_facets(self):
+        """Vérifie le comptage des films par catégorie en une seule requête d'agrégation."""
+
+        facets_url = reverse_lazy("movie-facets")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(facets_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["categories"],
+            [{"name": "Drama", "count": 2}, {"name": "Science Fiction", "count": 1}],
+        )
+
+        response = self.client.get(facets_url, {"search": "hollywood"})
+        self.assertEqual(response.data["categories"], [{"name": "Drama", "count": 1}])
@@ -1,8 +1,22 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import MovieViewSet
+from . import async_views
+from .views import ImportJobViewSet, MovieViewSet, PersonViewSet
 
 
 router = DefaultRouter()
 router.register(r"movies", MovieViewSet, basename="movie")
+router.register(r"jobs", ImportJobViewSet, basename="job")
+router.register(r"people", PersonViewSet, basename="person")
 
-urlpatterns = router.urls
\ No newline at end of file
+# Variantes asynchrones (ASGI) des endpoints interrogeant IMDb
+async_urlpatterns = [
+    path(
+        "movies/async/search/",
+        async_views.search_movies,
+        name="movie-async_search_movie",
+    ),
+    path("movies/async/add/", async_views.add_movie, name="movie-async_add_movie"),
+]
+
+urlpatterns = async_urlpatterns + router.urls
\ No newline at end of file
@@ -0,0 +1,57 @@
+import re
+from typing import Optional
+
+# Valeurs utilisées lorsque la durée d'un film n'est pas connue
+UNKNOWN_DURATION = "Non indiqué"
+UNKNOWN_DURATION_VALUES = {"", "n/a", "non indiqué"}
+
+_DURATION_RE = re.compile(
+    r"^\s*(?:(?P<hours>\d+)\s*h)?\s*(?:(?P<minutes>\d+)\s*(?:m|min|mn)?)?\s*$",
+    re.IGNORECASE,
+)
+
+
+def parse_duration(value) -> Optional[int]:
+    """
+    Convertit une durée en nombre de minutes.
+
+    Args:
+        value (int | str | None): Durée en minutes ("148", 148) ou au format heures/minutes
+            ("2h28", "2h39m", "2h", "45min").
+
+    Returns:
+        Optional[int]: Durée en minutes, ou None si elle n'est pas renseignée.
+
+    Raises:
+        ValueError: Si la durée n'est pas dans un format reconnu.
+    """
+    if value is None:
+        return None
+    if isinstance(value, int):
+        if value < 0:
+            raise ValueError(f"Durée négative : {value}")
+        return value
+
+    text = str(value).strip()
+    if text.lower() in UNKNOWN_DURATION_VALUES:
+        return None
+
+    match = _DURATION_RE.match(text)
+    if not match or not (match.group("hours") or match.group("minutes")):
+        raise ValueError(f"Durée non reconnue : {value}")
+    return int(match.group("hours") or 0) * 60 + int(match.group("minutes") or 0)
+
+
+def format_duration(minutes: Optional[int]) -> str:
+    """
+    Formate une durée en minutes pour l'affichage ("2h28").
+
+    Args:
+        minutes (Optional[int]): Durée en minutes.
+
+    Returns:
+        str: Durée formatée, ou "Non indiqué" si elle n'est pas renseignée.
+    """
+    if minutes is None:
+        return UNKNOWN_DURATION
+    return f"{minutes // 60}h{minutes % 60}"
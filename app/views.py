@@ -1,52 +1,244 @@
 import logging
+import math
+from typing import Callable, Dict, Tuple
 
-from rest_framework import viewsets, status
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import Prefetch
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework import mixins, viewsets, status
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from typing import Any
+from rest_framework.reverse import reverse
 
-from .filters import MovieFilter
-from .models import Movie
+from .export import FORMATS, stream_catalogue
+from .filters import MovieFilter, MovieSearchFilter
+from .jobs import enqueue_import
+from .metrics import ViewMetricsMixin, registry
+from .models import Credit, ImportJob, Movie, Person
+from .resilience import CircuitOpenError, UpstreamTimeout
 from .serializers import (
     MovieListSerializer,
     MovieDetailSerializer,
     MovieSearchRequestSerializer,
     MovieAddRequestSerializer,
+    MovieBulkAddRequestSerializer,
+    MovieExportRequestSerializer,
+    ImportJobSerializer,
+    PersonDetailSerializer,
+    FilmographySerializer,
+    FilmographyRequestSerializer,
+    SparseFieldsetRequestSerializer,
 )
 
-from .container import injector
-from .services import IMDbService
+from .container import Injected
+from .services import IMDbService, MovieImportService
 
 
-class MovieViewSet(viewsets.ModelViewSet):
+def upstream_error(error: Exception) -> Tuple[int, Dict, Dict]:
+    """
+    Réponse à un appel à IMDb refusé par le disjoncteur (503, avec `Retry-After`) ou resté sans
+    réponse dans le délai imparti (504), commune aux vues DRF et aux vues asynchrones.
+
+    Args:
+        error (Exception): `CircuitOpenError` ou `UpstreamTimeout`.
+
+    Returns:
+        Tuple[int, Dict, Dict]: Statut, corps et en-têtes de la réponse.
+    """
+    if isinstance(error, CircuitOpenError):
+        return (
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            {"detail": str(error)},
+            {"Retry-After": str(math.ceil(error.retry_after))},
+        )
+    return status.HTTP_504_GATEWAY_TIMEOUT, {"detail": str(error)}, {}
+
+
+def upstream_error_response(error: Exception) -> Response:
+    """Réponse DRF à un appel à IMDb refusé ou sans réponse (voir `upstream_error`)."""
+
+    status_code, data, headers = upstream_error(error)
+    return Response(data, status=status_code, headers=headers)
+
+
+def add_imdb_movie(data, request, fetch_details: Callable) -> Tuple[int, Dict, Dict]:
+    """
+    Ajoute un film au catalogue via un identifiant IMDb, pour les vues DRF et asynchrones.
+
+    Args:
+        data: Données reçues (`imdb_id`, `refresh`, `background`).
+        request: Requête reçue, pour l'URL de suivi d'un import en arrière-plan.
+        fetch_details (Callable): Récupération des détails d'un film
+            (`IMDbService.get_movie_details` ou son exécution dans un pool dédié).
+
+    Returns:
+        Tuple[int, Dict, Dict]: Statut, corps et en-têtes de la réponse.
+    """
+    serializer = MovieAddRequestSerializer(data=data)
+    if not serializer.is_valid():
+        logging.warning(f"Erreur d'entrée: {serializer.errors}")
+        return status.HTTP_400_BAD_REQUEST, serializer.errors, {}
+
+    imdb_id = serializer.validated_data["imdb_id"]
+    logging.info(f"Tentative d'ajout du film avec l'ID IMDb : {imdb_id} au catalogue")
+    already_exists = (
+        status.HTTP_400_BAD_REQUEST,
+        {"detail": "Le film existe déjà dans le catalogue."},
+        {},
+    )
+    try:
+        if Movie.objects.filter(imdb_id=imdb_id).exists():
+            logging.warning(f"Le film avec l'ID IMDb {imdb_id} existe déjà.")
+            return already_exists
+
+        if serializer.validated_data["background"]:
+            job = enqueue_import(imdb_id, refresh=serializer.validated_data["refresh"])
+            return (
+                status.HTTP_202_ACCEPTED,
+                {
+                    "job_id": job.id,
+                    "status": job.status,
+                    "status_url": reverse(
+                        "job-detail", kwargs={"pk": job.id}, request=request
+                    ),
+                },
+                {},
+            )
+
+        movie_details = fetch_details(
+            imdb_id, refresh=serializer.validated_data["refresh"]
+        )
+        logging.debug(f"Détails du film récupérés: {movie_details}")
+        detail_serializer = MovieDetailSerializer(data=movie_details)
+        if not detail_serializer.is_valid():
+            logging.error(
+                f"Erreurs de validation lors de l'ajout du film : {detail_serializer.errors}"
+            )
+            return status.HTTP_400_BAD_REQUEST, detail_serializer.errors, {}
+        detail_serializer.save()
+        logging.info(f"Film avec l'ID {imdb_id} ajouté au catalogue.")
+        return status.HTTP_201_CREATED, serializer.data, {}
+    except IntegrityError:
+        # Un ajout concurrent du même film a été enregistré entre la vérification et l'insertion
+        logging.warning(f"Le film avec l'ID IMDb {imdb_id} existe déjà.")
+        return already_exists
+    except (CircuitOpenError, UpstreamTimeout) as e:
+        return upstream_error(e)
+    except Exception as e:
+        logging.exception(f"Erreur lors de l'ajout du film avec l'ID {imdb_id}")
+        return status.HTTP_500_INTERNAL_SERVER_ERROR, {"detail": str(e)}, {}
+
+
+class MovieViewSet(ViewMetricsMixin, viewsets.ModelViewSet):
     """VueSet pour gérer les opérations CRUD sur les films, avec recherche, ajout à partir de l'IMDb
-    et filtres avancés par catégories, réalisateurs, etc."""
+    et filtres avancés par catégories, réalisateurs, etc.
+
+    La liste et le détail acceptent `?fields=` (champs rendus) et `?expand=` (champs ajoutés à
+    ceux rendus par défaut), par exemple `?fields=id,title&expand=directors` : seules les
+    colonnes et relations rendues sont lues en base.
+    """
+
+    # Actions dont les champs rendus peuvent être choisis par le client
+    SPARSE_FIELDSET_ACTIONS = ("list", "retrieve")
 
     queryset = Movie.objects.all()
     serializer_class = MovieListSerializer
     detail_serializer_class = MovieDetailSerializer
 
     # Configuration des filtres
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [DjangoFilterBackend, MovieSearchFilter]
     filterset_class = MovieFilter
     search_fields = ["title", "summary"]
-    ordering_fields = ["title", "duration"]
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initialisation de la VueSet pour les films avec injection de dépendance de IMDbService."""
+    # Services résolus une seule fois dans le conteneur, partagés par toutes les requêtes
+    imdb_service: IMDbService = Injected(IMDbService)
+    import_service: MovieImportService = Injected(MovieImportService)
+
+    def get_queryset(self):
+        """Adapte le QuerySet à l'action pour éviter les requêtes N+1."""
 
-        logging.info("Initialisation de la vue gérant les films")
-        super().__init__(*args, **kwargs)
-        self.imdb_service: IMDbService = injector.get(
-            IMDbService
-        )  # Pour l'injection des dépendances
+        queryset = super().get_queryset()
+        if self.action == "list":
+            return queryset.for_list(self.get_rendered_sources())
+        if self.action == "retrieve":
+            return queryset.with_details(self.get_rendered_sources())
+        if self.action == "export":
+            return queryset.order_by("id")
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "retrieve":
             return self.detail_serializer_class
         return super().get_serializer_class()
 
+    def get_serializer(self, *args, **kwargs):
+        if self.action in self.SPARSE_FIELDSET_ACTIONS:
+            kwargs.update(self.get_sparse_fieldset())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_sparse_fieldset(self) -> dict:
+        """
+        Lit et valide les paramètres `fields` et `expand` de la requête.
+
+        Returns:
+            dict: Champs demandés (`fields`) et étendus (`expand`), s'ils sont fournis.
+
+        Raises:
+            ValidationError: Si un champ demandé n'existe pas (réponse 400).
+        """
+        if not hasattr(self, "_sparse_fieldset"):
+            serializer = SparseFieldsetRequestSerializer(
+                data=self.request.query_params,
+                context={"available": self.get_serializer_class().available_fields()},
+            )
+            serializer.is_valid(raise_exception=True)
+            self._sparse_fieldset = serializer.validated_data
+        return self._sparse_fieldset
+
+    def get_rendered_sources(self) -> list:
+        """Attributs des films lus par les champs rendus, pour limiter le QuerySet à ceux-ci."""
+
+        return self.get_serializer_class().rendered_sources(
+            **self.get_sparse_fieldset()
+        )
+
+    @action(detail=False, methods=["get"], url_path="facets", url_name="facets")
+    def facets(self, request):
+        """Retourne le nombre de films par catégorie pour les filtres demandés."""
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(
+            {"categories": queryset.category_facets()}, status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=["get"], url_path="export", url_name="export")
+    def export(self, request):
+        """
+        Exporte le catalogue (filtres de la liste compris) en NDJSON ou en CSV.
+
+        La réponse est diffusée au fil de la lecture de la base, par lots de
+        `MOVIE_EXPORT_CHUNK_SIZE` films : la mémoire utilisée ne dépend pas de la taille du
+        catalogue et les premières lignes sont envoyées sans attendre la fin de la lecture.
+        """
+
+        serializer = MovieExportRequestSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            logging.warning(f"Erreur d'entrée: {serializer.errors}")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        output = serializer.validated_data["output"]
+        queryset = self.filter_queryset(self.get_queryset())
+        logging.info(f"Export du catalogue au format {output}")
+
+        response = StreamingHttpResponse(
+            stream_catalogue(queryset, output, settings.MOVIE_EXPORT_CHUNK_SIZE),
+            content_type=FORMATS[output],
+        )
+        response["Content-Disposition"] = f'attachment; filename="catalogue.{output}"'
+        return response
+
     @action(detail=False, methods=["get"], url_path="search", url_name="search_movie")
     def search_movies(self, request):
         """Recherche les films sur IMDb en fonction d'un titre."""
@@ -59,6 +251,8 @@ class MovieViewSet(viewsets.ModelViewSet):
             try:
                 results = self.imdb_service.search_movie(title)
                 return Response(results, status=status.HTTP_200_OK)
+            except (CircuitOpenError, UpstreamTimeout) as e:
+                return upstream_error_response(e)
             except Exception as e:
                 logging.exception(
                     f"Une erreur est survenue lors de la recherche du film {title}: {e}"
@@ -75,40 +269,105 @@ class MovieViewSet(viewsets.ModelViewSet):
     def add_movie(self, request):
         """Ajoute un film au catalogue via un identifiant IMDb."""
 
-        serializer = MovieAddRequestSerializer(data=request.data)
+        status_code, data, headers = add_imdb_movie(
+            request.data, request, self.imdb_service.get_movie_details
+        )
+        return Response(data, status=status_code, headers=headers)
+
+    @action(
+        detail=False, methods=["post"], url_path="bulk_add", url_name="bulk_add_movies"
+    )
+    def bulk_add_movies(self, request):
+        """Ajoute plusieurs films au catalogue via une liste d'identifiants IMDb."""
+
+        serializer = MovieBulkAddRequestSerializer(data=request.data)
         if serializer.is_valid():
-            imdb_id = serializer.validated_data["imdb_id"]
+            imdb_ids = serializer.validated_data["imdb_ids"]
 
-            logging.info(
-                f"Tentative d'ajout du film avec l'ID IMDb : {imdb_id} au catalogue"
-            )
-            try:
-                if Movie.objects.filter(imdb_id=imdb_id).exists():
-                    logging.warning(f"Le film avec l'ID IMDb {imdb_id} existe déjà.")
-                    return Response(
-                        {"detail": "Le film existe déjà dans le catalogue."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-
-                movie_details = self.imdb_service.get_movie_details(imdb_id)
-                logging.debug(f"Détails du film récupérés: {movie_details}")
-                detail_serializer = self.detail_serializer_class(data=movie_details)
-                if detail_serializer.is_valid():
-                    detail_serializer.save()
-                    logging.info(f"Film avec l'ID {imdb_id} ajouté au catalogue.")
-                    return Response(serializer.data, status=status.HTTP_201_CREATED)
-                logging.error(
-                    f"Erreurs de validation lors de l'ajout du film : {detail_serializer.errors}"
-                )
-                return Response(
-                    detail_serializer.errors,
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            except Exception as e:
-                logging.exception(f"Erreur lors de l'ajout du film avec l'ID {imdb_id}")
-                return Response(
-                    {"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            logging.info(f"Tentative d'ajout de {len(imdb_ids)} film(s) au catalogue")
+            results = self.import_service.bulk_import(imdb_ids)
+            summary = {
+                state: sum(1 for result in results if result["status"] == state)
+                for state in (
+                    MovieImportService.STATUS_CREATED,
+                    MovieImportService.STATUS_EXISTS,
+                    MovieImportService.STATUS_FAILED,
                 )
+            }
+            return Response(
+                {"summary": summary, "results": results}, status=status.HTTP_200_OK
+            )
         else:
             logging.warning(f"Erreur d'entrée: {serializer.errors}")
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class ImportJobViewSet(ViewMetricsMixin, viewsets.ReadOnlyModelViewSet):
+    """VueSet en lecture seule pour suivre les tâches d'import de films en arrière-plan."""
+
+    queryset = ImportJob.objects.order_by("-created_at", "-id")
+    serializer_class = ImportJobSerializer
+
+
+class PersonViewSet(
+    ViewMetricsMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+):
+    """VueSet en lecture seule pour consulter une personne et sa filmographie dans le catalogue.
+
+    Les personnes sont désignées par leur identifiant IMDb (`/api/people/nm0000233/`), lu par
+    l'index unique de la colonne.
+    """
+
+    queryset = Person.objects.all()
+    serializer_class = PersonDetailSerializer
+    lookup_field = "imdb_id"
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "retrieve":
+            return queryset.with_credit_counts()
+        return queryset.only("id", "imdb_id")
+
+    @action(detail=True, methods=["get"], url_path="movies", url_name="movies")
+    def movies(self, request, imdb_id=None):
+        """
+        Retourne la filmographie paginée d'une personne, éventuellement limitée à un rôle
+        (`?role=actor`), avec les rôles qu'elle tient dans chaque film.
+
+        Les films sont sélectionnés par une sous-requête sur ses crédits (index `person, role`),
+        sans jointure ni dédoublonnage : le nombre de requêtes ne dépend pas de la longueur de
+        la filmographie.
+        """
+
+        serializer = FilmographyRequestSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            logging.warning(f"Erreur d'entrée: {serializer.errors}")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        person = self.get_object()
+        credits = Credit.objects.filter(person=person)
+        role = serializer.validated_data.get("role")
+        if role:
+            credits = credits.filter(role=role)
+
+        queryset = (
+            Movie.objects.filter(id__in=credits.values("movie"))
+            .for_list()
+            .prefetch_related(
+                Prefetch(
+                    "credits",
+                    queryset=credits.only("movie", "role"),
+                    to_attr="person_credits",
+                )
+            )
+        )
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(FilmographySerializer(page, many=True).data)
+
+
+def metrics(request):
+    """Exporte les métriques de l'application au format texte de Prometheus."""
+
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
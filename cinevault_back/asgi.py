@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cinevault_back.settings')
+# Django déconseille les connexions persistantes sous ASGI : les requêtes d'un même client
+# passent par des threads différents, dont les connexions ne seraient pas réutilisées
+os.environ["DATABASE_CONN_MAX_AGE"] = "0"
 
 application = get_asgi_application()
@@ -49,6 +49,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "app.instrumentation.RequestInstrumentationMiddleware",
+    "app.db_routers.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -81,6 +83,35 @@ WSGI_APPLICATION = "cinevault_back.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Profils de connexion SQLite, choisis par DATABASE_PROFILE. "production" :
+# - journal WAL : les lectures ne sont plus bloquées par une écriture en cours ;
+# - synchronous=NORMAL : plus de synchronisation disque à chaque transaction (sûr en WAL, seules
+#   les dernières transactions peuvent être perdues en cas de coupure de courant) ;
+# - lecture par mmap et cache de pages de 64 Mo par connexion ;
+# - attente d'un verrou jusqu'à 20 s, et transactions ouvertes en IMMEDIATE : l'écrivain prend
+#   le verrou dès le début de la transaction au lieu d'échouer en « database is locked » ;
+# - connexions conservées entre les requêtes (CONN_MAX_AGE), vérifiées avant réutilisation ;
+#   sous WSGI seulement : asgi.py désactive les connexions persistantes.
+DATABASE_PROFILES = {
+    "default": {},
+    "production": {
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", "600")),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "timeout": 20,
+            "transaction_mode": "IMMEDIATE",
+            "init_command": (
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA mmap_size=268435456;"
+                "PRAGMA cache_size=-65536;"
+                "PRAGMA temp_store=MEMORY"
+            ),
+        },
+    },
+}
+DATABASE_PROFILE = os.getenv("DATABASE_PROFILE", "default")
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
@@ -88,6 +119,117 @@ DATABASES = {
         "TEST": {
             "NAME": BASE_DIR / "test_cine_vault_db.sqlite3",
         },
+        **DATABASE_PROFILES[DATABASE_PROFILE],
+    }
+}
+
+# Réplicas en lecture de la base principale (copies SQLite tenues à jour par un outil de
+# réplication externe) : chemins séparés par des virgules. Les requêtes de lecture y sont
+# envoyées par app.db_routers ; un client qui vient d'écrire lit sur la base principale pendant
+# DATABASE_REPLICA_STICKY_SECONDS secondes (délai de réplication toléré)
+DATABASE_REPLICAS = []
+for index, path in enumerate(
+    filter(None, os.getenv("DATABASE_REPLICA_PATHS", "").split(",")), start=1
+):
+    DATABASES[f"replica_{index}"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": path.strip(),
+        "TEST": {"MIRROR": "default"},
+        **DATABASE_PROFILES[DATABASE_PROFILE],
+    }
+    DATABASE_REPLICAS.append(f"replica_{index}")
+
+DATABASE_ROUTERS = ["app.db_routers.ReplicaRouter"]
+DATABASE_REPLICA_STICKY_COOKIE = "cinevault_primary"
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv("DATABASE_REPLICA_STICKY_SECONDS", "5"))
+
+
+# Django REST Framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+MOVIE_PAGE_SIZE = int(os.getenv("MOVIE_PAGE_SIZE", "20"))
+MOVIE_MAX_PAGE_SIZE = int(os.getenv("MOVIE_MAX_PAGE_SIZE", "100"))
+# Export du catalogue : nombre de films lus (et de relations préchargées) par lot
+MOVIE_EXPORT_CHUNK_SIZE = int(os.getenv("MOVIE_EXPORT_CHUNK_SIZE", "2000"))
+
+# Import de films depuis IMDb
+IMDB_FETCH_WORKERS = int(os.getenv("IMDB_FETCH_WORKERS", "8"))
+MOVIE_IMPORT_BATCH_SIZE = int(os.getenv("MOVIE_IMPORT_BATCH_SIZE", "50"))
+MOVIE_BULK_ADD_MAX_IDS = int(os.getenv("MOVIE_BULK_ADD_MAX_IDS", "500"))
+# Tâches d'import en arrière-plan : délai (en secondes) au-delà duquel une tâche en cours est
+# considérée comme abandonnée par son worker et remise en attente
+IMPORT_JOB_STALE_AFTER = int(os.getenv("IMPORT_JOB_STALE_AFTER", "600"))
+# Nombre maximum de tentatives d'une tâche abandonnée : au-delà, elle est marquée en échec
+IMPORT_JOB_MAX_ATTEMPTS = int(os.getenv("IMPORT_JOB_MAX_ATTEMPTS", "3"))
+# Nombre maximum d'appels IMDb simultanés par worker ASGI (endpoints asynchrones)
+IMDB_ASYNC_WORKERS = int(os.getenv("IMDB_ASYNC_WORKERS", "32"))
+
+# Source des données IMDb : "cinemagoer" (IMDb en ligne) ou "local" (jeu de données JSON/NDJSON,
+# par exemple un export du catalogue, avec latence et proportion d'erreurs simulées)
+IMDB_PROVIDER = {
+    "BACKEND": os.getenv("IMDB_PROVIDER", "cinemagoer"),
+    "DATASET": os.getenv("IMDB_LOCAL_DATASET", ""),
+    "LATENCY": float(os.getenv("IMDB_LOCAL_LATENCY", "0")),
+    "JITTER": float(os.getenv("IMDB_LOCAL_JITTER", "0")),
+    "ERROR_RATE": float(os.getenv("IMDB_LOCAL_ERROR_RATE", "0")),
+}
+
+# Nombre maximum de films retournés par une recherche IMDb
+IMDB_SEARCH_LIMIT = int(os.getenv("SEARCH_FILM_LIMIT", "10"))
+# Prépare la source des données IMDb au démarrage (imports, client) : à activer avec un serveur
+# pre-fork qui charge l'application avant de créer ses workers (gunicorn --preload), pour que
+# les workers en héritent au lieu de payer chacun ces imports à leur première requête
+IMDB_WARM_UP = os.getenv("IMDB_WARM_UP") == "True"
+
+# Cache des recherches IMDb : "memory" (propre à chaque processus) ou "django" (partagé entre
+# les workers via le cache Django désigné par ALIAS)
+IMDB_SEARCH_CACHE = {
+    "BACKEND": os.getenv("IMDB_SEARCH_CACHE_BACKEND", "memory"),
+    "ALIAS": os.getenv("IMDB_SEARCH_CACHE_ALIAS", "default"),
+    "TTL": int(os.getenv("IMDB_SEARCH_CACHE_TTL", "300")),
+    "MAX_SIZE": int(os.getenv("IMDB_SEARCH_CACHE_MAX_SIZE", "1024")),
+}
+
+# Cache persistant des détails de films IMDb (en secondes, 0 pour le désactiver)
+IMDB_DETAILS_CACHE_TTL = int(os.getenv("IMDB_DETAILS_CACHE_TTL", str(7 * 24 * 3600)))
+
+# Regroupement des appels IMDb identiques simultanés. DISTRIBUTED active en plus un verrou entre
+# processus, posé dans le cache Django CACHE_ALIAS (qui doit alors être partagé entre workers)
+IMDB_SINGLE_FLIGHT = {
+    "DISTRIBUTED": os.getenv("IMDB_SINGLE_FLIGHT_DISTRIBUTED") == "True",
+    "CACHE_ALIAS": os.getenv("IMDB_SINGLE_FLIGHT_CACHE_ALIAS", "default"),
+    "LOCK_TIMEOUT": 30,
+    "WAIT_TIMEOUT": 30,
+}
+
+# Protection des appels à IMDb : délai maximum par essai (en secondes), nouveaux essais avec
+# attente aléatoire bornée, et disjoncteur ouvert pendant BREAKER_RESET_TIMEOUT secondes après
+# BREAKER_THRESHOLD échecs consécutifs (les appels échouent alors immédiatement)
+IMDB_RESILIENCE = {
+    "TIMEOUT": float(os.getenv("IMDB_TIMEOUT", "10")),
+    "RETRIES": int(os.getenv("IMDB_RETRIES", "2")),
+    "BACKOFF_BASE": float(os.getenv("IMDB_BACKOFF_BASE", "0.2")),
+    "BACKOFF_MAX": float(os.getenv("IMDB_BACKOFF_MAX", "2")),
+    "BREAKER_THRESHOLD": int(os.getenv("IMDB_BREAKER_THRESHOLD", "5")),
+    "BREAKER_RESET_TIMEOUT": float(os.getenv("IMDB_BREAKER_RESET_TIMEOUT", "30")),
+    "WORKERS": int(os.getenv("IMDB_RESILIENCE_WORKERS", "16")),
+}
+
+REST_FRAMEWORK = {
+    "DEFAULT_PAGINATION_CLASS": "app.pagination.MoviePagination",
+    "PAGE_SIZE": MOVIE_PAGE_SIZE,
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", ""),
     }
 }
 
@@ -163,6 +305,16 @@ LOGGING = {
     },
 }
 
+# Mesure des requêtes HTTP (en-tête Server-Timing et journal) : seuil, en millisecondes, au-delà
+# duquel une requête est journalisée comme lente avec ses requêtes SQL les plus longues
+REQUEST_INSTRUMENTATION = os.getenv("REQUEST_INSTRUMENTATION", "True") == "True"
+REQUEST_SLOW_THRESHOLD_MS = int(os.getenv("REQUEST_SLOW_THRESHOLD_MS", "500"))
+
+# Métriques Prometheus (/metrics) : répertoire où chaque processus écrit ses valeurs pour qu'elles
+# soient additionnées entre workers (vide : valeurs du seul processus qui répond)
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "1.0"))
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
@@ -17,6 +17,8 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from app.views import metrics
+
 # urlpatterns = [
 #     # path('admin/', admin.site.urls),
 #     path("api/", include("app.urls"))
@@ -24,5 +26,6 @@ from django.urls import path, include
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api-auth/', include('rest_framework.urls')),
-    path("api/", include("app.urls"))
+    path("api/", include("app.urls")),
+    path("metrics", metrics, name="metrics"),
 ]